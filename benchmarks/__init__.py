@@ -0,0 +1,11 @@
+"""
+Offline benchmarks for the clients' own overhead.
+
+The recorded VCR cassettes in `tests/cassettes` are replayed through an
+`httpx.MockTransport`, so no network is involved: what is measured is the client
+stack (request building, body download and decompression, JSON decoding and model
+validation). Each list method is also run against synthetic payloads built by
+repeating the recorded items up to 10k-1M items.
+
+Run with `just bench` or `python -m benchmarks`; see `python -m benchmarks --help`.
+"""
@@ -0,0 +1,72 @@
+"""
+Command line entry point: `python -m benchmarks`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from .suite import CASES, RESULTS_DIR, SIZES, Result, compare, load, run_sync, save
+
+
+def _print_result(result: Result) -> None:
+    mode = "models" if result.validate else "records"
+    print(
+        f"{result.case:<40} {result.payload:>9} {mode:<7} "
+        f"{result.items:>9} items {result.requests_per_sec:>10.1f} req/s "
+        f"{result.parse_us_per_item:>8.2f} us/item {result.peak_memory_bytes / 2**20:>9.1f} MiB"
+    )
+
+
+def _latest_baseline(exclude: Path) -> Path | None:
+    candidates = sorted(
+        (path for path in RESULTS_DIR.glob("*.json") if path.resolve() != exclude.resolve()),
+        key=lambda path: path.stat().st_mtime,
+    )
+    return candidates[-1] if candidates else None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "-k", dest="match", default="", help="only run cases whose name contains this text"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="*",
+        default=list(SIZES),
+        help="synthetic payload sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="10k-item payloads only and shorter loops"
+    )
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per measurement loop")
+    parser.add_argument(
+        "--output", type=Path, help=f"results file (default: {RESULTS_DIR.name}/<version>.json, or dev-<UTC timestamp>.json from a checkout)"
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="results file to compare against (default: the latest other file)"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [10_000] if args.quick else args.sizes
+    min_time = min(args.min_time, 0.2) if args.quick else args.min_time
+    cases = [case for case in CASES if args.match in case.name]
+
+    results = run_sync(cases=cases, sizes=sizes, min_time=min_time, report=_print_result)
+    output = save(results, args.output)
+    print(f"\nWrote {output}")
+
+    baseline = args.compare or _latest_baseline(output)
+    if baseline is None:
+        return
+    print(f"\nCompared with {baseline}:")
+    for before, after, throughput, parse in compare(load(baseline), results):
+        mode = "models" if after.validate else "records"
+        print(f"{after.case:<40} {after.payload:>9} {mode:<7} req/s {throughput:+7.1%}  us/item {parse:+7.1%}")
+
+
+if __name__ == "__main__":
+    main()
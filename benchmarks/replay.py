@@ -0,0 +1,134 @@
+"""
+Cassette replay and synthetic payloads for the benchmarks.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import httpx
+import yaml
+
+CASSETTE_DIR = Path(__file__).resolve().parent.parent / "tests" / "cassettes"
+
+# Headers that describe the recorded body and no longer apply once it is replaced.
+_BODY_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+_ID_KEYS = ("@id", "_about")
+
+
+class Interaction(NamedTuple):
+    """A recorded request path and the raw response to replay for it."""
+
+    path: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+def load_cassette(name: str) -> list[Interaction]:
+    """
+    Loads a VCR cassette from `tests/cassettes`.
+
+    Args:
+        name (str): The cassette path relative to `tests/cassettes`, e.g. "hydrology/test_get_stations.yaml".
+
+    Returns:
+        list[Interaction]: The recorded interactions, in order.
+    """
+    with open(CASSETTE_DIR / name) as file:
+        data = yaml.safe_load(file)
+    interactions = []
+    for interaction in data["interactions"]:
+        response = interaction["response"]
+        body = response["body"]["string"]
+        if isinstance(body, str):
+            body = body.encode()
+        headers = [
+            (key, value)
+            for key, values in response["headers"].items()
+            if key.lower() != "transfer-encoding"
+            for value in values
+        ]
+        interactions.append(
+            Interaction(
+                path=httpx.URL(interaction["request"]["uri"]).path,
+                status_code=response["status"]["code"],
+                headers=headers,
+                body=body,
+            )
+        )
+    return interactions
+
+
+def items_path(document: dict[str, Any]) -> tuple[str, ...]:
+    """Returns the keys leading to the item list of a list envelope."""
+    if isinstance(document.get("items"), list):
+        return ("items",)
+    if isinstance(document.get("result"), dict) and isinstance(document["result"].get("items"), list):
+        return ("result", "items")
+    raise ValueError("response has no item list")
+
+
+def scale_payload(interaction: Interaction, size: int) -> Interaction:
+    """
+    Returns an uncompressed copy of a list response with exactly `size` items.
+
+    The recorded items are repeated in order; each copy gets a distinct `@id` (or
+    `_about`, in the linked-data APIs) so that results do not collapse if a caller
+    de-duplicates them.
+
+    Args:
+        interaction (Interaction): A recorded list response.
+        size (int): Number of items in the synthetic payload.
+
+    Returns:
+        Interaction: The synthetic response.
+    """
+    response = httpx.Response(
+        interaction.status_code, headers=interaction.headers, content=interaction.body
+    )
+    document = response.json()
+    path = items_path(document)
+    container = document
+    for key in path[:-1]:
+        container = container[key]
+    template = container[path[-1]]
+    if not template:
+        raise ValueError(f"{interaction.path} has no items to repeat")
+    items = []
+    for index in range(size):
+        item = dict(template[index % len(template)])
+        if index >= len(template):
+            for key in _ID_KEYS:
+                if key in item:
+                    item[key] = f"{item[key]}-{index}"
+                    break
+        items.append(item)
+    container[path[-1]] = items
+    headers = [
+        (key, value) for key, value in interaction.headers if key.lower() not in _BODY_HEADERS
+    ]
+    return interaction._replace(headers=headers, body=json.dumps(document).encode())
+
+
+def replay_transport(interactions: list[Interaction]) -> httpx.MockTransport:
+    """
+    Returns a transport answering each request with the recorded response for its path.
+
+    Requests whose path was not recorded get the last interaction. Bodies are streamed
+    so that download and decompression happen in the client, as they would over a network.
+    """
+    by_path = {interaction.path: interaction for interaction in interactions}
+    fallback = interactions[-1]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        interaction = by_path.get(request.url.path, fallback)
+        return httpx.Response(
+            interaction.status_code,
+            headers=interaction.headers,
+            stream=httpx.ByteStream(interaction.body),
+        )
+
+    return httpx.MockTransport(handler)
@@ -0,0 +1,302 @@
+"""
+Benchmark cases, measurement and result storage.
+
+Each case calls one list method against a replayed cassette ("recorded") or a
+synthetic payload of N items, with and without validation, and reports:
+
+- `requests_per_sec`: complete calls per second, from request building to parsed result;
+- `parse_us_per_item`: JSON decode plus validation time per item, from the clients'
+  instrumentation (`environment.instrumentation.RequestMetrics`);
+- `peak_memory_bytes`: peak traced allocation of a single call (`tracemalloc`).
+
+Results are written to `benchmarks/results/<version>.json`, one file per package
+version, so a later run can be compared against an earlier release. Runs from an
+uninstalled checkout are written to `dev-<UTC timestamp>.json` instead, so each one
+can be compared against the previous run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import importlib.metadata
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+
+import httpx
+
+from environment.asset_management import AssetManagementClient
+from environment.bathing_waters import BathingWatersClient
+from environment.flood_monitoring import FloodClient
+from environment.hydrology import HydrologyClient
+from environment.instrumentation import Instrument, RequestMetrics
+from environment.rainfall import RainfallClient
+from environment.tide_gauge import TideGaugeClient
+
+from .replay import Interaction, load_cassette, replay_transport, scale_payload
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+SIZES = (10_000, 100_000, 1_000_000)
+
+_HYDROLOGY_MEASURE = "052d0819-2a32-47df-9b99-c243c9c8235b-flow-m-86400-m3s-qualified"
+
+
+class Case(NamedTuple):
+    """One list method and the cassette that feeds it."""
+
+    name: str
+    client: Callable[..., httpx.AsyncClient]
+    method: str
+    cassette: str
+    kwargs: dict[str, Any] = {}
+    # Large items (stations with nested metadata) are capped to keep memory reasonable.
+    max_items: int = 1_000_000
+
+
+CASES = (
+    Case("flood.get_stations", FloodClient, "get_stations", "test_get_stations.yaml", max_items=100_000),
+    Case("flood.get_measures", FloodClient, "get_measures", "test_get_measures.yaml"),
+    Case("flood.get_readings", FloodClient, "get_readings", "test_get_readings.yaml"),
+    Case("flood.get_flood_warnings", FloodClient, "get_flood_warnings", "test_get_flood_warnings.yaml", max_items=100_000),
+    Case("flood.get_flood_areas", FloodClient, "get_flood_areas", "test_get_flood_areas.yaml", max_items=100_000),
+    Case("hydrology.get_stations", HydrologyClient, "get_stations", "hydrology/test_get_stations.yaml", max_items=100_000),
+    Case("hydrology.get_measures", HydrologyClient, "get_measures", "hydrology/test_get_measures.yaml"),
+    Case(
+        "hydrology.get_readings",
+        HydrologyClient,
+        "get_readings",
+        "hydrology/test_get_readings.yaml",
+        {"measure_id": _HYDROLOGY_MEASURE},
+    ),
+    Case("rainfall.get_stations", RainfallClient, "get_stations", "rainfall/test_get_stations.yaml", max_items=100_000),
+    Case("rainfall.get_measures", RainfallClient, "get_measures", "rainfall/test_get_measures.yaml"),
+    Case("rainfall.get_readings", RainfallClient, "get_readings", "rainfall/test_get_readings.yaml"),
+    Case(
+        "tide_gauge.get_tide_gauge_stations",
+        TideGaugeClient,
+        "get_tide_gauge_stations",
+        "tide_gauge/test_get_tide_gauge_stations.yaml",
+        max_items=100_000,
+    ),
+    Case(
+        "tide_gauge.get_tide_gauge_readings",
+        TideGaugeClient,
+        "get_tide_gauge_readings",
+        "tide_gauge/test_get_tide_gauge_readings.yaml",
+    ),
+    Case("asset_management.get_assets", AssetManagementClient, "get_assets", "test_get_assets.yaml", max_items=10_000),
+    Case("bathing_waters.get_bathing_waters", BathingWatersClient, "get_bathing_waters", "test_get_bathing_waters.yaml", max_items=10_000),
+)
+
+
+class Result(NamedTuple):
+    """The measurements for one case, payload and validation mode."""
+
+    case: str
+    payload: str
+    validate: bool
+    items: int
+    body_bytes: int
+    requests_per_sec: float
+    parse_us_per_item: float
+    peak_memory_bytes: int
+
+
+class _ParseTimes(Instrument):
+    def __init__(self):
+        self.samples: list[RequestMetrics] = []
+
+    def on_parsed(self, metrics: RequestMetrics) -> None:
+        self.samples.append(metrics)
+
+
+async def measure(
+    case: Case,
+    interactions: list[Interaction],
+    payload: str,
+    validate: bool,
+    min_time: float = 1.0,
+    min_rounds: int = 3,
+) -> Result:
+    """
+    Benchmarks one case against the given responses.
+
+    Args:
+        case (Case): The list method to call.
+        interactions (list[Interaction]): The responses to replay.
+        payload (str): Label of the payload, e.g. "recorded" or "10000".
+        validate (bool): Whether the list method validates into models.
+        min_time (float, optional): Minimum seconds spent on the throughput loop. Defaults to 1.0.
+        min_rounds (int, optional): Minimum number of calls in the throughput loop. Defaults to 3.
+
+    Returns:
+        Result: The measurements.
+    """
+    parse_times = _ParseTimes()
+    async with case.client(transport=replay_transport(interactions), instrument=parse_times) as client:
+        call = getattr(client, case.method)
+
+        # Warm up caches such as pydantic's lazily built validators before timing.
+        result = await call(validate=validate, **case.kwargs)
+        items = len(result)
+        del result
+        parse_times.samples.clear()
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = await call(validate=validate, **case.kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+        parse_times.samples.clear()
+
+        rounds = 0
+        started = time.perf_counter()
+        while rounds < min_rounds or time.perf_counter() - started < min_time:
+            await call(validate=validate, **case.kwargs)
+            rounds += 1
+        elapsed = time.perf_counter() - started
+
+    parse_per_item = statistics.median(
+        (metrics.decode + metrics.validate) / max(1, metrics.items or 0)
+        for metrics in parse_times.samples
+    )
+    return Result(
+        case=case.name,
+        payload=payload,
+        validate=validate,
+        items=items,
+        body_bytes=max(len(interaction.body) for interaction in interactions),
+        requests_per_sec=rounds / elapsed,
+        parse_us_per_item=parse_per_item * 1e6,
+        peak_memory_bytes=peak,
+    )
+
+
+def _scaled(interactions: list[Interaction], size: int) -> list[Interaction]:
+    return [scale_payload(interaction, size) for interaction in interactions]
+
+
+async def run(
+    cases: Iterable[Case] = CASES,
+    sizes: Iterable[int] = SIZES,
+    min_time: float = 1.0,
+    report: Callable[[Result], Any] | None = None,
+) -> list[Result]:
+    """
+    Runs every case against its recorded payload and each synthetic size.
+
+    Args:
+        cases (Iterable[Case], optional): The cases to run. Defaults to `CASES`.
+        sizes (Iterable[int], optional): Synthetic payload sizes. Sizes above a case's
+            `max_items` are skipped. Defaults to `SIZES`.
+        min_time (float, optional): Minimum seconds per measurement loop. Defaults to 1.0.
+        report (Callable[[Result], Any], optional): Called with each result as it completes.
+
+    Returns:
+        list[Result]: All results.
+    """
+    sizes = sorted(sizes)
+    results = []
+    for case in cases:
+        recorded = load_cassette(case.cassette)
+        payloads = [("recorded", recorded)]
+        payloads += [(str(size), None) for size in sizes if size <= case.max_items]
+        for label, interactions in payloads:
+            if interactions is None:
+                interactions = _scaled(recorded, int(label))
+            for validate in (True, False):
+                result = await measure(case, interactions, label, validate, min_time=min_time)
+                results.append(result)
+                if report is not None:
+                    report(result)
+            del interactions
+    return results
+
+
+def package_version() -> str:
+    """Returns the installed environment-client version, or "dev" when not installed."""
+    try:
+        return importlib.metadata.version("environment-client")
+    except importlib.metadata.PackageNotFoundError:
+        return "dev"
+
+
+def results_name() -> str:
+    """Returns the default results file stem: the package version, or `dev-<UTC timestamp>` from a checkout."""
+    version = package_version()
+    if version == "dev":
+        return time.strftime("dev-%Y%m%dT%H%M%SZ", time.gmtime())
+    return version
+
+
+def save(results: list[Result], path: Path | None = None) -> Path:
+    """
+    Writes results, with the version and platform they were measured on, as JSON.
+
+    Args:
+        results (list[Result]): The results to store.
+        path (Path, optional): Output file. Defaults to `benchmarks/results/<results_name()>.json`.
+
+    Returns:
+        Path: The file written.
+    """
+    if path is None:
+        path = RESULTS_DIR / f"{results_name()}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "httpx": httpx.__version__,
+        "pydantic": importlib.metadata.version("pydantic"),
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": [result._asdict() for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+    return path
+
+
+def load(path: Path) -> list[Result]:
+    """Reads results written by `save`."""
+    document = json.loads(path.read_text())
+    return [Result(**result) for result in document["results"]]
+
+
+def compare(baseline: list[Result], current: list[Result]) -> list[tuple[Result, Result, float, float]]:
+    """
+    Pairs up results measured under the same case, payload and validation mode.
+
+    Returns:
+        list[tuple]: `(baseline, current, throughput_change, parse_change)`, where the changes
+        are relative (0.1 means 10% higher than the baseline).
+    """
+    previous = {(result.case, result.payload, result.validate): result for result in baseline}
+    pairs = []
+    for result in current:
+        before = previous.get((result.case, result.payload, result.validate))
+        if before is None:
+            continue
+        pairs.append(
+            (
+                before,
+                result,
+                result.requests_per_sec / before.requests_per_sec - 1,
+                result.parse_us_per_item / before.parse_us_per_item - 1
+                if before.parse_us_per_item
+                else 0.0,
+            )
+        )
+    return pairs
+
+
+def run_sync(**kwargs: Any) -> list[Result]:
+    """Runs `run` in a new event loop."""
+    return asyncio.run(run(**kwargs))
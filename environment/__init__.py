@@ -1,8 +1,25 @@
-from .flood_monitoring import FloodClient
-from .bathing_waters import BathingWatersClient
-from .asset_management import AssetManagementClient
-from .catchment_data import CatchmentDataClient
-from .public_register import PublicRegisterClient
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .flood_monitoring import FloodClient
+    from .bathing_waters import BathingWatersClient
+    from .asset_management import AssetManagementClient
+    from .catchment_data import CatchmentDataClient
+    from .public_register import PublicRegisterClient
+    from .session import EnvironmentSession
+    from .cache import CacheTransport, MemoryCache, SQLiteCache
+    from .coalesce import SingleFlight
+    from .ratelimit import RateLimiter, RateLimitTransport
+    from .retry import HedgePolicy, RetryPolicy, RetryTransport
+    from .instrumentation import (
+        Instrument,
+        LoggingInstrument,
+        OpenTelemetryInstrument,
+        PrometheusInstrument,
+        RequestMetrics,
+    )
 
 __all__ = [
     "FloodClient",
@@ -10,4 +27,45 @@ __all__ = [
     "AssetManagementClient",
     "CatchmentDataClient",
     "PublicRegisterClient",
+    "EnvironmentSession",
+    "CacheTransport",
+    "MemoryCache",
+    "SQLiteCache",
+    "SingleFlight",
+    "RateLimiter",
+    "RateLimitTransport",
+    "RetryPolicy",
+    "HedgePolicy",
+    "RetryTransport",
+    "Instrument",
+    "LoggingInstrument",
+    "PrometheusInstrument",
+    "OpenTelemetryInstrument",
+    "RequestMetrics",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "FloodClient": ".flood_monitoring",
+        "BathingWatersClient": ".bathing_waters",
+        "AssetManagementClient": ".asset_management",
+        "CatchmentDataClient": ".catchment_data",
+        "PublicRegisterClient": ".public_register",
+        "EnvironmentSession": ".session",
+        "CacheTransport": ".cache",
+        "MemoryCache": ".cache",
+        "SQLiteCache": ".cache",
+        "SingleFlight": ".coalesce",
+        "RateLimiter": ".ratelimit",
+        "RateLimitTransport": ".ratelimit",
+        "RetryPolicy": ".retry",
+        "HedgePolicy": ".retry",
+        "RetryTransport": ".retry",
+        "Instrument": ".instrumentation",
+        "LoggingInstrument": ".instrumentation",
+        "PrometheusInstrument": ".instrumentation",
+        "OpenTelemetryInstrument": ".instrumentation",
+        "RequestMetrics": ".instrumentation",
+    },
+)
@@ -0,0 +1,55 @@
+"""
+Bounded-concurrency fan-out helpers shared by the clients.
+
+Bulk methods issue one request per key over the client's connection pool, with
+an `asyncio.Semaphore` capping how many are in flight at once. A failure for
+one key is captured and returned in place of its result rather than cancelling
+the rest of the batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+async def gather_keyed(
+    keys: Iterable[K],
+    fetch: Callable[[K], Awaitable[T]],
+    max_concurrency: int = 8,
+) -> dict[K, T | Exception]:
+    """
+    Runs ``fetch(key)`` for each distinct key with at most ``max_concurrency`` in flight.
+
+    Args:
+        keys: Keys to fetch. Duplicates are fetched once.
+        fetch: Coroutine function fetching the result for a single key.
+        max_concurrency (int, optional): Maximum number of concurrent fetches. Defaults to 8.
+
+    Returns:
+        dict: Results keyed by input key, in first-seen order. A key whose fetch
+        raised maps to the exception instead of a result.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    unique = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(key: K) -> T | Exception:
+        async with semaphore:
+            try:
+                return await fetch(key)
+            except Exception as exc:  # isolate per-key failures
+                return exc
+
+    results = await asyncio.gather(*(run(key) for key in unique))
+    return dict(zip(unique, results))
+
+
+def measure_notation(measure_id: str) -> str:
+    """Returns the trailing notation of a measure URI, or the value unchanged if it is already one."""
+    return measure_id.rstrip("/").rsplit("/", 1)[-1]
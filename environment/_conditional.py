@@ -0,0 +1,74 @@
+"""
+Conditional `GET` support for polling endpoints.
+
+When a response carries an `ETag` or `Last-Modified` header, the client keeps those
+validators together with the already-parsed result. The next request for the same URL
+sends `If-None-Match`/`If-Modified-Since`; a `304 Not Modified` answer is then served
+from the stored result without downloading or validating the body again.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import httpx
+
+
+def validator_headers(response: httpx.Response) -> dict[str, str]:
+    """Returns the conditional request headers matching a response's validators."""
+    headers = {}
+    etag = response.headers.get("etag")
+    if etag:
+        headers["If-None-Match"] = etag
+    last_modified = response.headers.get("last-modified")
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+class ConditionalCache:
+    """
+    Validators and parsed results of the latest response per request, in LRU order.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initializes the store.
+
+        Args:
+            max_entries (int, optional): Maximum number of requests remembered. Defaults to 256.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[dict[str, str], Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def request_headers(self, key: Hashable) -> dict[str, str]:
+        """Returns the `If-None-Match`/`If-Modified-Since` headers to send for `key`, if any."""
+        entry = self._entries.get(key)
+        return dict(entry[0]) if entry is not None else {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """Returns the stored result for `key`, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def store(self, key: Hashable, response: httpx.Response, value: Any) -> None:
+        """Remembers `value` for `key` if the response carries validators; otherwise forgets `key`."""
+        headers = validator_headers(response)
+        if not headers:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (headers, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forgets every stored response."""
+        self._entries.clear()
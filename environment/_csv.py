@@ -0,0 +1,63 @@
+"""
+Incremental CSV parsing over streamed response bodies.
+
+Rows are parsed as soon as a complete record has arrived, so a multi-megabyte
+CSV download is never held in memory as a whole.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+from typing import AsyncIterator
+
+
+async def aiter_csv_rows(
+    chunks: AsyncIterator[bytes], encoding: str = "utf-8-sig"
+) -> AsyncIterator[list[str]]:
+    """
+    Parses CSV rows from an async iterator of byte chunks (e.g. `response.aiter_bytes()`).
+
+    Quoted fields containing newlines are supported: a record is only handed to the
+    CSV parser once its quotes are balanced.
+
+    Args:
+        chunks: Async iterator of raw bytes.
+        encoding (str, optional): Text encoding of the body. Defaults to "utf-8-sig",
+            which also strips a leading byte-order mark.
+
+    Yields:
+        list[str]: Each CSV row, including the header row.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    record: list[str] = []
+    quotes = 0
+
+    def complete(lines: list[str]) -> list[str]:
+        nonlocal quotes
+        records = []
+        for line in lines:
+            record.append(line)
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                records.append("".join(record))
+                record.clear()
+                quotes = 0
+        return records
+
+    async for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        # The last line may be cut mid-way; keep it until more data (or EOF) arrives.
+        pending = lines.pop()
+        for row in csv.reader(complete([line + "\n" for line in lines])):
+            if row:
+                yield row
+
+    tail = pending + decoder.decode(b"", final=True)
+    records = complete([tail]) if tail else []
+    if record:
+        records.append("".join(record))
+    for row in csv.reader(records):
+        if row:
+            yield row
@@ -0,0 +1,44 @@
+"""
+Lazy package exports.
+
+Package `__init__` modules declare their public names and the submodule each one
+lives in; the submodule is only imported the first time one of its names is
+accessed. This keeps `import environment` cheap for short-lived processes that only
+ever touch one client.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Builds module-level `__getattr__` and `__dir__` functions for a package.
+
+    Args:
+        package (str): The package's `__name__`.
+        exports (dict[str, str]): Public names mapped to the relative submodule defining them
+            (e.g. `{"FloodClient": ".client"}`).
+
+    Returns:
+        tuple: The `__getattr__` and `__dir__` functions to assign in the package namespace.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups bypass __getattr__.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
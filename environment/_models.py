@@ -0,0 +1,16 @@
+"""
+Base class for the API response models.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class EnvironmentModel(BaseModel):
+    """
+    A pydantic model whose validation schema is built on first use instead of at import.
+
+    Importing a client module no longer pays for building every response schema up
+    front; each model is compiled the first time it validates data.
+    """
+
+    model_config = ConfigDict(defer_build=True)
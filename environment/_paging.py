@@ -0,0 +1,62 @@
+"""
+Offset-based paging helpers shared by the clients.
+
+The environment.data.gov.uk APIs page list endpoints with ``_limit`` and
+``_offset`` query parameters. These helpers walk those pages and can fetch the
+next page in the background while the caller works through the current one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[int, int], Awaitable[list[T]]]
+
+
+async def iter_offset_pages(
+    fetch_page: PageFetcher[T],
+    page_size: int,
+    offset: int = 0,
+    prefetch: bool = True,
+) -> AsyncIterator[list[T]]:
+    """
+    Yields successive pages from ``fetch_page(limit, offset)``.
+
+    Iteration stops at the first page holding fewer than ``page_size`` items.
+
+    Args:
+        fetch_page: Coroutine function returning the items for one page.
+        page_size: Number of items requested per page.
+        offset: Offset of the first page. Defaults to 0.
+        prefetch (bool, optional): If True, requests the next page while the
+            current one is being consumed. Defaults to True.
+
+    Yields:
+        list: The items of each page, in order.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    pending: asyncio.Task[list[T]] | None = asyncio.ensure_future(
+        fetch_page(page_size, offset)
+    )
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            offset += page_size
+            full = len(page) >= page_size
+            if full and prefetch:
+                pending = asyncio.ensure_future(fetch_page(page_size, offset))
+            if page:
+                yield page
+            if not full:
+                return
+            if pending is None:
+                pending = asyncio.ensure_future(fetch_page(page_size, offset))
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
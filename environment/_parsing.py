@@ -0,0 +1,171 @@
+"""
+Bulk response validation shared by the clients.
+
+List endpoints return an envelope such as `{"meta": ..., "items": [...]}`. Instead of
+decoding the body into Python dicts and then building one model per item with
+`Model(**item)`, the helpers here validate the raw response bytes against a cached
+`TypeAdapter` for the whole envelope, so JSON parsing and validation happen in a
+single pass inside pydantic-core.
+
+With `validate=False` the helpers skip pydantic entirely and return plain dicts keyed
+by model field name (e.g. `date_time` rather than `dateTime`). Every model field is
+present, with its default when the API omitted it. Values are passed through as
+decoded, and nested objects stay as dicts.
+
+On an instrumented client the helpers also record decode/validation time and the
+item count on the request's `RequestMetrics` (see `environment.instrumentation`).
+"""
+
+from __future__ import annotations
+
+import time
+from functools import lru_cache
+from typing import Any, Iterable, TypedDict, TypeVar
+
+import httpx
+from pydantic import BaseModel, TypeAdapter
+
+from .instrumentation import report_parsed, request_metrics
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def envelope_adapter(model: type[BaseModel], path: tuple[str, ...]) -> TypeAdapter:
+    """Returns a cached adapter for `{path[0]: {path[1]: ... [model, ...]}}`; other keys are ignored."""
+    annotation: Any = list[model]
+    for key in reversed(path):
+        annotation = TypedDict(f"{model.__name__}Envelope", {key: annotation})
+    return TypeAdapter(annotation)
+
+
+@lru_cache(maxsize=None)
+def record_fields(model: type[BaseModel]) -> tuple[tuple[str, str, Any, Any], ...]:
+    """Returns `(name, alias, default, default_factory)` for each field of `model`."""
+    fields = []
+    for name, field in model.model_fields.items():
+        default = None if field.is_required() else field.default
+        fields.append((name, field.alias or name, default, field.default_factory))
+    return tuple(fields)
+
+
+def to_records(items: Iterable[dict[str, Any]], model: type[BaseModel]) -> list[dict[str, Any]]:
+    """
+    Reshapes raw items into plain dicts keyed by `model`'s field names, without validation.
+
+    Args:
+        items (Iterable[dict]): Item dictionaries keyed by API field names.
+        model (type[BaseModel]): The model whose fields define the record shape.
+
+    Returns:
+        list[dict]: One record per item.
+    """
+    fields = record_fields(model)
+    records = []
+    for item in items:
+        record = {}
+        for name, alias, default, factory in fields:
+            if alias in item:
+                record[name] = item[alias]
+            else:
+                record[name] = factory() if factory is not None else default
+        records.append(record)
+    return records
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Returns a cached adapter for `list[model]`."""
+    return TypeAdapter(list[model])
+
+
+def parse_items(
+    response: httpx.Response,
+    model: type[M],
+    path: tuple[str, ...] = ("items",),
+    validate: bool = True,
+) -> list[M] | list[dict[str, Any]]:
+    """
+    Validates a list envelope straight from the raw response bytes.
+
+    Args:
+        response (httpx.Response): A response whose body has been read.
+        model (type[BaseModel]): The item model.
+        path (tuple[str, ...], optional): Keys leading to the item list. Defaults to ("items",).
+        validate (bool, optional): If False, returns unvalidated records. Defaults to True.
+
+    Returns:
+        list: The validated items, or plain dict records if `validate` is False.
+    """
+    started = time.perf_counter()
+    if not validate:
+        data = response.json()
+        for key in path:
+            data = data[key]
+        decoded = time.perf_counter()
+        records = to_records(data, model)
+        _record(response, decoded - started, time.perf_counter() - decoded, len(records))
+        return records
+    data = envelope_adapter(model, path).validate_json(response.content)
+    for key in path:
+        data = data[key]
+    # Decoding and validation happen in one pass, so the combined time counts as validation.
+    _record(response, 0.0, time.perf_counter() - started, len(data))
+    return data
+
+
+def decode_items(response: httpx.Response, path: tuple[str, ...] = ("items",)) -> Any:
+    """
+    Decodes a response body and returns the value at `path`, recording the decode time.
+
+    Args:
+        response (httpx.Response): A response whose body has been read.
+        path (tuple[str, ...], optional): Keys leading to the value. Defaults to ("items",).
+
+    Returns:
+        The decoded value.
+    """
+    started = time.perf_counter()
+    data = response.json()
+    for key in path:
+        data = data[key]
+    metrics = request_metrics(response)
+    if metrics is not None:
+        metrics.record_parse(decode=time.perf_counter() - started)
+    return data
+
+
+def validate_items(
+    items: Iterable[dict[str, Any]],
+    model: type[M],
+    validate: bool = True,
+    response: httpx.Response | None = None,
+) -> list[M] | list[dict[str, Any]]:
+    """
+    Validates already-decoded items (e.g. after client-side normalisation) in one call.
+
+    Args:
+        items (Iterable[dict]): Item dictionaries keyed by API field names.
+        model (type[BaseModel]): The item model.
+        validate (bool, optional): If False, returns unvalidated records. Defaults to True.
+        response (httpx.Response, optional): The response the items came from, whose metrics
+            receive the validation time.
+
+    Returns:
+        list: The validated items, or plain dict records if `validate` is False.
+    """
+    started = time.perf_counter()
+    if not validate:
+        result = to_records(items, model)
+    else:
+        result = list_adapter(model).validate_python(list(items))
+    if response is not None:
+        _record(response, 0.0, time.perf_counter() - started, len(result))
+    return result
+
+
+def _record(response: httpx.Response, decode: float, validate: float, items: int) -> None:
+    metrics = request_metrics(response)
+    if metrics is not None:
+        metrics.record_parse(decode, validate, items)
+        report_parsed(response)
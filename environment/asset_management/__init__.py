@@ -1,4 +1,20 @@
-from .client import AssetManagementClient
-from .models import Asset
+from typing import TYPE_CHECKING
 
-__all__ = ["AssetManagementClient", "Asset"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import AssetManagementClient
+    from .models import Asset
+
+__all__ = [
+    "AssetManagementClient",
+    "Asset",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AssetManagementClient": ".client",
+        "Asset": ".models",
+    },
+)
@@ -3,6 +3,8 @@ An async client for the UK Environment Agency's Asset Management API.
 """
 
 import httpx
+from .._parsing import parse_items
+from ..instrumentation import install
 from .models import (
     Asset,
     MaintenanceActivity,
@@ -12,49 +14,69 @@ from .models import (
 )
 
 
-async def log_request(request):
-    print(f">>> Request: {request.method} {request.url}")
-
-
-async def log_response(response):
-    # Avoid pre-reading body so VCR can capture content
-    print(f"<<< Response: {response.status_code}")
-
-
 class AssetManagementClient(httpx.AsyncClient):
     """
     An async client for the UK Environment Agency's Asset Management API.
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        validate=True,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
-        """
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            validate (bool, optional): If False, list methods return plain dicts keyed by field
+                name instead of pydantic models. Can be overridden per call. Defaults to True.
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
+        """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk/asset-management")
         super().__init__(
-            base_url="https://environment.data.gov.uk/asset-management",
             timeout=timeout,
             follow_redirects=True,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(log_request)
-            self.event_hooks["response"].append(log_response)
+        self.validate = validate
+        install(self, instrument, verbose)
 
-    async def get_assets(self, **params) -> list[Asset]:
+    async def get_assets(
+        self, validate: bool | None = None, **params
+    ) -> list[Asset] | list[dict]:
         """
         Returns a list of assets.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Asset]: A list of assets.
         """
         response = await self.get("/id/asset.json", params=params)
         response.raise_for_status()
-        return [Asset(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Asset,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_asset_by_id(self, asset_id: str) -> Asset:
         """
@@ -70,16 +92,27 @@ class AssetManagementClient(httpx.AsyncClient):
         response.raise_for_status()
         return Asset(**response.json()["items"][0])
 
-    async def get_maintenance_activities(self, **params) -> list[MaintenanceActivity]:
+    async def get_maintenance_activities(
+        self, validate: bool | None = None, **params
+    ) -> list[MaintenanceActivity] | list[dict]:
         """
         Returns a list of maintenance activities.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[MaintenanceActivity]: A list of maintenance activities.
         """
         response = await self.get("/id/maintenance-activity.json", params=params)
         response.raise_for_status()
-        return [MaintenanceActivity(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            MaintenanceActivity,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_maintenance_activity_by_id(
         self, activity_id: str
@@ -97,16 +130,27 @@ class AssetManagementClient(httpx.AsyncClient):
         response.raise_for_status()
         return MaintenanceActivity(**response.json()["items"][0])
 
-    async def get_maintenance_tasks(self, **params) -> list[MaintenanceTask]:
+    async def get_maintenance_tasks(
+        self, validate: bool | None = None, **params
+    ) -> list[MaintenanceTask] | list[dict]:
         """
         Returns a list of maintenance tasks.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[MaintenanceTask]: A list of maintenance tasks.
         """
         response = await self.get("/id/maintenance-task.json", params=params)
         response.raise_for_status()
-        return [MaintenanceTask(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            MaintenanceTask,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_maintenance_task_by_id(self, task_id: str) -> MaintenanceTask:
         """
@@ -122,16 +166,27 @@ class AssetManagementClient(httpx.AsyncClient):
         response.raise_for_status()
         return MaintenanceTask(**response.json()["items"][0])
 
-    async def get_maintenance_plans(self, **params) -> list[MaintenancePlan]:
+    async def get_maintenance_plans(
+        self, validate: bool | None = None, **params
+    ) -> list[MaintenancePlan] | list[dict]:
         """
         Returns a list of maintenance plans.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[MaintenancePlan]: A list of maintenance plans.
         """
         response = await self.get("/id/maintenance-plan.json", params=params)
         response.raise_for_status()
-        return [MaintenancePlan(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            MaintenancePlan,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_maintenance_plan_by_id(self, plan_id: str) -> MaintenancePlan:
         """
@@ -147,16 +202,27 @@ class AssetManagementClient(httpx.AsyncClient):
         response.raise_for_status()
         return MaintenancePlan(**response.json()["items"][0])
 
-    async def get_capital_schemes(self, **params) -> list[CapitalScheme]:
+    async def get_capital_schemes(
+        self, validate: bool | None = None, **params
+    ) -> list[CapitalScheme] | list[dict]:
         """
         Returns a list of capital schemes.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[CapitalScheme]: A list of capital schemes.
         """
         response = await self.get("/id/capital-scheme.json", params=params)
         response.raise_for_status()
-        return [CapitalScheme(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            CapitalScheme,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_capital_scheme_by_id(self, scheme_id: str) -> CapitalScheme:
         """
@@ -1,59 +1,61 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import List, Optional, Union
 
+from .._models import EnvironmentModel
 
-class PrefLabel(BaseModel):
+
+class PrefLabel(EnvironmentModel):
     id: str = Field(..., alias="@id")
     prefLabel: Optional[Union[str, List[str]]] = Field(None, alias="prefLabel")
 
 
-class Area(BaseModel):
+class Area(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: str
 
 
-class AssetSubType(BaseModel):
+class AssetSubType(EnvironmentModel):
     id: str = Field(..., alias="@id")
     prefLabel: str
 
 
-class AssetType(BaseModel):
+class AssetType(EnvironmentModel):
     id: str = Field(..., alias="@id")
     prefLabel: str
 
 
-class ActivitySubType(BaseModel):
+class ActivitySubType(EnvironmentModel):
     id: str = Field(..., alias="@id")
     prefLabel: Optional[Union[str, List[str]]] = None
 
 
-class ActivityType(BaseModel):
+class ActivityType(EnvironmentModel):
     id: str = Field(..., alias="@id")
     prefLabel: Optional[Union[str, List[str]]] = None
 
 
-class MaintenanceTask(BaseModel):
+class MaintenanceTask(EnvironmentModel):
     id: str = Field(..., alias="@id")
     activitySubType: Optional[ActivitySubType] = None
     activityType: Optional[ActivityType] = None
 
 
-class PrimaryPurpose(BaseModel):
+class PrimaryPurpose(EnvironmentModel):
     id: str = Field(..., alias="@id")
     prefLabel: str
 
 
-class ProtectionType(BaseModel):
+class ProtectionType(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: str
 
 
-class TargetCondition(BaseModel):
+class TargetCondition(EnvironmentModel):
     id: str = Field(..., alias="@id")
     prefLabel: Optional[str] = None
 
 
-class Asset(BaseModel):
+class Asset(EnvironmentModel):
     id: str = Field(..., alias="@id")
     actualCondition: Optional[Union[PrefLabel, List[PrefLabel]]] = None
     area: Union[List[Area], Area]
@@ -80,7 +82,7 @@ class Asset(BaseModel):
     location: Optional[dict] = None
 
 
-class MaintenanceActivity(BaseModel):
+class MaintenanceActivity(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     description: Optional[str] = None
@@ -89,7 +91,7 @@ class MaintenanceActivity(BaseModel):
     endDate: Optional[str] = None
 
 
-class MaintenancePlan(BaseModel):
+class MaintenancePlan(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     description: Optional[str] = None
@@ -98,7 +100,7 @@ class MaintenancePlan(BaseModel):
     endDate: Optional[str] = None
 
 
-class CapitalScheme(BaseModel):
+class CapitalScheme(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     description: Optional[str] = None
@@ -1,4 +1,20 @@
-from .client import BathingWatersClient
-from .models import BathingWater
+from typing import TYPE_CHECKING
 
-__all__ = ["BathingWatersClient", "BathingWater"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import BathingWatersClient
+    from .models import BathingWater
+
+__all__ = [
+    "BathingWatersClient",
+    "BathingWater",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BathingWatersClient": ".client",
+        "BathingWater": ".models",
+    },
+)
@@ -5,6 +5,8 @@ This client provides access to information about bathing waters in England.
 """
 
 import httpx
+from .._parsing import parse_items
+from ..instrumentation import install
 from .models import (
     BathingWater,
     SamplingPoint,
@@ -14,49 +16,70 @@ from .models import (
 )
 
 
-async def log_request(request):
-    print(f">>> Request: {request.method} {request.url}")
-
-
-async def log_response(response):
-    # Avoid pre-reading body so VCR can capture content
-    print(f"<<< Response: {response.status_code}")
-
-
 class BathingWatersClient(httpx.AsyncClient):
     """
     An async client for the UK Environment Agency's Bathing Water Quality API.
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        validate=True,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
-        """
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            validate (bool, optional): If False, list methods return plain dicts keyed by field
+                name instead of pydantic models. Can be overridden per call. Defaults to True.
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
+        """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk")
         super().__init__(
-            base_url="https://environment.data.gov.uk",
             timeout=timeout,
             follow_redirects=True,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(log_request)
-            self.event_hooks["response"].append(log_response)
+        self.validate = validate
+        install(self, instrument, verbose)
 
-    async def get_bathing_waters(self, **params) -> list[BathingWater]:
+    async def get_bathing_waters(
+        self, validate: bool | None = None, **params
+    ) -> list[BathingWater] | list[dict]:
         """
         Returns a list of bathing waters.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[BathingWater]: A list of bathing waters.
         """
         response = await self.get("/doc/bathing-water.json", params=params)
         response.raise_for_status()
-        return [BathingWater(**item) for item in response.json()["result"]["items"]]
+        return parse_items(
+            response,
+            BathingWater,
+            path=("result", "items"),
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_bathing_water_by_id(self, bathing_water_id: str) -> BathingWater:
         """
@@ -72,16 +95,27 @@ class BathingWatersClient(httpx.AsyncClient):
         response.raise_for_status()
         return BathingWater(**response.json()["items"][0])
 
-    async def get_sampling_points(self, **params) -> list[SamplingPoint]:
+    async def get_sampling_points(
+        self, validate: bool | None = None, **params
+    ) -> list[SamplingPoint] | list[dict]:
         """
         Returns a list of sampling points.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[SamplingPoint]: A list of sampling points.
         """
         response = await self.get("/id/sampling-point", params=params)
         response.raise_for_status()
-        return [SamplingPoint(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            SamplingPoint,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_sampling_point_by_id(self, sampling_point_id: str) -> SamplingPoint:
         """
@@ -97,16 +131,27 @@ class BathingWatersClient(httpx.AsyncClient):
         response.raise_for_status()
         return SamplingPoint(**response.json()["items"][0])
 
-    async def get_sample_assessments(self, **params) -> list[SampleAssessment]:
+    async def get_sample_assessments(
+        self, validate: bool | None = None, **params
+    ) -> list[SampleAssessment] | list[dict]:
         """
         Returns a list of sample assessments.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[SampleAssessment]: A list of sample assessments.
         """
         response = await self.get("/id/sample-assessment", params=params)
         response.raise_for_status()
-        return [SampleAssessment(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            SampleAssessment,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_sample_assessment_by_id(
         self, sample_assessment_id: str
@@ -124,16 +169,27 @@ class BathingWatersClient(httpx.AsyncClient):
         response.raise_for_status()
         return SampleAssessment(**response.json()["items"][0])
 
-    async def get_compliance_assessments(self, **params) -> list[ComplianceAssessment]:
+    async def get_compliance_assessments(
+        self, validate: bool | None = None, **params
+    ) -> list[ComplianceAssessment] | list[dict]:
         """
         Returns a list of compliance assessments.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[ComplianceAssessment]: A list of compliance assessments.
         """
         response = await self.get("/id/compliance-assessment", params=params)
         response.raise_for_status()
-        return [ComplianceAssessment(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            ComplianceAssessment,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_compliance_assessment_by_id(
         self, compliance_assessment_id: str
@@ -153,16 +209,27 @@ class BathingWatersClient(httpx.AsyncClient):
         response.raise_for_status()
         return ComplianceAssessment(**response.json()["items"][0])
 
-    async def get_pollution_incidents(self, **params) -> list[PollutionIncident]:
+    async def get_pollution_incidents(
+        self, validate: bool | None = None, **params
+    ) -> list[PollutionIncident] | list[dict]:
         """
         Returns a list of pollution incidents.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[PollutionIncident]: A list of pollution incidents.
         """
         response = await self.get("/id/pollution-incident", params=params)
         response.raise_for_status()
-        return [PollutionIncident(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            PollutionIncident,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_pollution_incident_by_id(
         self, pollution_incident_id: str
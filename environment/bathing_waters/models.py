@@ -1,56 +1,58 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import List, Union, Optional
 
+from .._models import EnvironmentModel
 
-class Name(BaseModel):
+
+class Name(EnvironmentModel):
     value: str = Field(..., alias="_value")
     lang: str = Field(..., alias="_lang")
 
 
-class AppointedSewerageUndertaker(BaseModel):
+class AppointedSewerageUndertaker(EnvironmentModel):
     about: str = Field(..., alias="_about")
     name: Name
 
 
-class Country(BaseModel):
+class Country(EnvironmentModel):
     about: str = Field(..., alias="_about")
     name: Name
 
 
-class District(BaseModel):
+class District(EnvironmentModel):
     about: str = Field(..., alias="_about")
     name: Name
 
 
-class ComplianceClassification(BaseModel):
+class ComplianceClassification(EnvironmentModel):
     about: str = Field(..., alias="_about")
     name: Name
 
 
-class LatestComplianceAssessment(BaseModel):
+class LatestComplianceAssessment(EnvironmentModel):
     about: str = Field(..., alias="_about")
     compliance_classification: ComplianceClassification = Field(
         ..., alias="complianceClassification"
     )
 
 
-class RiskLevel(BaseModel):
+class RiskLevel(EnvironmentModel):
     about: str = Field(..., alias="_about")
     name: Name
 
 
-class ExpiresAt(BaseModel):
+class ExpiresAt(EnvironmentModel):
     value: str = Field(..., alias="_value")
     datatype: str = Field(..., alias="_datatype")
 
 
-class LatestRiskPrediction(BaseModel):
+class LatestRiskPrediction(EnvironmentModel):
     about: str = Field(..., alias="_about")
     expires_at: ExpiresAt = Field(..., alias="expiresAt")
     risk_level: RiskLevel = Field(..., alias="riskLevel")
 
 
-class SamplingPoint(BaseModel):
+class SamplingPoint(EnvironmentModel):
     about: str = Field(..., alias="_about")
     easting: int
     lat: float
@@ -63,7 +65,7 @@ class SamplingPoint(BaseModel):
     type: Optional[str] = None
 
 
-class BathingWater(BaseModel):
+class BathingWater(EnvironmentModel):
     """
     A model for a bathing water.
     """
@@ -96,7 +98,7 @@ class BathingWater(BaseModel):
     classification: Optional[str] = None
 
 
-class SampleAssessment(BaseModel):
+class SampleAssessment(EnvironmentModel):
     about: str = Field(..., alias="_about")
     label: Optional[str] = None
     sampleDateTime: Optional[str] = None
@@ -105,7 +107,7 @@ class SampleAssessment(BaseModel):
     # Add other fields as per documentation
 
 
-class ComplianceAssessment(BaseModel):
+class ComplianceAssessment(EnvironmentModel):
     about: str = Field(..., alias="_about")
     label: Optional[str] = None
     assessmentDate: Optional[str] = None
@@ -113,7 +115,7 @@ class ComplianceAssessment(BaseModel):
     # Add other fields as per documentation
 
 
-class PollutionIncident(BaseModel):
+class PollutionIncident(EnvironmentModel):
     about: str = Field(..., alias="_about")
     label: Optional[str] = None
     incidentDate: Optional[str] = None
@@ -121,7 +123,7 @@ class PollutionIncident(BaseModel):
     # Add other fields as per documentation
 
 
-class ZoneOfInfluence(BaseModel):
+class ZoneOfInfluence(EnvironmentModel):
     about: str = Field(..., alias="_about")
     label: Optional[str] = None
     description: Optional[str] = None
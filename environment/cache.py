@@ -0,0 +1,343 @@
+"""
+A persistent HTTP response cache that sits under the clients as an httpx transport.
+
+Reference data (stations, measures, determinands, bathing waters...) changes rarely,
+yet every new process would otherwise download it again. `CacheTransport` wraps
+another transport and keeps successful `GET` responses in a `CacheBackend`, either
+in memory or in a SQLite file that survives restarts:
+
+    transport = CacheTransport(httpx.AsyncHTTPTransport(), SQLiteCache("~/.cache/environment.db"))
+    async with FloodClient(transport=transport) as client:
+        stations = await client.get_stations()  # served from disk on the next run
+
+or for every client on a session:
+
+    async with EnvironmentSession(cache=SQLiteCache("environment.db")) as session:
+        ...
+
+How long a response stays fresh is decided by the first matching `(pattern, ttl)`
+rule, where `pattern` is a regular expression searched in the request path. A `None`
+TTL (and any URL no rule matches) bypasses the cache entirely, so streamed downloads
+are never buffered. Within `stale_while_revalidate` seconds after expiry, the stale
+response is returned immediately while a background request refreshes the entry.
+
+Both backends evict the least recently used entries once their total body size
+exceeds `max_bytes`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Protocol, Sequence
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+# First match wins; a None TTL is never cached.
+DEFAULT_TTLS: tuple[tuple[str, float | None], ...] = (
+    (r"/archive/|/downloads/", None),
+    (r"/readings", 60.0),
+    (r"/id/floods", 60.0),
+    (r"/id/(stations|measures|floodAreas)", DAY),
+    (r"/def/", DAY),
+    (r"/doc/bathing-water|/id/(bathing-water|sampling-point)", DAY),
+)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class CacheEntry(NamedTuple):
+    """A stored response: status, raw headers, undecoded body and when it was fetched."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    stored_at: float
+
+
+class CacheBackend(Protocol):
+    """Storage for `CacheTransport` entries, keyed by request method and URL."""
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCache:
+    """
+    An in-process LRU cache backend.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the cache.
+
+        Args:
+            max_bytes (int, optional): Maximum total body size kept. Defaults to 256 MiB.
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self.delete(key)
+        if len(entry.content) > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._size += len(entry.content)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.content)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+class SQLiteCache:
+    """
+    A cache backend stored in a single SQLite file, shared across process restarts.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the cache, creating the database file if needed.
+
+        Args:
+            path (str | PathLike): Location of the SQLite database.
+            max_bytes (int, optional): Maximum total body size kept. Defaults to 256 MiB.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " status_code INTEGER NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " content BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status_code, headers, content, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        status_code, headers, content, stored_at = row
+        return CacheEntry(
+            status_code, [tuple(pair) for pair in json.loads(headers)], content, stored_at
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        size = len(entry.content)
+        with self._lock:
+            if size > self.max_bytes:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    size,
+                    entry.stored_at,
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+def cache_key(request: httpx.Request) -> str:
+    """Returns the cache key for a request: its method and URL with sorted query parameters."""
+    url = request.url.copy_with(query=None)
+    params = sorted(request.url.params.multi_items())
+    if params:
+        url = url.copy_with(params=params)
+    return f"{request.method} {url}"
+
+
+class CacheTransport(httpx.AsyncBaseTransport):
+    """
+    A transport that serves `GET` responses from a cache backend, with per-URL TTLs.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        backend: CacheBackend | None = None,
+        ttls: Sequence[tuple[str, float | None]] = DEFAULT_TTLS,
+        stale_while_revalidate: float = 0.0,
+    ):
+        """
+        Initializes the transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): The transport that performs network requests.
+            backend (CacheBackend, optional): Where responses are stored. Defaults to a `MemoryCache`.
+            ttls (Sequence[tuple[str, float | None]], optional): `(pattern, ttl)` rules; the first
+                pattern found in the request path sets the TTL in seconds, and `None` disables
+                caching. Defaults to `DEFAULT_TTLS` (readings and warnings 60 s, reference data 24 h).
+            stale_while_revalidate (float, optional): Seconds after expiry during which a stale
+                response is served while it is refreshed in the background. Defaults to 0.
+        """
+        self.transport = transport
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.stale_while_revalidate = stale_while_revalidate
+        self._revalidating: dict[str, asyncio.Task] = {}
+
+    def ttl_for(self, request: httpx.Request) -> float | None:
+        """Returns the TTL in seconds for a request, or None if it must not be cached."""
+        if request.method != "GET":
+            return None
+        path = request.url.path
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        ttl = self.ttl_for(request)
+        if ttl is None:
+            return await self.transport.handle_async_request(request)
+
+        key = cache_key(request)
+        no_cache = "no-cache" in request.headers.get("cache-control", "")
+        entry = None if no_cache else self.backend.get(key)
+        if entry is not None:
+            age = time.time() - entry.stored_at
+            if age <= ttl:
+                return self._build(entry, request, "hit")
+            if age <= ttl + self.stale_while_revalidate:
+                if key not in self._revalidating:
+                    task = asyncio.create_task(self._fetch(request, key))
+                    self._revalidating[key] = task
+                    task.add_done_callback(lambda task: self._revalidated(key, task))
+                return self._build(entry, request, "stale")
+
+        entry = await self._fetch(request, key)
+        return self._build(entry, request, "miss")
+
+    def _revalidated(self, key: str, task: asyncio.Task) -> None:
+        if self._revalidating.get(key) is task:
+            del self._revalidating[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Nobody awaits a background refresh; the stale entry stays until the next attempt.
+            logger.warning("Revalidating %s failed", key, exc_info=task.exception())
+
+    async def _fetch(self, request: httpx.Request, key: str) -> CacheEntry:
+        response = await self.transport.handle_async_request(request)
+        try:
+            # Keep the raw (still content-encoded) body so it is decoded once, by the client.
+            content = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        entry = CacheEntry(
+            response.status_code,
+            [
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in response.headers.raw
+            ],
+            content,
+            time.time(),
+        )
+        if response.status_code == 200:
+            self.backend.set(key, entry)
+        return entry
+
+    @staticmethod
+    def _build(entry: CacheEntry, request: httpx.Request, status: str) -> httpx.Response:
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            stream=httpx.ByteStream(entry.content),
+            request=request,
+            extensions={"cache": status},
+        )
+
+    async def aclose(self) -> None:
+        tasks = list(self._revalidating.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.transport.aclose()
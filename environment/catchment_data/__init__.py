@@ -1,4 +1,20 @@
-from .client import CatchmentDataClient
-from .models import CatchmentData
+from typing import TYPE_CHECKING
 
-__all__ = ["CatchmentDataClient", "CatchmentData"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import CatchmentDataClient
+    from .models import CatchmentData
+
+__all__ = [
+    "CatchmentDataClient",
+    "CatchmentData",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CatchmentDataClient": ".client",
+        "CatchmentData": ".models",
+    },
+)
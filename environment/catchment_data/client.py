@@ -3,42 +3,47 @@ An async client for the UK Environment Agency's Catchment Data API.
 """
 
 import httpx
+from ..instrumentation import install
 from .models import CatchmentData
 
 
-async def log_request(request):
-    print(f">>> Request: {request.method} {request.url}")
-
-
-async def log_response(response):
-    await response.aread()
-    print(f"<<< Response: {response.status_code}")
-    print(response.text)
-
-
 class CatchmentDataClient(httpx.AsyncClient):
     """
     An async client for the UK Environment Agency's Catchment Data API.
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
         """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk/catchment-planning")
         super().__init__(
-            base_url="https://environment.data.gov.uk/catchment-planning",
             timeout=timeout,
             follow_redirects=True,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(log_request)
-            self.event_hooks["response"].append(log_response)
+        install(self, instrument, verbose)
 
     async def get_catchment_data(self, **params) -> list[CatchmentData]:
         """
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from .._models import EnvironmentModel
 
 
-class CatchmentData(BaseModel):
+class CatchmentData(EnvironmentModel):
     """
     A placeholder model for catchment data.
     """
@@ -0,0 +1,123 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When many tasks ask for the same resource at once (e.g. a popular station page
+calling `get_station_by_id` for every visitor), a `SingleFlight` lets the first
+caller make the upstream request while the others await the same task and share
+its parsed result. With a `ttl`, the result is also memoised for that many seconds
+after it arrives, so a burst arriving just after the request completes is served
+from memory too. Failures are shared with the callers that were waiting, but never
+memoised.
+
+Clients opt in with `coalesce=True` (or a `SingleFlight` instance to configure the
+memo or share it between clients); methods take part via the `coalesced` decorator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call, and optionally a short-lived memo, per key.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 1024):
+        """
+        Initializes the coalescer.
+
+        Args:
+            ttl (float, optional): Seconds a successful result is memoised after it arrives.
+                Defaults to 0 (only calls that overlap in time are shared).
+            max_entries (int, optional): Maximum number of memoised results. Defaults to 1024.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._memo: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns the result of `call()`, sharing it with concurrent callers using the same key.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            call (Callable[[], Awaitable]): Starts the call when no identical call is running.
+
+        Returns:
+            The (possibly shared) result.
+        """
+        memo = self._memo.get(key)
+        if memo is not None:
+            if memo[0] > time.monotonic():
+                self._memo.move_to_end(key)
+                return memo[1]
+            del self._memo[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._finished, key))
+        # Shielded so that one cancelled caller does not cancel the call for everyone else.
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if self.ttl <= 0 or task.cancelled() or task.exception() is not None:
+            return
+        self._memo[key] = (time.monotonic() + self.ttl, task.result())
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+
+    def forget(self, key: Hashable | None = None) -> None:
+        """Drops the memoised result for `key`, or every memoised result if `key` is None."""
+        if key is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(key, None)
+
+
+def coalesced(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Decorates an async client method so identical concurrent calls share one request.
+
+    The client's `single_flight` attribute (a `SingleFlight`, or None to disable) is
+    used; calls are keyed by the client's base URL, the method and its arguments.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        flight: SingleFlight | None = getattr(self, "single_flight", None)
+        if flight is None:
+            return await method(self, *args, **kwargs)
+        key = (str(self.base_url), method.__qualname__, _freeze(args), _freeze(kwargs))
+        return await flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
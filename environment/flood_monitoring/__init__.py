@@ -1,4 +1,45 @@
-from .client import FloodClient
-from .models import FloodWarning, FloodArea, Station, Measure, Reading
+from typing import TYPE_CHECKING
 
-__all__ = ["FloodClient", "FloodWarning", "FloodArea", "Station", "Measure", "Reading"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import FloodClient
+    from .frame import ReadingsFrame
+    from .watcher import FloodWarningWatcher, FloodWarningEvent
+    from .polygons import FloodAreaPolygons
+    from .models import (
+        FloodWarning,
+        FloodArea,
+        Station,
+        Measure,
+        Reading,
+    )
+
+__all__ = [
+    "FloodClient",
+    "ReadingsFrame",
+    "FloodWarningWatcher",
+    "FloodWarningEvent",
+    "FloodAreaPolygons",
+    "FloodWarning",
+    "FloodArea",
+    "Station",
+    "Measure",
+    "Reading",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "FloodClient": ".client",
+        "ReadingsFrame": ".frame",
+        "FloodWarningWatcher": ".watcher",
+        "FloodWarningEvent": ".watcher",
+        "FloodAreaPolygons": ".polygons",
+        "FloodWarning": ".models",
+        "FloodArea": ".models",
+        "Station": ".models",
+        "Measure": ".models",
+        "Reading": ".models",
+    },
+)
@@ -10,17 +10,32 @@ For more information, see the official documentation:
 https://environment.data.gov.uk/flood-monitoring/doc/reference
 """
 
+import datetime
+from typing import Any, AsyncIterator, Callable, Hashable, Iterable
+
 import httpx
+from .._bulk import gather_keyed, measure_notation
+from ..coalesce import SingleFlight, coalesced
+from .._conditional import ConditionalCache
+from .._csv import aiter_csv_rows
+from ..instrumentation import install
+from .._paging import iter_offset_pages
+from .._parsing import parse_items
+from .frame import ReadingsFrame, coerce_value, reading_id
 from .models import FloodWarning, FloodArea, Station, Measure, Reading
 
 
-async def log_request(request):
-    print(f">>> Request: {request.method} {request.url}")
-
-
-async def log_response(response):
-    # Avoid pre-reading body so VCR can capture content
-    print(f"<<< Response: {response.status_code}")
+def _archive_days(
+    start: datetime.date | str, end: datetime.date | str
+) -> list[datetime.date]:
+    if isinstance(start, str):
+        start = datetime.date.fromisoformat(start)
+    if isinstance(end, str):
+        end = datetime.date.fromisoformat(end)
+    return [
+        start + datetime.timedelta(days=offset)
+        for offset in range((end - start).days + 1)
+    ]
 
 
 class FloodClient(httpx.AsyncClient):
@@ -28,25 +43,89 @@ class FloodClient(httpx.AsyncClient):
     An async client for the UK Environment Agency's Real-time flood-monitoring API.
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        validate=True,
+        conditional=False,
+        coalesce=False,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            validate (bool, optional): If False, list methods return plain dicts keyed by field
+                name instead of pydantic models. Can be overridden per call. Defaults to True.
+            conditional (bool, optional): If True, `get_flood_warnings`, `get_stations` and
+                `get_readings` remember each response's `ETag`/`Last-Modified` and send
+                conditional requests; on `304 Not Modified` the previously parsed result is
+                returned. Defaults to False.
+            coalesce (bool | SingleFlight, optional): If True, identical concurrent `*_by_id`
+                calls share one request and parsed result. Pass a `SingleFlight(ttl=...)` to also
+                memoise results briefly or to share it between clients. Defaults to False.
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
         """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk/flood-monitoring")
         super().__init__(
-            base_url="https://environment.data.gov.uk/flood-monitoring",
             timeout=timeout,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(log_request)
-            self.event_hooks["response"].append(log_response)
+        self.validate = validate
+        self.conditional = ConditionalCache() if conditional else None
+        if isinstance(coalesce, SingleFlight):
+            self.single_flight = coalesce
+        else:
+            self.single_flight = SingleFlight() if coalesce else None
+        install(self, instrument, verbose)
+
+    async def _get_parsed(
+        self,
+        url: str,
+        params: dict[str, Any],
+        parse: Callable[[httpx.Response], Any],
+        variant: Hashable = None,
+    ) -> Any:
+        """GETs `url` and parses it, revalidating against the conditional cache if enabled."""
+        request = self.build_request("GET", url, params=params)
+        if self.conditional is None:
+            response = await self.send(request)
+            response.raise_for_status()
+            return parse(response)
+
+        key = (str(request.url), variant)
+        request.headers.update(self.conditional.request_headers(key))
+        response = await self.send(request)
+        if response.status_code == 304:
+            cached = self.conditional.get(key)
+            if isinstance(cached, list):
+                return list(cached)
+            if cached is not None:
+                return cached
+            # The stored result was evicted while the request was in flight.
+            response = await self.get(url, params=params)
+        response.raise_for_status()
+        result = parse(response)
+        self.conditional.store(key, response, result)
+        return list(result) if isinstance(result, list) else result
 
-    async def get_flood_warnings(self, **params) -> list[FloodWarning]:
+    async def get_flood_warnings(
+        self, validate: bool | None = None, **params
+    ) -> list[FloodWarning] | list[dict]:
         """
         Returns a list of current flood warnings.
 
@@ -54,15 +133,22 @@ class FloodClient(httpx.AsyncClient):
         https://environment.data.gov.uk/flood-monitoring/doc/reference#/paths/~1floods/get
 
         Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
             **params: Query parameters to filter the results.
 
         Returns:
             list[FloodWarning]: A list of flood warnings.
         """
-        response = await self.get("/id/floods", params=params)
-        response.raise_for_status()
-        return [FloodWarning(**item) for item in response.json()["items"]]
+        validate = self.validate if validate is None else validate
+        return await self._get_parsed(
+            "/id/floods",
+            params,
+            lambda response: parse_items(response, FloodWarning, validate=validate),
+            validate,
+        )
 
+    @coalesced
     async def get_flood_warning_by_id(self, warning_id: str) -> FloodWarning:
         """
         Returns details of a single flood warning by ID.
@@ -77,7 +163,9 @@ class FloodClient(httpx.AsyncClient):
         response.raise_for_status()
         return FloodWarning(**response.json()["items"][0])
 
-    async def get_flood_areas(self, **params) -> list[FloodArea]:
+    async def get_flood_areas(
+        self, validate: bool | None = None, **params
+    ) -> list[FloodArea] | list[dict]:
         """
         Returns a list of flood areas.
 
@@ -85,6 +173,8 @@ class FloodClient(httpx.AsyncClient):
         https://environment.data.gov.uk/flood-monitoring/doc/reference#/paths/~1flood-areas/get
 
         Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
             **params: Query parameters to filter the results.
 
         Returns:
@@ -94,8 +184,13 @@ class FloodClient(httpx.AsyncClient):
         # See: https://environment.data.gov.uk/flood-monitoring/doc/reference#flood-areas
         response = await self.get("/id/floodAreas", params=params)
         response.raise_for_status()
-        return [FloodArea(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            FloodArea,
+            validate=self.validate if validate is None else validate,
+        )
 
+    @coalesced
     async def get_flood_area_by_id(self, area_id: str) -> FloodArea:
         """
         Returns details of a single flood area by ID.
@@ -111,7 +206,9 @@ class FloodClient(httpx.AsyncClient):
         response.raise_for_status()
         return FloodArea(**response.json()["items"][0])
 
-    async def get_stations(self, **params) -> list[Station]:
+    async def get_stations(
+        self, validate: bool | None = None, **params
+    ) -> list[Station] | list[dict]:
         """
         Returns a list of monitoring stations.
 
@@ -119,15 +216,22 @@ class FloodClient(httpx.AsyncClient):
         https://environment.data.gov.uk/flood-monitoring/doc/reference#/paths/~1stations/get
 
         Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
             **params: Query parameters to filter the results.
 
         Returns:
             list[Station]: A list of monitoring stations.
         """
-        response = await self.get("/id/stations", params=params)
-        response.raise_for_status()
-        return [Station(**item) for item in response.json()["items"]]
+        validate = self.validate if validate is None else validate
+        return await self._get_parsed(
+            "/id/stations",
+            params,
+            lambda response: parse_items(response, Station, validate=validate),
+            validate,
+        )
 
+    @coalesced
     async def get_station_by_id(self, station_id: str) -> Station:
         """
         Returns details of a single monitoring station by ID.
@@ -142,7 +246,9 @@ class FloodClient(httpx.AsyncClient):
         response.raise_for_status()
         return Station(**response.json()["items"][0])
 
-    async def get_measures(self, **params) -> list[Measure]:
+    async def get_measures(
+        self, validate: bool | None = None, **params
+    ) -> list[Measure] | list[dict]:
         """
         Returns a list of measures.
 
@@ -150,6 +256,8 @@ class FloodClient(httpx.AsyncClient):
         https://environment.data.gov.uk/flood-monitoring/doc/reference#/paths/~1measures/get
 
         Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
             **params: Query parameters to filter the results.
 
         Returns:
@@ -157,8 +265,13 @@ class FloodClient(httpx.AsyncClient):
         """
         response = await self.get("/id/measures", params=params)
         response.raise_for_status()
-        return [Measure(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Measure,
+            validate=self.validate if validate is None else validate,
+        )
 
+    @coalesced
     async def get_measure_by_id(self, measure_id: str) -> Measure:
         """
         Returns details of a single measure by ID.
@@ -173,7 +286,9 @@ class FloodClient(httpx.AsyncClient):
         response.raise_for_status()
         return Measure(**response.json()["items"][0])
 
-    async def get_readings(self, **params) -> list[Reading]:
+    async def get_readings(
+        self, as_frame: bool = False, validate: bool | None = None, **params
+    ) -> list[Reading] | list[dict] | ReadingsFrame:
         """
         Returns a list of readings.
 
@@ -181,18 +296,194 @@ class FloodClient(httpx.AsyncClient):
         https://environment.data.gov.uk/flood-monitoring/doc/reference#/paths/~1data~1readings/get
 
         Args:
+            as_frame (bool, optional): If True, returns a columnar `ReadingsFrame` built straight
+                from the response instead of one `Reading` model per item. Defaults to False.
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
             **params: Query parameters to filter the results.
 
         Returns:
-            list[Reading]: A list of readings.
+            list[Reading] | ReadingsFrame: A list of readings, or a `ReadingsFrame` if `as_frame` is set.
         """
-        response = await self.get(
-            "/data/readings",
-            params=params,
+        validate = self.validate if validate is None else validate
+
+        def parse(response: httpx.Response) -> list[Reading] | list[dict] | ReadingsFrame:
+            if as_frame:
+                return ReadingsFrame.from_items(response.json()["items"])
+            return parse_items(response, Reading, validate=validate)
+
+        return await self._get_parsed(
+            "/data/readings", params, parse, "frame" if as_frame else validate
         )
-        response.raise_for_status()
-        return [Reading(**item) for item in response.json()["items"]]
 
+    async def iter_readings(
+        self, page_size: int = 5000, prefetch: bool = True, **params
+    ) -> AsyncIterator[Reading]:
+        """
+        Iterates over readings, walking the `_limit`/`_offset` pages of `/data/readings`.
+
+        Readings are held in memory one page at a time. With `prefetch` enabled, the
+        next page is requested while the caller consumes the current one.
+
+        Args:
+            page_size (int, optional): Number of readings requested per page. Defaults to 5000.
+            prefetch (bool, optional): If True, fetches the next page ahead of time. Defaults to True.
+            **params: Query parameters to filter the results (e.g. `since`, `startdate`).
+                An `_offset` value sets where iteration starts; `_limit` is ignored.
+
+        Yields:
+            Reading: Each reading, in the order returned by the API.
+        """
+        start = int(params.pop("_offset", 0))
+        params.pop("_limit", None)
+
+        async def fetch_page(limit: int, offset: int) -> list[Reading]:
+            return await self.get_readings(**params, _limit=limit, _offset=offset)
+
+        async for page in iter_offset_pages(
+            fetch_page, page_size, offset=start, prefetch=prefetch
+        ):
+            for reading in page:
+                yield reading
+
+    async def get_readings_for_measures(
+        self,
+        measure_ids: Iterable[str],
+        since: str | None = None,
+        max_concurrency: int = 8,
+        **params,
+    ) -> dict[str, list[Reading] | Exception]:
+        """
+        Returns readings for many measures, fetching them concurrently.
+
+        One `/id/measures/{id}/readings` request is issued per measure over the
+        client's connection pool, with at most `max_concurrency` in flight. A failing measure
+        (e.g. a 404) does not affect the others.
+
+        Args:
+            measure_ids (Iterable[str]): Measure notations or full measure URIs. Duplicates are fetched once.
+            since (str, optional): Only return readings taken after this date-time (`since`).
+            max_concurrency (int, optional): Maximum number of concurrent requests. Defaults to 8.
+            **params: Additional query parameters applied to every request.
+
+        Returns:
+            dict[str, list[Reading] | Exception]: Readings keyed by the given measure ID, or the
+            exception raised for that measure.
+        """
+        if since is not None:
+            params["since"] = since
+
+        async def fetch(measure_id: str) -> list[Reading]:
+            response = await self.get(
+                f"/id/measures/{measure_notation(measure_id)}/readings", params=params
+            )
+            response.raise_for_status()
+            return parse_items(response, Reading, validate=self.validate)
+
+        return await gather_keyed(measure_ids, fetch, max_concurrency)
+
+    async def iter_archive_readings(
+        self, date: datetime.date | str, measures: Iterable[str] | None = None
+    ) -> AsyncIterator[Reading]:
+        """
+        Streams one day of readings from the daily archive (`/archive/readings-YYYY-MM-DD.csv`).
+
+        The CSV body is parsed row by row as it arrives, so the whole file is never held in memory.
+
+        Args:
+            date (datetime.date | str): The day to fetch, as a date or `YYYY-MM-DD` string.
+            measures (Iterable[str], optional): Only yield readings for these measures, given as
+                notations or full measure URIs. Defaults to all measures.
+
+        Yields:
+            Reading: Each reading in the archive, in file order. Multi-valued cells keep their
+            first value and empty or invalid cells become NaN, as in `ReadingsFrame`.
+        """
+        async for measure, date_time, value in self._iter_archive_rows(date, measures):
+            yield Reading(
+                **{
+                    "@id": reading_id(measure, date_time),
+                    "dateTime": date_time,
+                    "measure": measure,
+                    "value": coerce_value(value),
+                }
+            )
+
+    async def iter_archive_readings_range(
+        self,
+        start: datetime.date | str,
+        end: datetime.date | str,
+        measures: Iterable[str] | None = None,
+    ) -> AsyncIterator[Reading]:
+        """
+        Streams readings from the daily archive for every day from `start` to `end` inclusive.
+
+        Days are streamed one after another over the same connection.
+
+        Args:
+            start (datetime.date | str): First day, as a date or `YYYY-MM-DD` string.
+            end (datetime.date | str): Last day, as a date or `YYYY-MM-DD` string.
+            measures (Iterable[str], optional): Only yield readings for these measures.
+
+        Yields:
+            Reading: Each reading, ordered by day and then file order.
+        """
+        measures = list(measures) if measures is not None else None
+        for day in _archive_days(start, end):
+            async for reading in self.iter_archive_readings(day, measures):
+                yield reading
+
+    async def get_archive_frame(
+        self,
+        start: datetime.date | str,
+        end: datetime.date | str | None = None,
+        measures: Iterable[str] | None = None,
+    ) -> ReadingsFrame:
+        """
+        Loads archived readings for a day, or a range of days, straight into a `ReadingsFrame`.
+
+        Rows are appended to the frame's columns as they are parsed, without building `Reading` models.
+
+        Args:
+            start (datetime.date | str): First day, as a date or `YYYY-MM-DD` string.
+            end (datetime.date | str, optional): Last day (inclusive). Defaults to `start`.
+            measures (Iterable[str], optional): Only load readings for these measures.
+
+        Returns:
+            ReadingsFrame: The archived readings in columnar form.
+        """
+        measures = list(measures) if measures is not None else None
+        frame = ReadingsFrame()
+        for day in _archive_days(start, start if end is None else end):
+            async for measure, date_time, value in self._iter_archive_rows(day, measures):
+                frame.append(measure, date_time, value)
+        return frame
+
+    async def _iter_archive_rows(
+        self, date: datetime.date | str, measures: Iterable[str] | None
+    ) -> AsyncIterator[tuple[str, str, str]]:
+        wanted = (
+            {measure_notation(measure) for measure in measures}
+            if measures is not None
+            else None
+        )
+        async with self.stream("GET", f"/archive/readings-{date}.csv") as response:
+            response.raise_for_status()
+            rows = aiter_csv_rows(response.aiter_bytes())
+            header = await anext(rows, None)
+            if header is None:
+                return
+            columns = {name.strip(): index for index, name in enumerate(header)}
+            date_col = columns["dateTime"]
+            measure_col = columns["measure"]
+            value_col = columns["value"]
+            async for row in rows:
+                measure = row[measure_col]
+                if wanted is not None and measure_notation(measure) not in wanted:
+                    continue
+                yield measure, row[date_col], row[value_col]
+
+    @coalesced
     async def get_reading_by_id(self, reading_id: str) -> Reading:
         """
         Returns details of a single reading by ID.
@@ -0,0 +1,294 @@
+"""
+A columnar container for bulk flood-monitoring readings.
+
+`ReadingsFrame` stores readings as three typed `array.array` columns instead of one
+pydantic `Reading` per point:
+
+- `timestamps`: epoch seconds (int64)
+- `values`: reading values (float64, NaN where the API gave no usable value)
+- `measure_codes`: indices (uint32) into the `measures` list of distinct measure URIs
+
+The columns expose the buffer protocol, so `columns()` and `to_numpy()` hand them out
+without copying.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator
+
+from .models import Reading
+
+_TIMESTAMP_TYPECODE = "q"
+_VALUE_TYPECODE = "d"
+_CODE_TYPECODE = "I"
+
+
+def parse_timestamp(value: str) -> int:
+    """Converts an ISO 8601 date-time string (e.g. `2024-01-01T00:15:00Z`) to epoch seconds."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def format_timestamp(value: int) -> str:
+    """Converts epoch seconds back to the API's `YYYY-MM-DDTHH:MM:SSZ` form."""
+    return datetime.fromtimestamp(value, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def reading_id(measure: str, date_time: str) -> str:
+    """Builds the `/data/readings/{measure}/{dateTime}` URI for a reading of a measure URI."""
+    return f"{measure.replace('/id/measures/', '/data/readings/')}/{date_time}"
+
+
+def coerce_value(value: Any) -> float:
+    """Returns a reading value as a float: the first of several values, or NaN if missing or invalid."""
+    # A handful of measures report several values in one reading; keep the first.
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, str) and "|" in value:
+        value = value.split("|", 1)[0]
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _measure_uri(value: Any) -> str:
+    if isinstance(value, dict):
+        return value.get("@id", "")
+    return value or ""
+
+
+class ReadingsFrame:
+    """
+    Columnar readings: epoch timestamps, float values and a dictionary-encoded measure column.
+    """
+
+    __slots__ = ("timestamps", "values", "measure_codes", "measures", "_measure_index")
+
+    def __init__(
+        self,
+        timestamps: Iterable[int] = (),
+        values: Iterable[float] = (),
+        measure_codes: Iterable[int] = (),
+        measures: list[str] | None = None,
+    ):
+        """
+        Initializes the frame from existing columns.
+
+        Args:
+            timestamps (Iterable[int], optional): Epoch seconds for each reading.
+            values (Iterable[float], optional): Value of each reading.
+            measure_codes (Iterable[int], optional): Index into `measures` for each reading.
+            measures (list[str], optional): Distinct measure URIs referenced by `measure_codes`.
+        """
+        self.timestamps = array(_TIMESTAMP_TYPECODE, timestamps)
+        self.values = array(_VALUE_TYPECODE, values)
+        self.measure_codes = array(_CODE_TYPECODE, measure_codes)
+        if not len(self.timestamps) == len(self.values) == len(self.measure_codes):
+            raise ValueError("ReadingsFrame columns must have equal lengths")
+        self.measures: list[str] = list(measures or [])
+        self._measure_index = {measure: code for code, measure in enumerate(self.measures)}
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict[str, Any]]) -> ReadingsFrame:
+        """
+        Builds a frame directly from raw `/data/readings` JSON items, without pydantic validation.
+
+        Args:
+            items (Iterable[dict]): Reading items as returned in the API's `items` list.
+
+        Returns:
+            ReadingsFrame: The readings in columnar form.
+        """
+        frame = cls()
+        frame.extend_items(items)
+        return frame
+
+    @classmethod
+    def from_readings(cls, readings: Iterable[Reading]) -> ReadingsFrame:
+        """
+        Builds a frame from `Reading` models.
+
+        Args:
+            readings (Iterable[Reading]): Readings to convert.
+
+        Returns:
+            ReadingsFrame: The readings in columnar form.
+        """
+        frame = cls()
+        for reading in readings:
+            frame.append(reading.measure, reading.date_time, reading.value)
+        return frame
+
+    def measure_code(self, measure: str) -> int:
+        """Returns the dictionary code for a measure URI, adding it if unseen."""
+        code = self._measure_index.get(measure)
+        if code is None:
+            code = len(self.measures)
+            self.measures.append(measure)
+            self._measure_index[measure] = code
+        return code
+
+    def append(self, measure: str, date_time: str | int, value: Any) -> None:
+        """
+        Appends a single reading.
+
+        Args:
+            measure (str): The measure URI.
+            date_time (str | int): ISO 8601 date-time string or epoch seconds.
+            value: The reading value; anything not convertible to float is stored as NaN.
+        """
+        if isinstance(date_time, str):
+            date_time = parse_timestamp(date_time)
+        self.timestamps.append(date_time)
+        self.values.append(coerce_value(value))
+        self.measure_codes.append(self.measure_code(measure))
+
+    def extend_items(self, items: Iterable[dict[str, Any]]) -> None:
+        """
+        Appends raw `/data/readings` JSON items.
+
+        Items without a `dateTime` are skipped.
+
+        Args:
+            items (Iterable[dict]): Reading items as returned in the API's `items` list.
+        """
+        # Readings from many measures share the same timestamps, so parse each string once.
+        parsed: dict[str, int] = {}
+        for item in items:
+            date_time = item.get("dateTime")
+            if not date_time:
+                continue
+            timestamp = parsed.get(date_time)
+            if timestamp is None:
+                timestamp = parsed[date_time] = parse_timestamp(date_time)
+            self.timestamps.append(timestamp)
+            self.values.append(coerce_value(item.get("value")))
+            self.measure_codes.append(self.measure_code(_measure_uri(item.get("measure"))))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[tuple[str, int, float]]:
+        measures = self.measures
+        for timestamp, value, code in zip(self.timestamps, self.values, self.measure_codes):
+            yield measures[code], timestamp, value
+
+    def __getitem__(self, key: int | slice) -> tuple[str, int, float] | ReadingsFrame:
+        """
+        Returns `(measure, timestamp, value)` for an integer index, or a new frame for a slice.
+
+        Sliced frames share the measure dictionary of this frame.
+        """
+        if isinstance(key, slice):
+            return self._take(
+                self.timestamps[key], self.values[key], self.measure_codes[key]
+            )
+        return (
+            self.measures[self.measure_codes[key]],
+            self.timestamps[key],
+            self.values[key],
+        )
+
+    def __repr__(self) -> str:
+        return f"ReadingsFrame(rows={len(self)}, measures={len(self.measures)})"
+
+    def _take(self, timestamps: array, values: array, codes: array) -> ReadingsFrame:
+        frame = ReadingsFrame.__new__(ReadingsFrame)
+        frame.timestamps = timestamps
+        frame.values = values
+        frame.measure_codes = codes
+        # Copied so that appending a new measure to a slice leaves the parent untouched.
+        frame.measures = list(self.measures)
+        frame._measure_index = dict(self._measure_index)
+        return frame
+
+    @property
+    def measure_ids(self) -> list[str]:
+        """The decoded measure URI for every row."""
+        measures = self.measures
+        return [measures[code] for code in self.measure_codes]
+
+    def group_by_measure(self) -> dict[str, ReadingsFrame]:
+        """
+        Splits the frame into one frame per measure, preserving row order within each group.
+
+        Returns:
+            dict[str, ReadingsFrame]: Frames keyed by measure URI.
+        """
+        columns: dict[int, tuple[array, array]] = {}
+        for timestamp, value, code in zip(self.timestamps, self.values, self.measure_codes):
+            group = columns.get(code)
+            if group is None:
+                group = columns[code] = (
+                    array(_TIMESTAMP_TYPECODE),
+                    array(_VALUE_TYPECODE),
+                )
+            group[0].append(timestamp)
+            group[1].append(value)
+        return {
+            self.measures[code]: ReadingsFrame(
+                timestamps, values, [0] * len(timestamps), [self.measures[code]]
+            )
+            for code, (timestamps, values) in columns.items()
+        }
+
+    def columns(self) -> dict[str, memoryview]:
+        """
+        Returns zero-copy views of the underlying columns.
+
+        Returns:
+            dict[str, memoryview]: `timestamps`, `values` and `measure_codes` buffers.
+        """
+        return {
+            "timestamps": memoryview(self.timestamps),
+            "values": memoryview(self.values),
+            "measure_codes": memoryview(self.measure_codes),
+        }
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Returns the columns as NumPy arrays sharing this frame's memory.
+
+        Requires NumPy to be installed. While any returned array is alive, appending
+        to the frame raises `BufferError`, so take the arrays once the frame is complete.
+
+        Returns:
+            dict[str, numpy.ndarray]: `timestamps` (datetime64[s]), `values` and `measure_codes`.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise ImportError("ReadingsFrame.to_numpy() requires numpy") from exc
+        return {
+            "timestamps": np.frombuffer(self.timestamps, dtype=np.int64).view("datetime64[s]"),
+            "values": np.frombuffer(self.values, dtype=np.float64),
+            "measure_codes": np.frombuffer(self.measure_codes, dtype=np.uint32),
+        }
+
+    def to_readings(self) -> list[Reading]:
+        """
+        Materialises the frame back into `Reading` models.
+
+        Returns:
+            list[Reading]: One reading per row.
+        """
+        readings = []
+        for measure, timestamp, value in self:
+            date_time = format_timestamp(timestamp)
+            readings.append(
+                Reading(
+                    **{
+                        "@id": reading_id(measure, date_time),
+                        "dateTime": date_time,
+                        "measure": measure,
+                        "value": value,
+                    }
+                )
+            )
+        return readings
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional
 
+from .._models import EnvironmentModel
 
-class FloodAreaInfo(BaseModel):
+
+class FloodAreaInfo(EnvironmentModel):
     id: str = Field(..., alias="@id")
     county: str
     notation: str
@@ -13,7 +15,7 @@ class FloodAreaInfo(BaseModel):
     description: Optional[str] = None
 
 
-class FloodWarning(BaseModel):
+class FloodWarning(EnvironmentModel):
     id: str = Field(..., alias="@id")
     description: str
     ea_area_name: str = Field(..., alias="eaAreaName")
@@ -32,7 +34,7 @@ class FloodWarning(BaseModel):
     status: Optional[str] = None
 
 
-class FloodArea(BaseModel):
+class FloodArea(EnvironmentModel):
     id: str = Field(..., alias="@id")
     county: str
     description: str
@@ -50,7 +52,7 @@ class FloodArea(BaseModel):
     type: Optional[str] = None
 
 
-class MeasureInfo(BaseModel):
+class MeasureInfo(EnvironmentModel):
     id: str = Field(..., alias="@id")
     parameter: str
     parameter_name: str = Field(..., alias="parameterName")
@@ -62,7 +64,7 @@ class MeasureInfo(BaseModel):
     description: Optional[str] = None
 
 
-class Station(BaseModel):
+class Station(EnvironmentModel):
     id: str = Field(..., alias="@id")
     rloi_id: str | list[str] | None = Field(None, alias="RLOIid")
     catchment_name: str | list[str] | None = Field(None, alias="catchmentName")
@@ -89,7 +91,7 @@ class Station(BaseModel):
     description: Optional[str] = None
 
 
-class Reading(BaseModel):
+class Reading(EnvironmentModel):
     id: str = Field(..., alias="@id")
     date: str | None = None
     date_time: str = Field(..., alias="dateTime")
@@ -99,7 +101,7 @@ class Reading(BaseModel):
     unit: Optional[str] = None
 
 
-class Measure(BaseModel):
+class Measure(EnvironmentModel):
     id: str = Field(..., alias="@id")
     datum_type: str | None = Field(None, alias="datumType")
     label: str
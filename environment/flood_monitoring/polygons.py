@@ -0,0 +1,300 @@
+"""
+Flood-area polygon cache and batch point-in-polygon lookup.
+
+`FloodArea.polygon` and `FloodAreaInfo.polygon` are URLs to GeoJSON documents.
+`FloodAreaPolygons` fetches those documents concurrently, caches them on disk keyed
+by area notation, and keeps a simplified copy of each geometry in memory behind a
+bounding-box grid index. `areas_containing(points)` then answers "which areas contain
+each of these points" without any further API calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+from .._bulk import gather_keyed
+
+if TYPE_CHECKING:
+    from .client import FloodClient
+
+logger = logging.getLogger(__name__)
+
+# A ring is a closed list of (long, lat) vertices; a polygon is an outer ring plus holes.
+Ring = list[tuple[float, float]]
+BBox = tuple[float, float, float, float]
+
+
+def _simplify(ring: Ring, tolerance: float) -> Ring:
+    """Douglas-Peucker simplification of a closed ring, keeping at least a triangle."""
+    if tolerance <= 0 or len(ring) <= 4:
+        return ring
+    keep = [False] * len(ring)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(ring) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = ring[first], ring[last]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        furthest, max_distance = None, tolerance
+        for index in range(first + 1, last):
+            x, y = ring[index]
+            if length == 0:
+                distance = math.hypot(x - x1, y - y1)
+            else:
+                distance = abs(dy * x - dx * y + x2 * y1 - y2 * x1) / length
+            if distance > max_distance:
+                furthest, max_distance = index, distance
+        if furthest is not None:
+            keep[furthest] = True
+            stack.append((first, furthest))
+            stack.append((furthest, last))
+    simplified = [point for point, kept in zip(ring, keep) if kept]
+    return simplified if len(simplified) >= 4 else ring
+
+
+def _bbox(rings: Sequence[Ring]) -> BBox:
+    xs = [x for ring in rings for x, _ in ring]
+    ys = [y for ring in rings for _, y in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _inside(rings: Sequence[Ring], x: float, y: float) -> bool:
+    """Even-odd ray casting across all rings of a polygon, so holes are excluded."""
+    inside = False
+    for ring in rings:
+        x1, y1 = ring[-1]
+        for x2, y2 in ring:
+            if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+                inside = not inside
+            x1, y1 = x2, y2
+    return inside
+
+
+def _polygons(document: dict[str, Any]) -> list[list[Ring]]:
+    """Extracts polygons (as lists of rings) from a GeoJSON document."""
+    if document.get("type") == "FeatureCollection":
+        geometries = [feature.get("geometry") or {} for feature in document.get("features", [])]
+    elif document.get("type") == "Feature":
+        geometries = [document.get("geometry") or {}]
+    else:
+        geometries = [document]
+    polygons: list[list[Ring]] = []
+    for geometry in geometries:
+        kind, coordinates = geometry.get("type"), geometry.get("coordinates") or []
+        if kind == "Polygon":
+            coordinates = [coordinates]
+        elif kind != "MultiPolygon":
+            continue
+        for polygon in coordinates:
+            rings = [[(float(x), float(y)) for x, y, *_ in ring] for ring in polygon if ring]
+            if rings:
+                polygons.append(rings)
+    return polygons
+
+
+class FloodAreaPolygons:
+    """
+    In-memory, bounding-box-indexed flood-area polygons with an on-disk GeoJSON cache.
+    """
+
+    def __init__(
+        self,
+        client: FloodClient,
+        cache_dir: str | os.PathLike | None = None,
+        max_age: float | None = None,
+        tolerance: float = 0.0001,
+        cell_degrees: float = 0.1,
+        max_concurrency: int = 8,
+    ):
+        """
+        Initializes the polygon store.
+
+        Args:
+            client (FloodClient): The client used to fetch polygon documents.
+            cache_dir (str | PathLike, optional): Directory for cached GeoJSON, one file per area
+                notation. Defaults to None (no disk cache).
+            max_age (float, optional): Seconds after which a cached document is re-fetched.
+                Defaults to None (cached documents never expire).
+            tolerance (float, optional): Douglas-Peucker tolerance in degrees for the in-memory
+                geometry; 0 keeps every vertex. Defaults to 0.0001 (about 10 m).
+            cell_degrees (float, optional): Cell size of the bounding-box grid. Defaults to 0.1.
+            max_concurrency (int, optional): Maximum concurrent polygon downloads. Defaults to 8.
+        """
+        self.client = client
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_age = max_age
+        self.tolerance = tolerance
+        self.cell_degrees = cell_degrees
+        self.max_concurrency = max_concurrency
+        self._areas: dict[str, list[tuple[BBox, list[Ring]]]] = {}
+        self._cells: dict[tuple[int, int], set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._areas)
+
+    def __contains__(self, notation: str) -> bool:
+        return notation in self._areas
+
+    @property
+    def notations(self) -> list[str]:
+        """Notations of the loaded areas."""
+        return list(self._areas)
+
+    async def load(self, areas: Iterable[Any]) -> dict[str, Exception]:
+        """
+        Loads polygons for flood areas, from the disk cache where possible and otherwise from the API.
+
+        Areas that are already loaded are skipped.
+
+        Args:
+            areas (Iterable): `FloodArea`, `FloodAreaInfo` or `FloodWarning` models.
+
+        Returns:
+            dict[str, Exception]: Errors keyed by area notation for polygons that could not be loaded.
+        """
+        urls: dict[str, str] = {}
+        for area in areas:
+            area = getattr(area, "flood_area", area)
+            if area.notation not in self._areas:
+                urls[area.notation] = area.polygon
+
+        async def fetch(notation: str) -> dict[str, Any]:
+            if self.cache_dir is None:
+                document = None
+            else:
+                document = await asyncio.to_thread(self._read_cache, notation)
+            if document is None:
+                response = await self.client.get(urls[notation])
+                response.raise_for_status()
+                document = response.json()
+                if self.cache_dir is not None:
+                    try:
+                        await asyncio.to_thread(self._write_cache, notation, document)
+                    except OSError:
+                        # The polygon was fetched; failing to cache it only costs a re-fetch later.
+                        logger.warning("Could not cache polygon for %s", notation, exc_info=True)
+            return document
+
+        results = await gather_keyed(urls, fetch, self.max_concurrency)
+        errors = {}
+        for notation, result in results.items():
+            if isinstance(result, Exception):
+                errors[notation] = result
+            else:
+                self.add(notation, result)
+        return errors
+
+    def add(self, notation: str, document: dict[str, Any]) -> None:
+        """
+        Indexes a GeoJSON document under an area notation, replacing any previous geometry.
+
+        Args:
+            notation (str): The flood area notation.
+            document (dict): A GeoJSON FeatureCollection, Feature or geometry.
+        """
+        self.remove(notation)
+        polygons = []
+        for rings in _polygons(document):
+            rings = [_simplify(ring, self.tolerance) for ring in rings]
+            polygons.append((_bbox(rings), rings))
+        self._areas[notation] = polygons
+        for cell in self._cells_for(polygons):
+            self._cells.setdefault(cell, set()).add(notation)
+
+    def remove(self, notation: str) -> None:
+        """Drops an area from the in-memory index. The disk cache is left untouched."""
+        polygons = self._areas.pop(notation, None)
+        if polygons is None:
+            return
+        for cell in self._cells_for(polygons):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(notation)
+                if not bucket:
+                    del self._cells[cell]
+
+    def _cells_for(self, polygons: list[tuple[BBox, list[Ring]]]) -> set[tuple[int, int]]:
+        size = self.cell_degrees
+        cells = set()
+        for (min_x, min_y, max_x, max_y), _ in polygons:
+            for cx in range(math.floor(min_x / size), math.floor(max_x / size) + 1):
+                for cy in range(math.floor(min_y / size), math.floor(max_y / size) + 1):
+                    cells.add((cx, cy))
+        return cells
+
+    def contains(self, notation: str, lat: float, long: float) -> bool:
+        """Returns True if the loaded area `notation` contains the point."""
+        for (min_x, min_y, max_x, max_y), rings in self._areas.get(notation, []):
+            if min_x <= long <= max_x and min_y <= lat <= max_y and _inside(rings, long, lat):
+                return True
+        return False
+
+    def areas_containing(
+        self, points: Iterable[tuple[float, float]]
+    ) -> list[list[str]]:
+        """
+        Returns, for each `(lat, long)` point, the notations of the loaded areas containing it.
+
+        Points are grouped by grid cell so each candidate area's bounding boxes are checked
+        against a whole batch of nearby points at once before any ray casting happens.
+
+        Args:
+            points (Iterable[tuple[float, float]]): Points as `(lat, long)` pairs.
+
+        Returns:
+            list[list[str]]: Area notations per input point, in input order.
+        """
+        points = list(points)
+        results: list[list[str]] = [[] for _ in points]
+        size = self.cell_degrees
+        by_cell: dict[tuple[int, int], list[int]] = {}
+        for index, (lat, long) in enumerate(points):
+            cell = (math.floor(long / size), math.floor(lat / size))
+            by_cell.setdefault(cell, []).append(index)
+
+        for cell, indices in by_cell.items():
+            for notation in self._cells.get(cell, ()):
+                for (min_x, min_y, max_x, max_y), rings in self._areas[notation]:
+                    for index in indices:
+                        lat, long = points[index]
+                        if not (min_x <= long <= max_x and min_y <= lat <= max_y):
+                            continue
+                        if _inside(rings, long, lat):
+                            found = results[index]
+                            if not found or found[-1] != notation:
+                                found.append(notation)
+        return results
+
+    def _cache_path(self, notation: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        safe = "".join(char if char.isalnum() or char in "-_" else "_" for char in notation)
+        return self.cache_dir / f"{safe}.geojson"
+
+    def _read_cache(self, notation: str) -> dict[str, Any] | None:
+        path = self._cache_path(notation)
+        if path is None:
+            return None
+        try:
+            if self.max_age is not None and time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, notation: str, document: dict[str, Any]) -> None:
+        path = self._cache_path(notation)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(document))
+        tmp.replace(path)
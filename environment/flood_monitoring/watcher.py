@@ -0,0 +1,133 @@
+"""
+Incremental polling of flood warnings.
+
+`FloodWarningWatcher` polls `/id/floods`, keys warnings by `floodAreaID` and compares
+each raw item's `timeMessageChanged` and `severityLevel` with the previous poll. Only
+added and changed items are validated into `FloodWarning` models, so unchanged warnings
+cost a dictionary lookup rather than a full model build.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal, Optional
+
+from .._conditional import validator_headers
+from .._models import EnvironmentModel
+from .models import FloodWarning
+
+if TYPE_CHECKING:
+    from .client import FloodClient
+
+
+class FloodWarningEvent(EnvironmentModel):
+    kind: Literal["added", "changed", "removed"]
+    flood_area_id: str
+    # The current warning, or the last known warning for "removed" events
+    warning: FloodWarning
+    previous: Optional[FloodWarning] = None
+
+
+def _fingerprint(item: dict[str, Any]) -> tuple[Any, Any]:
+    return item.get("timeMessageChanged"), item.get("severityLevel")
+
+
+class FloodWarningWatcher:
+    """
+    Polls flood warnings and reports only what changed between polls.
+    """
+
+    def __init__(self, client: FloodClient, interval: float = 60.0, **params):
+        """
+        Initializes the watcher.
+
+        Args:
+            client (FloodClient): The client used to poll `/id/floods`.
+            interval (float, optional): Seconds between the start of consecutive polls in `watch()`. Defaults to 60.0.
+            **params: Query parameters applied to every poll (e.g. `min-severity`, `county`).
+        """
+        self.client = client
+        self.interval = interval
+        self.params = params
+        self._warnings: dict[str, FloodWarning] = {}
+        self._fingerprints: dict[str, tuple[Any, Any]] = {}
+        self._validators: dict[str, str] = {}
+
+    @property
+    def warnings(self) -> dict[str, FloodWarning]:
+        """The warnings seen on the last poll, keyed by flood area ID."""
+        return dict(self._warnings)
+
+    async def poll(self) -> list[FloodWarningEvent]:
+        """
+        Polls once and returns the events since the previous poll.
+
+        On the first poll every current warning is reported as "added". Polls are sent as
+        conditional requests once the API has returned an `ETag` or `Last-Modified`; a
+        `304 Not Modified` answer yields no events.
+
+        Returns:
+            list[FloodWarningEvent]: Added and changed warnings in API order, followed by removed ones.
+        """
+        response = await self.client.get(
+            "/id/floods", params=self.params, headers=self._validators
+        )
+        if response.status_code == 304:
+            return []
+        response.raise_for_status()
+        validators = validator_headers(response)
+        items = response.json()["items"]
+
+        # Work on copies so a failure mid-batch leaves the previous state (and its
+        # validators) intact, and the next poll reports the same changes again.
+        warnings = dict(self._warnings)
+        fingerprints = dict(self._fingerprints)
+        events: list[FloodWarningEvent] = []
+        seen: set[str] = set()
+        for item in items:
+            area_id = item.get("floodAreaID")
+            if area_id is None or area_id in seen:
+                continue
+            seen.add(area_id)
+            fingerprint = _fingerprint(item)
+            previous_fingerprint = fingerprints.get(area_id)
+            if previous_fingerprint == fingerprint:
+                continue
+            warning = FloodWarning(**item)
+            previous = warnings.get(area_id)
+            warnings[area_id] = warning
+            fingerprints[area_id] = fingerprint
+            events.append(
+                FloodWarningEvent(
+                    kind="added" if previous is None else "changed",
+                    flood_area_id=area_id,
+                    warning=warning,
+                    previous=previous,
+                )
+            )
+
+        for area_id in [area_id for area_id in warnings if area_id not in seen]:
+            warning = warnings.pop(area_id)
+            del fingerprints[area_id]
+            events.append(
+                FloodWarningEvent(kind="removed", flood_area_id=area_id, warning=warning)
+            )
+
+        self._warnings = warnings
+        self._fingerprints = fingerprints
+        self._validators = validators
+        return events
+
+    async def watch(self) -> AsyncIterator[FloodWarningEvent]:
+        """
+        Polls every `interval` seconds and yields events as they are detected.
+
+        Yields:
+            FloodWarningEvent: Each added, changed or removed warning.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            for event in await self.poll():
+                yield event
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
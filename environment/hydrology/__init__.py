@@ -0,0 +1,24 @@
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import HydrologyClient
+    from .models import Station, Measure, Reading
+
+__all__ = [
+    "HydrologyClient",
+    "Station",
+    "Measure",
+    "Reading",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "HydrologyClient": ".client",
+        "Station": ".models",
+        "Measure": ".models",
+        "Reading": ".models",
+    },
+)
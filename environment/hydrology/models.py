@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List
 
+from .._models import EnvironmentModel
 
-class Station(BaseModel):
+
+class Station(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     notation: Optional[str] = None
@@ -18,7 +20,7 @@ class Station(BaseModel):
     measures: Optional[List[dict]] = None  # Assuming measures might be a list of dicts
 
 
-class Measure(BaseModel):
+class Measure(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     notation: Optional[str] = None
@@ -32,7 +34,7 @@ class Measure(BaseModel):
     unit: Optional[str] = None
 
 
-class Reading(BaseModel):
+class Reading(EnvironmentModel):
     id: Optional[str] = Field(None, alias="@id")
     dateTime: Optional[str] = None
     measure: Optional[str] = None
@@ -0,0 +1,435 @@
+"""
+Structured per-request instrumentation for the clients.
+
+Every client accepts `instrument=` (and `verbose=True` installs a `LoggingInstrument`).
+For each request a `RequestMetrics` record is filled in and handed to the instrument
+in three steps:
+
+- `on_request(metrics)` when the request is about to be sent;
+- `on_response(metrics)` once the body has been downloaded, with `connect`, `ttfb`
+  (time to response headers), `download` and `bytes_received` set;
+- `on_parsed(metrics)` after a list method has parsed the body, with `decode`,
+  `validate` and `items` set. When the body is validated straight from bytes in one
+  pass, the combined time is reported as `validate` and `decode` stays 0.
+
+A plain function can stand in for an instrument; it is called with the metrics of
+each completed response, like `on_response`.
+
+Connection timings come from httpx's `trace` extension and are 0 when a pooled
+connection is reused (or the transport does not emit trace events). Requests are
+grouped by `endpoint`, the URL path with identifier segments replaced by `{id}`.
+
+`PrometheusInstrument` and `OpenTelemetryInstrument` export the same figures as
+histograms and counters; they need `prometheus-client` or `opentelemetry-api`
+(`pip install environment-client[prometheus]` / `[opentelemetry]`).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Iterable, Sequence, Union
+
+import httpx
+
+METRICS_EXTENSION = "environment.metrics"
+
+_ID_SEGMENT = re.compile(r"^([^.]*\d[^.]*)(\.(json|csv))?$")
+
+
+def endpoint_template(path: str) -> str:
+    """Returns `path` with segments that contain digits replaced by `{id}`."""
+    return "/".join(
+        _ID_SEGMENT.sub(lambda match: "{id}" + (match.group(2) or ""), segment)
+        for segment in path.split("/")
+    )
+
+
+class RequestMetrics:
+    """
+    Timings (in seconds), sizes and counts for one request.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "endpoint",
+        "status_code",
+        "http_version",
+        "started",
+        "connect",
+        "ttfb",
+        "download",
+        "decode",
+        "validate",
+        "bytes_received",
+        "items",
+        "_marks",
+        "_hooks",
+    )
+
+    def __init__(self, method: str, url: str, endpoint: str):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.status_code: int | None = None
+        self.http_version: str | None = None
+        self.started = time.perf_counter()
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.download = 0.0
+        self.decode = 0.0
+        self.validate = 0.0
+        self.bytes_received = 0
+        self.items: int | None = None
+        self._marks: dict[str, float] = {}
+        self._hooks: _Hooks | None = None
+
+    @property
+    def total(self) -> float:
+        """Time from sending the request to the end of parsing."""
+        return self.ttfb + self.download + self.decode + self.validate
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the metrics as a plain dict, e.g. for structured logging."""
+        data = {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+        del data["started"]
+        data["total"] = self.total
+        return data
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestMetrics({self.method} {self.endpoint} status={self.status_code} "
+            f"total={self.total:.3f}s bytes={self.bytes_received} items={self.items})"
+        )
+
+    def _trace(self, event: str) -> None:
+        now = time.perf_counter()
+        name, _, phase = event.rpartition(".")
+        if phase == "started":
+            self._marks[name] = now
+        elif phase == "complete" and name in self._marks:
+            elapsed = now - self._marks.pop(name)
+            if name in ("connection.connect_tcp", "connection.connect_unix_socket", "connection.start_tls"):
+                self.connect += elapsed
+            elif name.endswith("receive_response_headers"):
+                self.ttfb = now - self.started
+
+    def record_parse(self, decode: float = 0.0, validate: float = 0.0, items: int | None = None) -> None:
+        """Adds parse timings and the item count."""
+        self.decode += decode
+        self.validate += validate
+        if items is not None:
+            self.items = items
+
+
+class Instrument:
+    """
+    The instrumentation callback protocol. Subclass it and override any of the methods.
+    """
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        """Called before a request is sent."""
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        """Called once a response body has been fully received (or the response closed)."""
+
+    def on_parsed(self, metrics: RequestMetrics) -> None:
+        """Called after a list method has decoded and validated a response."""
+
+
+class _CallbackInstrument(Instrument):
+    """Adapts a plain `callback(metrics)` function, called once per completed response."""
+
+    def __init__(self, callback: Callable[[RequestMetrics], Any]):
+        self.callback = callback
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        self.callback(metrics)
+
+
+InstrumentLike = Union[Instrument, Callable[[RequestMetrics], Any]]
+
+
+class LoggingInstrument(Instrument):
+    """
+    Logs each request and its timings to the `environment` logger.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO):
+        """
+        Initializes the instrument.
+
+        Args:
+            logger (logging.Logger, optional): Where to log. Defaults to the `environment` logger.
+            level (int, optional): Log level of the messages. Defaults to `logging.INFO`.
+        """
+        self.logger = logger or logging.getLogger("environment")
+        self.level = level
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        self.logger.log(self.level, ">>> Request: %s %s", metrics.method, metrics.url)
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        self.logger.log(
+            self.level,
+            "<<< Response: %s %s (connect=%.3fs ttfb=%.3fs download=%.3fs bytes=%d)",
+            metrics.status_code,
+            metrics.url,
+            metrics.connect,
+            metrics.ttfb,
+            metrics.download,
+            metrics.bytes_received,
+            extra={"metrics": metrics.as_dict()},
+        )
+
+    def on_parsed(self, metrics: RequestMetrics) -> None:
+        self.logger.log(
+            self.level,
+            "=== Parsed: %s %s (decode=%.3fs validate=%.3fs items=%s)",
+            metrics.method,
+            metrics.endpoint,
+            metrics.decode,
+            metrics.validate,
+            metrics.items,
+            extra={"metrics": metrics.as_dict()},
+        )
+
+
+def verbose_instrument() -> LoggingInstrument:
+    """
+    Returns the instrument installed by `verbose=True`.
+
+    It logs at INFO to the `environment` logger and leaves logging configuration to the
+    application; enable the output with e.g. `logging.basicConfig(level=logging.INFO)`.
+    """
+    return LoggingInstrument(logging.getLogger("environment"))
+
+
+class PrometheusInstrument(Instrument):
+    """
+    Exports request metrics to Prometheus. Requires `prometheus-client`.
+    """
+
+    def __init__(self, registry: Any = None, prefix: str = "environment"):
+        """
+        Initializes the instrument, registering its metrics.
+
+        Args:
+            registry (prometheus_client.CollectorRegistry, optional): Where to register the metrics.
+                Defaults to the global registry.
+            prefix (str, optional): Metric name prefix. Defaults to "environment".
+        """
+        try:
+            from prometheus_client import REGISTRY, Counter, Histogram
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise ImportError("PrometheusInstrument requires prometheus-client") from exc
+        registry = registry if registry is not None else REGISTRY
+        labels = ("method", "endpoint", "status")
+        self.phases = Histogram(
+            f"{prefix}_request_phase_seconds",
+            "Time spent per request phase",
+            labels + ("phase",),
+            registry=registry,
+        )
+        self.bytes = Counter(
+            f"{prefix}_response_bytes", "Response bytes received", labels, registry=registry
+        )
+        self.items = Counter(
+            f"{prefix}_response_items", "Items parsed from responses", labels, registry=registry
+        )
+
+    def _labels(self, metrics: RequestMetrics) -> tuple[str, str, str]:
+        return metrics.method, metrics.endpoint, str(metrics.status_code)
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        labels = self._labels(metrics)
+        for phase in ("connect", "ttfb", "download"):
+            self.phases.labels(*labels, phase).observe(getattr(metrics, phase))
+        self.bytes.labels(*labels).inc(metrics.bytes_received)
+
+    def on_parsed(self, metrics: RequestMetrics) -> None:
+        labels = self._labels(metrics)
+        for phase in ("decode", "validate"):
+            self.phases.labels(*labels, phase).observe(getattr(metrics, phase))
+        if metrics.items is not None:
+            self.items.labels(*labels).inc(metrics.items)
+
+
+class OpenTelemetryInstrument(Instrument):
+    """
+    Exports request metrics through the OpenTelemetry metrics API. Requires `opentelemetry-api`.
+    """
+
+    def __init__(self, meter: Any = None):
+        """
+        Initializes the instrument.
+
+        Args:
+            meter (opentelemetry.metrics.Meter, optional): The meter to record with.
+                Defaults to `metrics.get_meter("environment")`.
+        """
+        try:
+            from opentelemetry import metrics as otel_metrics
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise ImportError("OpenTelemetryInstrument requires opentelemetry-api") from exc
+        meter = meter if meter is not None else otel_metrics.get_meter("environment")
+        self.phases = meter.create_histogram(
+            "environment.request.phase.duration", unit="s", description="Time spent per request phase"
+        )
+        self.bytes = meter.create_counter(
+            "environment.response.bytes", unit="By", description="Response bytes received"
+        )
+        self.items = meter.create_counter(
+            "environment.response.items", description="Items parsed from responses"
+        )
+
+    def _attributes(self, metrics: RequestMetrics) -> dict[str, Any]:
+        return {
+            "http.request.method": metrics.method,
+            "url.template": metrics.endpoint,
+            "http.response.status_code": metrics.status_code or 0,
+        }
+
+    def on_response(self, metrics: RequestMetrics) -> None:
+        attributes = self._attributes(metrics)
+        for phase in ("connect", "ttfb", "download"):
+            self.phases.record(getattr(metrics, phase), {**attributes, "phase": phase})
+        self.bytes.add(metrics.bytes_received, attributes)
+
+    def on_parsed(self, metrics: RequestMetrics) -> None:
+        attributes = self._attributes(metrics)
+        for phase in ("decode", "validate"):
+            self.phases.record(getattr(metrics, phase), {**attributes, "phase": phase})
+        if metrics.items is not None:
+            self.items.add(metrics.items, attributes)
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """Counts response bytes and download time, then reports the response once."""
+
+    def __init__(self, stream: Any, metrics: RequestMetrics, hooks: _Hooks):
+        self._stream = stream
+        self._metrics = metrics
+        self._hooks = hooks
+        self._first_byte: float | None = None
+        self._reported = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self._first_byte = time.perf_counter()
+        async for chunk in self._stream:
+            self._metrics.bytes_received += len(chunk)
+            yield chunk
+        self._report()
+
+    def _report(self) -> None:
+        if self._reported:
+            return
+        self._reported = True
+        if self._first_byte is not None:
+            self._metrics.download = time.perf_counter() - self._first_byte
+        self._hooks.emit("on_response", self._metrics)
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+        self._report()
+
+
+class _Hooks:
+    """The request/response event hooks that feed a client's instruments."""
+
+    def __init__(self, instruments: Sequence[Instrument]):
+        self.instruments = list(instruments)
+
+    def emit(self, event: str, metrics: RequestMetrics) -> None:
+        for instrument in self.instruments:
+            # Duck-typed instruments may implement only some of the callbacks.
+            callback = getattr(instrument, event, None)
+            if callback is not None:
+                callback(metrics)
+
+    async def on_request(self, request: httpx.Request) -> None:
+        metrics = RequestMetrics(request.method, str(request.url), endpoint_template(request.url.path))
+        metrics._hooks = self
+        request.extensions[METRICS_EXTENSION] = metrics
+        previous = request.extensions.get("trace")
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            metrics._trace(event)
+            if previous is not None:
+                await previous(event, info)
+
+        request.extensions["trace"] = trace
+        self.emit("on_request", metrics)
+
+    async def on_response(self, response: httpx.Response) -> None:
+        metrics = response.request.extensions.get(METRICS_EXTENSION)
+        if metrics is None:
+            return
+        metrics.status_code = response.status_code
+        metrics.http_version = response.http_version
+        if not metrics.ttfb:
+            metrics.ttfb = time.perf_counter() - metrics.started
+        try:
+            # Responses built from in-memory content (e.g. by a mock transport) are already read.
+            content = response.content
+        except httpx.ResponseNotRead:
+            response.stream = _MeteredStream(response.stream, metrics, self)
+        else:
+            metrics.bytes_received = len(content)
+            self.emit("on_response", metrics)
+
+
+def _as_instrument(instrument: Any) -> Any:
+    if isinstance(instrument, Instrument) or not callable(instrument):
+        return instrument
+    return _CallbackInstrument(instrument)
+
+
+def install(
+    client: httpx.AsyncClient,
+    instrument: InstrumentLike | Iterable[InstrumentLike] | None,
+    verbose: bool,
+) -> None:
+    """
+    Adds one request hook and one response hook feeding `instrument` (and, if `verbose`,
+    a `LoggingInstrument`) to a client.
+
+    Args:
+        client (httpx.AsyncClient): The client to instrument.
+        instrument (Instrument | Callable | Iterable, optional): The instrument(s) to notify. A plain
+            callable is called with the `RequestMetrics` of each completed response.
+        verbose (bool): If True, also logs every request via `verbose_instrument()`.
+    """
+    if instrument is None:
+        instruments = []
+    elif isinstance(instrument, Instrument) or not isinstance(instrument, Iterable):
+        instruments = [_as_instrument(instrument)]
+    else:
+        instruments = [_as_instrument(item) for item in instrument]
+    if verbose:
+        instruments.append(verbose_instrument())
+    if not instruments:
+        return
+    hooks = _Hooks(instruments)
+    client.event_hooks["request"].append(hooks.on_request)
+    client.event_hooks["response"].append(hooks.on_response)
+
+
+def request_metrics(response: httpx.Response) -> RequestMetrics | None:
+    """Returns the metrics being collected for a response, if its client is instrumented."""
+    try:
+        request = response.request
+    except RuntimeError:
+        return None
+    return request.extensions.get(METRICS_EXTENSION)
+
+
+def report_parsed(response: httpx.Response | None) -> None:
+    """Notifies the response's instruments that parsing has finished."""
+    if response is None:
+        return
+    metrics = request_metrics(response)
+    if metrics is not None and metrics._hooks is not None:
+        metrics._hooks.emit("on_parsed", metrics)
@@ -1,33 +1,42 @@
-from .client import PublicRegisterClient
-from .models import (
-    PublicRegisterModel,
-    Metadata,
-    Register,
-    Holder,
-    HolderSummary,
-    HolderTypeReference,
-    HolderDetail,
-    PostcodeReference,
-    Address,
-    AddressSummary,
-    AddressDetail,
-    Site,
-    SiteLocation,
-    SiteDetail,
-    RegistrationType,
-    LocalAuthority,
-    Tier,
-    RDFType,
-    GenericRegistration,
-    GenericRegistrationSummary,
-    GenericRegistrationDetail,
-    RegistrationSummary,
-    RegistrationDetail,
-    RegistrationSearchResponse,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import PublicRegisterClient
+    from .completion import CompletionCache
+    from .index import LocalRegisterIndex
+    from .models import (
+        PublicRegisterModel,
+        Metadata,
+        Register,
+        Holder,
+        HolderSummary,
+        HolderTypeReference,
+        HolderDetail,
+        PostcodeReference,
+        Address,
+        AddressSummary,
+        AddressDetail,
+        Site,
+        SiteLocation,
+        SiteDetail,
+        RegistrationType,
+        LocalAuthority,
+        Tier,
+        RDFType,
+        GenericRegistration,
+        GenericRegistrationSummary,
+        GenericRegistrationDetail,
+        RegistrationSummary,
+        RegistrationDetail,
+        RegistrationSearchResponse,
+    )
 
 __all__ = [
     "PublicRegisterClient",
+    "LocalRegisterIndex",
+    "CompletionCache",
     "PublicRegisterModel",
     "Metadata",
     "Register",
@@ -52,4 +61,37 @@ __all__ = [
     "RegistrationSummary",
     "RegistrationDetail",
     "RegistrationSearchResponse",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PublicRegisterClient": ".client",
+        "LocalRegisterIndex": ".index",
+        "CompletionCache": ".completion",
+        "PublicRegisterModel": ".models",
+        "Metadata": ".models",
+        "Register": ".models",
+        "Holder": ".models",
+        "HolderSummary": ".models",
+        "HolderTypeReference": ".models",
+        "HolderDetail": ".models",
+        "PostcodeReference": ".models",
+        "Address": ".models",
+        "AddressSummary": ".models",
+        "AddressDetail": ".models",
+        "Site": ".models",
+        "SiteLocation": ".models",
+        "SiteDetail": ".models",
+        "RegistrationType": ".models",
+        "LocalAuthority": ".models",
+        "Tier": ".models",
+        "RDFType": ".models",
+        "GenericRegistration": ".models",
+        "GenericRegistrationSummary": ".models",
+        "GenericRegistrationDetail": ".models",
+        "RegistrationSummary": ".models",
+        "RegistrationDetail": ".models",
+        "RegistrationSearchResponse": ".models",
+    },
+)
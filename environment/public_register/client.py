@@ -1,14 +1,49 @@
 from __future__ import annotations
 
+import heapq
+import math
+import os
 import httpx
-from typing import Any, Dict, List, Optional, Union
-
+from typing import IO, Any, AsyncIterator, Dict, Iterable, List, MutableMapping, Optional, Sequence, Tuple, Union
+
+from .._bulk import gather_keyed
+from .._csv import aiter_csv_rows
+from .._paging import iter_offset_pages
+from ..coalesce import SingleFlight, coalesced
+from ..instrumentation import install
+from .completion import CompletionCache
 from .models import (
     RegistrationSearchResponse,
     RegistrationSummary,
     RegistrationDetail,
 )
 
+# Register slugs accepted by `stream_download` and `iter_download_rows`; each is
+# exported as CSV at `/downloads/{register}`.
+DOWNLOAD_REGISTERS = (
+    "waste-operations",
+    "end-of-life-vehicles",
+    "industrial-installations",
+    "water-discharges",
+    "radioactive-substance",
+    "waste-carriers-brokers",
+    "waste-exemptions",
+    "water-discharge-exemptions",
+    "scrap-metal-dealers",
+    "enforcement-action",
+    "flood-risk-exemptions",
+)
+
+# Register slugs accepted by `search_registers`, `iter_search` and
+# `get_registrations_by_ids`; each is searchable at `/{register}/registration.json`.
+SEARCH_REGISTERS = DOWNLOAD_REGISTERS
+
+# Sort keys for merging per-register results in `iter_search_registers`.
+_ORDERINGS = {
+    "distance": lambda item: item.distance if item.distance is not None else math.inf,
+    "name": lambda item: (item.holder.name or "").casefold() if item.holder else "",
+}
+
 
 class PublicRegisterClient(httpx.AsyncClient):
     """
@@ -28,31 +63,54 @@ class PublicRegisterClient(httpx.AsyncClient):
     - Flood Risk Exemptions
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        coalesce=False,
+        completion_cache=False,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
-        """
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            coalesce (bool | SingleFlight, optional): If True, identical concurrent `*_by_id`
+                calls share one request and parsed result. Pass a `SingleFlight(ttl=...)` to also
+                memoise results briefly or to share it between clients. Defaults to False.
+            completion_cache (bool | CompletionCache, optional): If True, `get_completion` results
+                are cached in a prefix trie and longer queries are filtered locally when possible.
+                Pass a `CompletionCache(ttl=..., max_entries=...)` to configure it or to share it
+                between clients. Defaults to False.
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
+        """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk/public-register")
         super().__init__(
-            base_url="https://environment.data.gov.uk/public-register",
             timeout=timeout,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(self._log_request)
-            self.event_hooks["response"].append(self._log_response)
-
-    def _log_request(self, request: httpx.Request) -> None:
-        """Log the request details."""
-        print(f"Request: {request.method} {request.url}")
-
-    def _log_response(self, response: httpx.Response) -> None:
-        """Log the response details."""
-        print(f"Response: {response.status_code} {response.url}")
+        if isinstance(coalesce, SingleFlight):
+            self.single_flight = coalesce
+        else:
+            self.single_flight = SingleFlight() if coalesce else None
+        if isinstance(completion_cache, CompletionCache):
+            self.completion_cache = completion_cache
+        else:
+            self.completion_cache = CompletionCache() if completion_cache else None
+        install(self, instrument, verbose)
 
     async def search_all_registers(
         self,
@@ -123,6 +181,9 @@ class PublicRegisterClient(httpx.AsyncClient):
         """
         Get text completion suggestions for names or registration numbers.
 
+        With `completion_cache` enabled, cached suggestions are returned without a request,
+        including for longer queries whose matches a shorter cached query already covered.
+
         Args:
             query: Partial text to complete
             limit: Maximum number of suggestions to return
@@ -131,6 +192,12 @@ class PublicRegisterClient(httpx.AsyncClient):
         Returns:
             List[str]: List of completion suggestions
         """
+        cache = self.completion_cache
+        if cache is not None:
+            cached = cache.get(query, limit, params)
+            if cached is not None:
+                return cached
+
         completion_params = {
             "q": query,
             "_limit": limit,
@@ -139,7 +206,10 @@ class PublicRegisterClient(httpx.AsyncClient):
         
         response = await self.get("/api/completion.json", params=completion_params)
         response.raise_for_status()
-        return response.json()
+        suggestions = response.json()
+        if cache is not None:
+            cache.put(query, limit, suggestions, params)
+        return suggestions
 
     async def get_waste_operations(
         self,
@@ -201,6 +271,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_waste_operation_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific waste operation registration.
@@ -276,6 +347,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_end_of_life_vehicle_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific end of life vehicle registration.
@@ -351,6 +423,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_industrial_installation_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific industrial installation registration.
@@ -426,6 +499,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_water_discharge_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific water discharge registration.
@@ -501,6 +575,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_radioactive_substance_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific radioactive substance registration.
@@ -576,6 +651,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_waste_carrier_broker_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific waste carrier or broker registration.
@@ -651,6 +727,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_waste_exemption_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific waste exemption registration.
@@ -726,6 +803,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_water_discharge_exemption_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific water discharge exemption registration.
@@ -801,6 +879,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_scrap_metal_dealer_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific scrap metal dealer registration.
@@ -876,6 +955,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_enforcement_action_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific enforcement action registration.
@@ -951,6 +1031,7 @@ class PublicRegisterClient(httpx.AsyncClient):
         response.raise_for_status()
         return RegistrationSearchResponse(**response.json())
 
+    @coalesced
     async def get_flood_risk_exemption_by_id(self, registration_id: str) -> RegistrationDetail:
         """
         Get details of a specific flood risk exemption registration.
@@ -1119,4 +1200,404 @@ class PublicRegisterClient(httpx.AsyncClient):
         """
         response = await self.get("/downloads/flood-risk-exemptions", params=params)
         response.raise_for_status()
-        return response.content
\ No newline at end of file
+        return response.content
+
+    def _download_path(self, register: str) -> str:
+        if register not in DOWNLOAD_REGISTERS:
+            raise ValueError(
+                f"Unknown register {register!r}; expected one of {', '.join(DOWNLOAD_REGISTERS)}"
+            )
+        return f"/downloads/{register}"
+
+    async def stream_download(
+        self,
+        register: str,
+        destination: Union[str, os.PathLike, IO[bytes]],
+        chunk_size: int = 64 * 1024,
+        **params
+    ) -> int:
+        """
+        Stream a register's CSV export to a file without holding it in memory.
+
+        Args:
+            register: Register slug, e.g. "waste-carriers-brokers" (see `DOWNLOAD_REGISTERS`)
+            destination: File path, or a binary file object opened for writing
+            chunk_size: Size of the chunks written, in bytes
+            **params: Additional query parameters
+
+        Returns:
+            int: Number of bytes written
+        """
+        path = self._download_path(register)
+        written = 0
+        async with self.stream("GET", path, params=params) as response:
+            response.raise_for_status()
+            if isinstance(destination, (str, os.PathLike)):
+                with open(destination, "wb") as file:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        written += file.write(chunk)
+            else:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    written += destination.write(chunk)
+        return written
+
+    async def iter_download_rows(
+        self, register: str, **params
+    ) -> AsyncIterator[Dict[str, str]]:
+        """
+        Parse a register's CSV export row by row as it downloads.
+
+        Args:
+            register: Register slug, e.g. "waste-operations" (see `DOWNLOAD_REGISTERS`)
+            **params: Additional query parameters
+
+        Yields:
+            Dict[str, str]: Each row, keyed by the CSV header
+        """
+        path = self._download_path(register)
+        async with self.stream("GET", path, params=params) as response:
+            response.raise_for_status()
+            rows = aiter_csv_rows(response.aiter_bytes())
+            header = await anext(rows, None)
+            if header is None:
+                return
+            columns = [name.strip() for name in header]
+            async for row in rows:
+                yield dict(zip(columns, row))
+
+    @staticmethod
+    def _search_params(
+        name_search: Optional[str],
+        number_search: Optional[str],
+        name_number_search: Optional[str],
+        address_search: Optional[str],
+        easting: Optional[float],
+        northing: Optional[float],
+        dist: Optional[float],
+        local_authority: Optional[str],
+        exact_name: Optional[str],
+        registration_number: Optional[str],
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        search_params = {
+            "name-search": name_search,
+            "number-search": number_search,
+            "name-number-search": name_number_search,
+            "address-search": address_search,
+            "easting": easting,
+            "northing": northing,
+            "dist": dist,
+            "local-authority": local_authority,
+            "name": exact_name,
+            "registration-number": registration_number,
+        }
+        search_params = {k: v for k, v in search_params.items() if v is not None}
+        search_params.update(params)
+        return search_params
+
+    def _iter_search_pages(
+        self,
+        register: Optional[str],
+        search_params: Dict[str, Any],
+        page_size: int,
+        offset: int = 0,
+        prefetch: bool = True,
+    ) -> AsyncIterator[List[RegistrationSummary]]:
+        if register is None:
+            path = "/api/search.json"
+        elif register in SEARCH_REGISTERS:
+            path = f"/{register}/registration.json"
+        else:
+            raise ValueError(
+                f"Unknown register {register!r}; expected one of {', '.join(SEARCH_REGISTERS)}"
+            )
+
+        async def fetch_page(limit: int, offset: int) -> List[RegistrationSummary]:
+            response = await self.get(
+                path, params={**search_params, "_limit": limit, "_offset": offset}
+            )
+            response.raise_for_status()
+            return RegistrationSearchResponse(**response.json()).items
+
+        return iter_offset_pages(fetch_page, page_size, offset=offset, prefetch=prefetch)
+
+    async def iter_search(
+        self,
+        register: Optional[str] = None,
+        name_search: Optional[str] = None,
+        number_search: Optional[str] = None,
+        name_number_search: Optional[str] = None,
+        address_search: Optional[str] = None,
+        easting: Optional[float] = None,
+        northing: Optional[float] = None,
+        dist: Optional[float] = None,
+        local_authority: Optional[str] = None,
+        offset: Optional[int] = None,
+        exact_name: Optional[str] = None,
+        registration_number: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        **params
+    ) -> AsyncIterator[RegistrationSummary]:
+        """
+        Iterate over every matching registration, walking the `_limit`/`_offset` pages.
+
+        Registrations are held in memory one page at a time. With `prefetch` enabled, the
+        next page is requested while the caller consumes the current one. Iteration stops
+        at the first page holding fewer than `page_size` results.
+
+        Args:
+            register: Register slug to search (see `SEARCH_REGISTERS`), or None to page through
+                `search_all_registers`
+            name_search: Full or partial name of the business or individual registered
+            number_search: The full or partial ID of a registration or permit
+            name_number_search: Search for records where either name or registration number matches
+            address_search: Full or partial address of the business or individual registered
+            easting: Easting coordinate for location-based search
+            northing: Northing coordinate for location-based search
+            dist: Distance in kilometers from the specified coordinates
+            local_authority: Local authority name for filtering
+            offset: Number of results to skip before the first page
+            exact_name: Exact name match
+            registration_number: Specific registration number
+            page_size: Number of results requested per page
+            prefetch: If True, fetches the next page ahead of time
+            **params: Additional query parameters; `_limit` is ignored
+
+        Yields:
+            RegistrationSummary: Each matching registration, in the order returned by the API
+        """
+        params.pop("_limit", None)
+        start = int(params.pop("_offset", offset or 0))
+        search_params = self._search_params(
+            name_search, number_search, name_number_search, address_search, easting,
+            northing, dist, local_authority, exact_name, registration_number, params,
+        )
+        async for page in self._iter_search_pages(
+            register, search_params, page_size, offset=start, prefetch=prefetch
+        ):
+            for item in page:
+                yield item
+
+    async def iter_search_registers(
+        self,
+        registers: Optional[Sequence[str]] = None,
+        name_search: Optional[str] = None,
+        number_search: Optional[str] = None,
+        name_number_search: Optional[str] = None,
+        address_search: Optional[str] = None,
+        easting: Optional[float] = None,
+        northing: Optional[float] = None,
+        dist: Optional[float] = None,
+        local_authority: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        exact_name: Optional[str] = None,
+        registration_number: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: int = 100,
+        max_concurrency: int = 8,
+        **params
+    ) -> AsyncIterator[RegistrationSummary]:
+        """
+        Search several registers concurrently and iterate over the merged results.
+
+        The first page of every register is requested at once. A register's next page is
+        only requested once the merged iteration has used up its current page, so a `limit`
+        met from the first pages costs one request per register. Each page is sorted by `order_by`
+        before merging; the merged order is global when the registers themselves return
+        results in that order.
+
+        Args:
+            registers: Register slugs to search (see `SEARCH_REGISTERS`). Defaults to all of them
+            name_search: Full or partial name of the business or individual registered
+            number_search: The full or partial ID of a registration or permit
+            name_number_search: Search for records where either name or registration number matches
+            address_search: Full or partial address of the business or individual registered
+            easting: Easting coordinate for location-based search
+            northing: Northing coordinate for location-based search
+            dist: Distance in kilometers from the specified coordinates
+            local_authority: Local authority name for filtering
+            limit: Maximum number of merged results to yield. Defaults to all of them
+            offset: Number of merged results to skip
+            exact_name: Exact name match
+            registration_number: Specific registration number
+            order_by: "distance" or "name" to merge by that key; None yields the registers in order
+            page_size: Number of results requested per register page
+            max_concurrency: Maximum number of first-page requests in flight at once
+            **params: Additional query parameters applied to every register
+
+        Yields:
+            RegistrationSummary: Each matching registration, in merged order
+        """
+        if order_by is not None and order_by not in _ORDERINGS:
+            raise ValueError(f"order_by must be one of {', '.join(_ORDERINGS)} or None")
+        registers = list(dict.fromkeys(registers if registers is not None else SEARCH_REGISTERS))
+        search_params = self._search_params(
+            name_search, number_search, name_number_search, address_search, easting,
+            northing, dist, local_authority, exact_name, registration_number, params,
+        )
+        skip = offset or 0
+        if limit is not None:
+            if limit <= 0:
+                return
+            # No register can contribute more than the whole requested window.
+            page_size = min(page_size, skip + limit)
+        pages = {
+            register: self._iter_search_pages(register, search_params, page_size, prefetch=False)
+            for register in registers
+        }
+        sort_key = _ORDERINGS.get(order_by) if order_by else None
+
+        async def first_page(register: str) -> List[RegistrationSummary]:
+            return await anext(pages[register], [])
+
+        try:
+            heads = await gather_keyed(registers, first_page, max_concurrency)
+            for result in heads.values():
+                if isinstance(result, Exception):
+                    raise result
+
+            # Heap entries: (key, register position, item position, item, remaining items of the page).
+            heap = []
+
+            def push(index: int, page: List[RegistrationSummary]) -> None:
+                if sort_key is not None:
+                    page = sorted(page, key=sort_key)
+                items = iter(enumerate(page))
+                position, item = next(items)
+                key = sort_key(item) if sort_key is not None else 0
+                heapq.heappush(heap, (key, index, position, item, items))
+
+            for index, register in enumerate(registers):
+                if heads[register]:
+                    push(index, heads[register])
+
+            yielded = 0
+            # A register whose page ran out is refilled just before the next item is
+            # chosen, so nothing is requested once `limit` has been reached.
+            exhausted: Optional[int] = None
+            while True:
+                if exhausted is not None:
+                    page = await anext(pages[registers[exhausted]], [])
+                    if page:
+                        push(exhausted, page)
+                    exhausted = None
+                if not heap:
+                    return
+                _, index, _, item, items = heap[0]
+                following = next(items, None)
+                if following is not None:
+                    position, head = following
+                    key = sort_key(head) if sort_key is not None else 0
+                    heapq.heapreplace(heap, (key, index, position, head, items))
+                else:
+                    heapq.heappop(heap)
+                    exhausted = index
+                if skip:
+                    skip -= 1
+                    continue
+                yield item
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+        finally:
+            for iterator in pages.values():
+                await iterator.aclose()
+
+    async def search_registers(
+        self,
+        registers: Optional[Sequence[str]] = None,
+        name_search: Optional[str] = None,
+        number_search: Optional[str] = None,
+        name_number_search: Optional[str] = None,
+        address_search: Optional[str] = None,
+        easting: Optional[float] = None,
+        northing: Optional[float] = None,
+        dist: Optional[float] = None,
+        local_authority: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        exact_name: Optional[str] = None,
+        registration_number: Optional[str] = None,
+        order_by: Optional[str] = None,
+        page_size: int = 100,
+        max_concurrency: int = 8,
+        **params
+    ) -> List[RegistrationSummary]:
+        """
+        Search several registers concurrently and merge the results.
+
+        Unlike `search_all_registers`, this queries each register's own search endpoint,
+        so the elapsed time is that of the slowest register rather than the sum of them.
+        See `iter_search_registers` for the arguments.
+
+        Returns:
+            List[RegistrationSummary]: The merged results, at most `limit` of them
+        """
+        return [
+            item
+            async for item in self.iter_search_registers(
+                registers,
+                name_search=name_search,
+                number_search=number_search,
+                name_number_search=name_number_search,
+                address_search=address_search,
+                easting=easting,
+                northing=northing,
+                dist=dist,
+                local_authority=local_authority,
+                limit=limit,
+                offset=offset,
+                exact_name=exact_name,
+                registration_number=registration_number,
+                order_by=order_by,
+                page_size=page_size,
+                max_concurrency=max_concurrency,
+                **params,
+            )
+        ]
+
+    async def get_registrations_by_ids(
+        self,
+        register: str,
+        registration_ids: Iterable[str],
+        max_concurrency: int = 8,
+        cache: Optional[MutableMapping[Tuple[str, str], RegistrationDetail]] = None,
+    ) -> Dict[str, Union[RegistrationDetail, Exception]]:
+        """
+        Get details of many registrations in one register, fetching them concurrently.
+
+        One `/{register}/registration/{id}.json` request is issued per registration over the
+        client's connection pool, with at most `max_concurrency` in flight. A failing
+        registration (e.g. a 404) does not affect the others.
+
+        Args:
+            register: Register slug, e.g. "water-discharges" (see `SEARCH_REGISTERS`)
+            registration_ids: IDs of the registrations. Duplicates are fetched once
+            max_concurrency: Maximum number of concurrent requests
+            cache: Mapping of `(register, registration_id)` to details. Cached registrations are
+                not requested, and fetched ones are stored in it
+
+        Returns:
+            Dict[str, Union[RegistrationDetail, Exception]]: Details keyed by registration ID in
+            input order, or the exception raised for that registration
+        """
+        if register not in SEARCH_REGISTERS:
+            raise ValueError(
+                f"Unknown register {register!r}; expected one of {', '.join(SEARCH_REGISTERS)}"
+            )
+
+        async def fetch(registration_id: str) -> RegistrationDetail:
+            if cache is not None:
+                cached = cache.get((register, registration_id))
+                if cached is not None:
+                    return cached
+            response = await self.get(f"/{register}/registration/{registration_id}.json")
+            response.raise_for_status()
+            detail = RegistrationDetail(**response.json()["items"][0])
+            if cache is not None:
+                cache[(register, registration_id)] = detail
+            return detail
+
+        return await gather_keyed(registration_ids, fetch, max_concurrency)
@@ -0,0 +1,222 @@
+"""
+A prefix-trie cache for `PublicRegisterClient.get_completion`.
+
+Type-ahead asks for completions of "Thames", then "Thames W", then "Thames Wa".
+Each longer prefix can only match a subset of what the shorter one matched, so
+once a shorter prefix has returned fewer suggestions than its `limit` (i.e. every
+match the API knows of), the longer queries are answered by filtering those
+suggestions locally instead of calling the API again:
+
+    async with PublicRegisterClient(completion_cache=True) as client:
+        await client.get_completion("Thames", limit=20)      # requested
+        await client.get_completion("Thames Wa", limit=20)   # filtered locally
+
+Narrowing follows the API's matching rules: without `infix` names and numbers match
+from the start of a word, with `infix` any substring matches, and a term ending in a
+numeral is an exact match rather than a prefix, so results for (or narrowed to) such a
+term are only ever reused for that same term.
+
+Cached results are kept in a trie of case-folded queries, one trie per set of extra
+query parameters. Entries expire after `ttl` seconds, and the least recently used
+ones are evicted beyond `max_entries`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Mapping, NamedTuple
+
+
+def word_prefix_match(query: str, suggestion: str) -> bool:
+    """Returns True if the case-folded `query` starts the suggestion or one of its words."""
+    query = query.casefold()
+    suggestion = suggestion.casefold()
+    start = suggestion.find(query)
+    while start != -1:
+        if start == 0 or not suggestion[start - 1].isalnum():
+            return True
+        start = suggestion.find(query, start + 1)
+    return False
+
+
+def substring_match(query: str, suggestion: str) -> bool:
+    """Returns True if the case-folded `query` occurs anywhere in the suggestion, as with `infix`."""
+    return query.casefold() in suggestion.casefold()
+
+
+class _Entry(NamedTuple):
+    expires: float
+    limit: int | None
+    suggestions: list[str]
+
+    @property
+    def complete(self) -> bool:
+        """True when the API returned every match, so longer queries can be filtered locally."""
+        return self.limit is not None and len(self.suggestions) < self.limit
+
+
+class _Node:
+    __slots__ = ("children", "entry")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.entry: _Entry | None = None
+
+
+class CompletionCache:
+    """
+    Caches completion suggestions in a prefix trie, answering longer prefixes locally.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 1024,
+        matches: Callable[[str, str], bool] = word_prefix_match,
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            ttl (float, optional): Seconds cached suggestions stay valid. Defaults to 300.
+            max_entries (int, optional): Maximum number of cached queries. Defaults to 1024.
+            matches (Callable[[str, str], bool], optional): Decides whether a suggestion matches
+                a query when filtering locally. Defaults to `word_prefix_match`; requests with
+                `infix` always use `substring_match`.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.matches = matches
+        self.hits = 0
+        self.misses = 0
+        self._roots: dict[Hashable, _Node] = {}
+        self._lru: OrderedDict[tuple[Hashable, str], None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    @staticmethod
+    def _scope(params: Mapping[str, Any] | None) -> Hashable:
+        return tuple(sorted((key, str(value)) for key, value in (params or {}).items()))
+
+    def get(
+        self, query: str, limit: int | None = None, params: Mapping[str, Any] | None = None
+    ) -> list[str] | None:
+        """
+        Returns cached suggestions for `query`, or None if the API has to be asked.
+
+        An entry for the query itself is used if it holds at least `limit` suggestions or
+        every match. Otherwise the longest cached shorter prefix holding every match is
+        filtered with `matches` (or `substring_match` for `infix` requests), unless the
+        query or that prefix ends in a numeral.
+
+        Args:
+            query (str): The text being completed.
+            limit (int, optional): Maximum number of suggestions wanted.
+            params (Mapping[str, Any], optional): Other query parameters of the request.
+
+        Returns:
+            list[str] | None: The suggestions, or None on a miss.
+        """
+        scope = self._scope(params)
+        key = query.casefold()
+        node = self._roots.get(scope)
+        now = time.monotonic()
+        best: tuple[str, _Entry] | None = None
+        # Terms ending in a numeral are exact matches, so they neither narrow nor can be narrowed.
+        narrowable = not key[-1:].isdigit()
+        expired = []
+        depth = 0
+        while node is not None:
+            entry = node.entry
+            if entry is not None and entry.expires <= now:
+                expired.append(key[:depth])
+            elif entry is not None and depth == len(key):
+                if entry.complete or (
+                    limit is not None and entry.limit is not None and entry.limit >= limit
+                ) or (limit is None and entry.limit is None):
+                    best = (key, entry)
+            elif (
+                entry is not None
+                and entry.complete
+                and narrowable
+                and not key[depth - 1 : depth].isdigit()
+            ):
+                best = (key[:depth], entry)
+            if depth == len(key):
+                break
+            node = node.children.get(key[depth])
+            depth += 1
+
+        for prefix in expired:
+            self._discard(scope, prefix)
+        if best is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        prefix, entry = best
+        self._lru.move_to_end((scope, prefix))
+        suggestions = entry.suggestions
+        if prefix != key:
+            matches = substring_match if params and "infix" in params else self.matches
+            suggestions = [suggestion for suggestion in suggestions if matches(query, suggestion)]
+        return suggestions[:limit] if limit is not None else list(suggestions)
+
+    def put(
+        self,
+        query: str,
+        limit: int | None,
+        suggestions: list[str],
+        params: Mapping[str, Any] | None = None,
+    ) -> None:
+        """
+        Stores the suggestions the API returned for `query`.
+
+        Args:
+            query (str): The text that was completed.
+            limit (int, optional): The limit the API was asked for.
+            suggestions (list[str]): The suggestions returned.
+            params (Mapping[str, Any], optional): Other query parameters of the request.
+        """
+        scope = self._scope(params)
+        key = query.casefold()
+        node = self._roots.setdefault(scope, _Node())
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+        node.entry = _Entry(time.monotonic() + self.ttl, limit, list(suggestions))
+        self._lru[(scope, key)] = None
+        self._lru.move_to_end((scope, key))
+        while len(self._lru) > self.max_entries:
+            (old_scope, old_key), _ = self._lru.popitem(last=False)
+            self._discard(old_scope, old_key, tracked=False)
+
+    def _discard(self, scope: Hashable, key: str, tracked: bool = True) -> None:
+        root = self._roots.get(scope)
+        if root is None:
+            return
+        path = [root]
+        for char in key:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].entry = None
+        if tracked:
+            self._lru.pop((scope, key), None)
+        # Prune nodes left without an entry or children.
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.entry is not None or node.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+        if root.entry is None and not root.children:
+            del self._roots[scope]
+
+    def clear(self) -> None:
+        """Drops every cached suggestion."""
+        self._roots.clear()
+        self._lru.clear()
@@ -0,0 +1,508 @@
+"""
+A local, searchable index over Public Register CSV exports.
+
+`LocalRegisterIndex` is filled from the `/downloads/{register}` exports (streamed
+with `PublicRegisterClient.iter_download_rows`, or read from files saved with
+`stream_download`) and answers searches with the same filter vocabulary as
+`search_all_registers`, in memory:
+
+    index = LocalRegisterIndex()
+    await index.refresh_from_client(client, ["waste-operations", "waste-carriers-brokers"])
+    matches = index.search(name_search="recycling", local_authority="Leeds", limit=10)
+
+Text filters keep the API's substring semantics. Each field (holder name,
+registration number, address) has an inverted index from words to rows, plus a
+trigram index over its vocabulary: a query word is looked up by intersecting its
+trigrams to find the vocabulary words containing it, the rows holding those words
+are intersected across query words, and the surviving candidates are checked
+against the full text. Location filters reuse the grid from `environment.spatial`.
+
+Each row is keyed by register and registration number and remembered with a hash
+of its values, so a refresh only re-indexes rows that changed and drops rows that
+disappeared from the export.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import math
+import os
+import re
+from typing import Any, AsyncIterator, Iterable, Mapping, NamedTuple
+
+from ..spatial import PlanarGrid
+from .models import RegistrationSummary
+
+ROOT = "http://environment.data.gov.uk/public-register"
+
+# CSV header names recognised for each field, compared case- and punctuation-insensitively.
+DEFAULT_COLUMNS: dict[str, tuple[str, ...]] = {
+    "registration_number": ("Registration Number", "registrationNumber", "Permit Number", "Reference"),
+    "register": ("Register",),
+    "name": ("Holder Name", "Name", "Operator Name", "Company Name", "Holder"),
+    "address": ("Site Address", "Address", "Full Address"),
+    "postcode": ("Postcode", "Site Postcode"),
+    "local_authority": ("Local Authority", "localAuthority"),
+    "registration_date": ("Registration Date", "registrationDate", "Issued Date"),
+    "expiry_date": ("Expiry Date", "expiryDate"),
+    "easting": ("Easting", "Site Easting"),
+    "northing": ("Northing", "Site Northing"),
+}
+
+RegistrationKey = tuple[str, str]
+
+_TEXT_FIELDS = ("name", "number", "address")
+_NON_WORD = re.compile(r"[^a-z0-9]")
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _header_key(name: str) -> str:
+    return _NON_WORD.sub("", name.lower())
+
+
+class _Entry(NamedTuple):
+    key: RegistrationKey
+    row_hash: str
+    record: dict[str, Any]
+    text: dict[str, str]
+    local_authority: str
+    exact_name: str
+    point: tuple[float, float] | None
+
+
+class _TextIndex:
+    """Word postings plus a trigram index over the vocabulary, for substring queries."""
+
+    def __init__(self):
+        self.postings: dict[str, set[int]] = {}
+        self.trigrams: dict[str, set[str]] = {}
+
+    def add(self, row: int, text: str) -> None:
+        for word in set(text.split()):
+            rows = self.postings.get(word)
+            if rows is None:
+                rows = self.postings[word] = set()
+                for trigram in self._trigrams(word):
+                    self.trigrams.setdefault(trigram, set()).add(word)
+            rows.add(row)
+
+    def discard(self, row: int, text: str) -> None:
+        for word in set(text.split()):
+            rows = self.postings.get(word)
+            if rows is None:
+                continue
+            rows.discard(row)
+            if not rows:
+                del self.postings[word]
+                for trigram in self._trigrams(word):
+                    words = self.trigrams[trigram]
+                    words.discard(word)
+                    if not words:
+                        del self.trigrams[trigram]
+
+    @staticmethod
+    def _trigrams(word: str) -> set[str]:
+        return {word[index : index + 3] for index in range(len(word) - 2)}
+
+    def _words_containing(self, fragment: str) -> Iterable[str]:
+        if len(fragment) < 3:
+            return [word for word in self.postings if fragment in word]
+        words: set[str] | None = None
+        for trigram in sorted(self._trigrams(fragment), key=lambda t: len(self.trigrams.get(t, ()))):
+            found = self.trigrams.get(trigram)
+            if not found:
+                return []
+            words = set(found) if words is None else words & found
+            if not words:
+                return []
+        return [word for word in words if fragment in word]
+
+    def candidates(self, query: str) -> set[int]:
+        """Returns rows whose text may contain `query`; callers verify the full substring."""
+        result: set[int] | None = None
+        for fragment in sorted(set(query.split()), key=len, reverse=True):
+            rows: set[int] = set()
+            for word in self._words_containing(fragment):
+                rows |= self.postings[word]
+            result = rows if result is None else result & rows
+            if not result:
+                return set()
+        return result or set()
+
+
+class LocalRegisterIndex:
+    """
+    An in-memory search index over Public Register exports, keyed by register and registration number.
+    """
+
+    def __init__(self, columns: Mapping[str, Iterable[str]] | None = None, cell_metres: float = 5_000.0):
+        """
+        Initializes an empty index.
+
+        Args:
+            columns (Mapping[str, Iterable[str]], optional): CSV header names to recognise per field,
+                merged over `DEFAULT_COLUMNS`.
+            cell_metres (float, optional): Grid cell size for location searches. Defaults to 5,000.
+        """
+        self.columns = {field: tuple(names) for field, names in DEFAULT_COLUMNS.items()}
+        for field, names in (columns or {}).items():
+            self.columns[field] = tuple(names)
+        self._lookup = {
+            _header_key(name): field for field, names in self.columns.items() for name in names
+        }
+        self._rows: dict[int, _Entry] = {}
+        self._ids: dict[RegistrationKey, int] = {}
+        self._models: dict[int, RegistrationSummary] = {}
+        self._next_id = 0
+        self._text = {field: _TextIndex() for field in _TEXT_FIELDS}
+        self._by_authority: dict[str, set[int]] = {}
+        self._by_exact_name: dict[str, set[int]] = {}
+        self._by_number: dict[str, set[int]] = {}
+        self._by_register: dict[str, set[int]] = {}
+        self._grid = PlanarGrid(cell_metres)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: RegistrationKey) -> bool:
+        return key in self._ids
+
+    @property
+    def registers(self) -> set[str]:
+        """Registers with at least one indexed row."""
+        return set(self._by_register)
+
+    def get(self, register: str, registration_number: str) -> RegistrationSummary | None:
+        """Returns the indexed registration, if any."""
+        row = self._ids.get((register, registration_number))
+        return self._model(row) if row is not None else None
+
+    def _fields(self, row: Mapping[str, str]) -> dict[str, str]:
+        fields: dict[str, str] = {}
+        for name, value in row.items():
+            field = self._lookup.get(_header_key(name or ""))
+            if field is not None and field not in fields:
+                fields[field] = (value or "").strip()
+        return fields
+
+    def _entry(self, register: str, row: Mapping[str, str]) -> _Entry | None:
+        fields = self._fields(row)
+        number = fields.get("registration_number")
+        if not number:
+            return None
+        row_hash = hashlib.blake2b(
+            "\x1f".join(f"{key}={value}" for key, value in sorted(fields.items())).encode(),
+            digest_size=16,
+        ).hexdigest()
+        name = fields.get("name", "")
+        address = fields.get("address", "")
+        postcode = fields.get("postcode", "")
+        authority = fields.get("local_authority", "")
+        slug = number.replace("/", "-")
+        record: dict[str, Any] = {
+            "@id": f"{ROOT}/{register}/registration/{slug}",
+            "register": {"@id": f"{ROOT}/{register}/register"},
+            "registrationNumber": number,
+        }
+        # A Register column is only display data; rows are always keyed by the `register` slug.
+        if fields.get("register"):
+            record["register"]["label"] = fields["register"]
+        if name:
+            record["holder"] = {"@id": f"{ROOT}/{register}/holder/{slug}", "name": name}
+        if address or postcode:
+            record["site"] = {
+                "@id": f"{ROOT}/{register}/site/{slug}",
+                "siteAddress": {"address": address or postcode, "postcode": postcode or None},
+            }
+        if authority:
+            record["localAuthority"] = {"@id": f"{ROOT}/local-authority/{_header_key(authority)}", "label": authority}
+        for field, alias in (("registration_date", "registrationDate"), ("expiry_date", "expiryDate")):
+            if fields.get(field):
+                record[alias] = fields[field]
+        try:
+            point = (float(fields["easting"]), float(fields["northing"]))
+        except (KeyError, ValueError):
+            point = None
+        return _Entry(
+            key=(register, number),
+            row_hash=row_hash,
+            record=record,
+            text={
+                "name": _normalise(name),
+                "number": _normalise(number),
+                "address": _normalise(f"{address} {postcode}"),
+            },
+            local_authority=_normalise(authority),
+            exact_name=_normalise(name),
+            point=point,
+        )
+
+    def _add(self, row: int, entry: _Entry) -> None:
+        self._rows[row] = entry
+        self._ids[entry.key] = row
+        for field, text in entry.text.items():
+            self._text[field].add(row, text)
+        self._by_register.setdefault(entry.key[0], set()).add(row)
+        self._by_number.setdefault(entry.text["number"], set()).add(row)
+        if entry.local_authority:
+            self._by_authority.setdefault(entry.local_authority, set()).add(row)
+        if entry.exact_name:
+            self._by_exact_name.setdefault(entry.exact_name, set()).add(row)
+        self._grid.set(str(row), entry.point)
+
+    def _discard(self, row: int) -> None:
+        entry = self._rows.pop(row)
+        del self._ids[entry.key]
+        self._models.pop(row, None)
+        for field, text in entry.text.items():
+            self._text[field].discard(row, text)
+        for mapping, value in (
+            (self._by_register, entry.key[0]),
+            (self._by_number, entry.text["number"]),
+            (self._by_authority, entry.local_authority),
+            (self._by_exact_name, entry.exact_name),
+        ):
+            rows = mapping.get(value)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del mapping[value]
+        self._grid.remove(str(row))
+
+    def _upsert(self, register: str, row: Mapping[str, str]) -> tuple[RegistrationKey | None, bool]:
+        entry = self._entry(register, row)
+        if entry is None:
+            return None, False
+        existing = self._ids.get(entry.key)
+        if existing is not None:
+            if self._rows[existing].row_hash == entry.row_hash:
+                return entry.key, False
+            self._discard(existing)
+        self._add(self._next_id, entry)
+        self._next_id += 1
+        return entry.key, True
+
+    def update(self, register: str, rows: Iterable[Mapping[str, str]]) -> set[RegistrationKey]:
+        """
+        Adds or replaces rows from a register export, re-indexing only rows whose values changed.
+
+        Args:
+            register (str): The register slug the rows belong to, e.g. "waste-operations". A
+                `Register` column in the rows is kept as the register's label only.
+            rows (Iterable[Mapping[str, str]]): CSV rows keyed by header, e.g. from `csv.DictReader`
+                or `PublicRegisterClient.iter_download_rows`.
+
+        Returns:
+            set[tuple[str, str]]: `(register, registration_number)` keys that were added or changed.
+        """
+        changed = set()
+        for row in rows:
+            key, modified = self._upsert(register, row)
+            if modified:
+                changed.add(key)
+        return changed
+
+    def remove(self, keys: Iterable[RegistrationKey]) -> None:
+        """
+        Removes registrations from the index. Unknown keys are ignored.
+
+        Args:
+            keys (Iterable[tuple[str, str]]): `(register, registration_number)` keys.
+        """
+        for key in keys:
+            row = self._ids.get(key)
+            if row is not None:
+                self._discard(row)
+
+    def refresh(
+        self, register: str, rows: Iterable[Mapping[str, str]]
+    ) -> tuple[set[RegistrationKey], set[RegistrationKey]]:
+        """
+        Synchronises one register with a complete, fresh export.
+
+        Rows missing from the export are removed; the rest are upserted.
+
+        Args:
+            register (str): The register the export belongs to.
+            rows (Iterable[Mapping[str, str]]): Every row of the export.
+
+        Returns:
+            tuple[set, set]: Keys of added-or-changed registrations, and keys of removed ones.
+        """
+        seen: set[RegistrationKey] = set()
+        changed: set[RegistrationKey] = set()
+        for row in rows:
+            key, modified = self._upsert(register, row)
+            if key is not None:
+                seen.add(key)
+            if modified:
+                changed.add(key)
+        return changed, self._drop_unseen(register, seen)
+
+    def _drop_unseen(self, register: str, seen: set[RegistrationKey]) -> set[RegistrationKey]:
+        removed = {
+            self._rows[row].key
+            for row in self._by_register.get(register, ())
+            if self._rows[row].key not in seen
+        }
+        self.remove(removed)
+        return removed
+
+    def load_csv(
+        self, register: str, path: str | os.PathLike
+    ) -> tuple[set[RegistrationKey], set[RegistrationKey]]:
+        """
+        Refreshes one register from an export saved with `PublicRegisterClient.stream_download`.
+
+        Args:
+            register (str): The register the file belongs to.
+            path (str | os.PathLike): The CSV file.
+
+        Returns:
+            tuple[set, set]: Keys of added-or-changed registrations, and keys of removed ones.
+        """
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            return self.refresh(register, csv.DictReader(file))
+
+    async def refresh_from_client(
+        self, client: Any, registers: Iterable[str] | None = None, **params
+    ) -> tuple[set[RegistrationKey], set[RegistrationKey]]:
+        """
+        Streams fresh exports with `client.iter_download_rows` and refreshes each register.
+
+        Rows are indexed as they arrive; an export is never held in memory as a whole.
+
+        Args:
+            client (PublicRegisterClient): The client to download with.
+            registers (Iterable[str], optional): Register slugs. Defaults to every downloadable register.
+            **params: Additional query parameters for the downloads.
+
+        Returns:
+            tuple[set, set]: Keys of added-or-changed registrations, and keys of removed ones.
+        """
+        from .client import DOWNLOAD_REGISTERS
+
+        changed: set[RegistrationKey] = set()
+        removed: set[RegistrationKey] = set()
+        for register in registers if registers is not None else DOWNLOAD_REGISTERS:
+            rows: AsyncIterator[dict[str, str]] = client.iter_download_rows(register, **params)
+            seen: set[RegistrationKey] = set()
+            async for row in rows:
+                key, modified = self._upsert(register, row)
+                if key is not None:
+                    seen.add(key)
+                if modified:
+                    changed.add(key)
+            removed |= self._drop_unseen(register, seen)
+        return changed, removed
+
+    def _model(self, row: int) -> RegistrationSummary:
+        model = self._models.get(row)
+        if model is None:
+            model = self._models[row] = RegistrationSummary(**self._rows[row].record)
+        return model
+
+    def _text_match(self, rows: set[int] | None, field: str, query: str) -> set[int]:
+        query = _normalise(query)
+        if rows is None:
+            rows = self._text[field].candidates(query)
+        return {row for row in rows if query in self._rows[row].text[field]}
+
+    def search(
+        self,
+        name_search: str | None = None,
+        number_search: str | None = None,
+        name_number_search: str | None = None,
+        address_search: str | None = None,
+        easting: float | None = None,
+        northing: float | None = None,
+        dist: float | None = None,
+        local_authority: str | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        exact_name: str | None = None,
+        registration_number: str | None = None,
+        register: str | Iterable[str] | None = None,
+    ) -> list[RegistrationSummary]:
+        """
+        Searches the index with the filters of `PublicRegisterClient.search_all_registers`.
+
+        Text searches are case-insensitive substring matches; all given filters must match.
+        With `easting`/`northing`, results are ordered by distance (in kilometres, also set
+        on each result's `distance`) and `dist` limits the radius; otherwise results keep
+        the order in which rows were indexed.
+
+        Args:
+            name_search (str, optional): Full or partial holder name.
+            number_search (str, optional): Full or partial registration number.
+            name_number_search (str, optional): Matches either the holder name or the registration number.
+            address_search (str, optional): Full or partial site address or postcode.
+            easting (float, optional): Easting for a location search (with `northing`).
+            northing (float, optional): Northing for a location search (with `easting`).
+            dist (float, optional): Maximum distance in kilometres from the location.
+            local_authority (str, optional): Local authority name.
+            limit (int, optional): Maximum number of results. Defaults to all.
+            offset (int, optional): Number of results to skip. Defaults to 0.
+            exact_name (str, optional): Exact holder name (case-insensitive).
+            registration_number (str, optional): Exact registration number.
+            register (str | Iterable[str], optional): Only search these registers.
+
+        Returns:
+            list[RegistrationSummary]: The matching registrations.
+        """
+        rows: set[int] | None = None
+
+        def narrow(found: set[int]) -> None:
+            nonlocal rows
+            rows = found if rows is None else rows & found
+
+        if register is not None:
+            registers = [register] if isinstance(register, str) else register
+            narrow(set().union(*(self._by_register.get(name, set()) for name in registers)))
+        if registration_number is not None:
+            narrow(set(self._by_number.get(_normalise(registration_number), ())))
+        if exact_name is not None:
+            narrow(set(self._by_exact_name.get(_normalise(exact_name), ())))
+        if local_authority is not None:
+            narrow(set(self._by_authority.get(_normalise(local_authority), ())))
+        if name_search is not None:
+            rows = self._text_match(rows, "name", name_search)
+        if number_search is not None:
+            rows = self._text_match(rows, "number", number_search)
+        if name_number_search is not None:
+            rows = self._text_match(rows, "name", name_number_search) | self._text_match(
+                rows, "number", name_number_search
+            )
+        if address_search is not None:
+            rows = self._text_match(rows, "address", address_search)
+
+        start = offset or 0
+        stop = None if limit is None else start + limit
+        if easting is None or northing is None:
+            ordered = sorted(self._rows if rows is None else rows)[start:stop]
+            return [self._model(row) for row in ordered]
+
+        query = (float(easting), float(northing))
+        if rows is None:
+            ranked = [
+                (distance, int(key))
+                for distance, key in self._grid.search(query, k=stop, radius_km=dist)
+            ]
+        else:
+            ranked = []
+            for row in rows:
+                point = self._rows[row].point
+                if point is None:
+                    continue
+                distance = math.hypot(point[0] - query[0], point[1] - query[1]) / 1000.0
+                if dist is None or distance <= dist:
+                    ranked.append((distance, row))
+            ranked.sort()
+        return [
+            self._model(row).model_copy(update={"distance": distance})
+            for distance, row in ranked[start:stop]
+        ]
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import Any, List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
+from .._models import EnvironmentModel
 
-class PublicRegisterModel(BaseModel):
+
+class PublicRegisterModel(EnvironmentModel):
     """Base model with common configuration for Public Register data."""
 
     model_config = ConfigDict(populate_by_name=True, extra="allow")
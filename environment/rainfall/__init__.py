@@ -0,0 +1,24 @@
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import RainfallClient
+    from .models import Station, Measure, Reading
+
+__all__ = [
+    "RainfallClient",
+    "Station",
+    "Measure",
+    "Reading",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RainfallClient": ".client",
+        "Station": ".models",
+        "Measure": ".models",
+        "Reading": ".models",
+    },
+)
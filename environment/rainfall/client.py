@@ -2,53 +2,78 @@
 An async client for the UK Environment Agency's Rainfall API.
 """
 
+from typing import Iterable
+
 import httpx
+from .._bulk import gather_keyed, measure_notation
+from .._parsing import decode_items, parse_items, validate_items
+from ..instrumentation import install
 from .models import Station, Measure, Reading
 
 
-async def log_request(request):
-    print(f">>> Request: {request.method} {request.url}")
-
-
-async def log_response(response):
-    # Avoid pre-reading body so VCR can capture content
-    print(f"<<< Response: {response.status_code}")
-
-
 class RainfallClient(httpx.AsyncClient):
     """
     An async client for the UK Environment Agency's Rainfall API.
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        validate=True,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            validate (bool, optional): If False, list methods return plain dicts keyed by field
+                name instead of pydantic models. Can be overridden per call. Defaults to True.
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
         """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk/flood-monitoring")
         super().__init__(
-            base_url="https://environment.data.gov.uk/flood-monitoring",
             timeout=timeout,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(log_request)
-            self.event_hooks["response"].append(log_response)
+        self.validate = validate
+        install(self, instrument, verbose)
 
-    async def get_stations(self, **params) -> list[Station]:
+    async def get_stations(
+        self, validate: bool | None = None, **params
+    ) -> list[Station] | list[dict]:
         """
         Returns a list of rainfall monitoring stations.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Station]: A list of rainfall monitoring stations.
         """
         params = {"parameter": "rainfall", **params}
         response = await self.get("/id/stations", params=params)
         response.raise_for_status()
-        return [Station(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Station,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_station_by_id(self, station_id: str) -> Station:
         """
@@ -70,17 +95,28 @@ class RainfallClient(httpx.AsyncClient):
             data["measures"] = [data["measures"]]
         return Station(**data)
 
-    async def get_measures(self, **params) -> list[Measure]:
+    async def get_measures(
+        self, validate: bool | None = None, **params
+    ) -> list[Measure] | list[dict]:
         """
         Returns a list of rainfall measures.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Measure]: A list of rainfall measures.
         """
         params = {"parameter": "rainfall", **params}
         response = await self.get("/id/measures", params=params)
         response.raise_for_status()
-        return [Measure(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Measure,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_measure_by_id(self, measure_id: str) -> Measure:
         """
@@ -99,17 +135,73 @@ class RainfallClient(httpx.AsyncClient):
             data = data[0]
         return Measure(**data)
 
-    async def get_readings(self, **params) -> list[Reading]:
+    async def get_readings(
+        self, validate: bool | None = None, **params
+    ) -> list[Reading] | list[dict]:
         """
         Returns a list of rainfall readings.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Reading]: A list of rainfall readings.
         """
         params = {"parameter": "rainfall", **params}
         response = await self.get("/data/readings", params=params)
         response.raise_for_status()
-        return [Reading(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Reading,
+            validate=self.validate if validate is None else validate,
+        )
+
+    async def get_readings_for_measures(
+        self,
+        measure_ids: Iterable[str],
+        since: str | None = None,
+        max_concurrency: int = 8,
+        **params,
+    ) -> dict[str, list[Reading] | Exception]:
+        """
+        Returns readings for many measures, fetching them concurrently.
+
+        One `/id/measures/{id}/readings` request is issued per measure over the
+        client's connection pool, with at most `max_concurrency` in flight. A failing measure
+        (e.g. a 404) does not affect the others.
+
+        Args:
+            measure_ids (Iterable[str]): Measure notations or full measure URIs. Duplicates are fetched once.
+            since (str, optional): Only return readings taken after this date-time (`since`).
+            max_concurrency (int, optional): Maximum number of concurrent requests. Defaults to 8.
+            **params: Additional query parameters applied to every request.
+
+        Returns:
+            dict[str, list[Reading] | Exception]: Readings keyed by the given measure ID, or the
+            exception raised for that measure.
+        """
+        if since is not None:
+            params["since"] = since
+
+        async def fetch(measure_id: str) -> list[Reading]:
+            response = await self.get(
+                f"/id/measures/{measure_notation(measure_id)}/readings", params=params
+            )
+            response.raise_for_status()
+            items = decode_items(response)
+            normalised = []
+            for item in items:
+                data = dict(item)
+                if isinstance(data.get("measure"), dict):
+                    data["measure"] = data["measure"].get("@id")
+                normalised.append(data)
+            return validate_items(
+                normalised, Reading, validate=self.validate, response=response
+            )
+
+        return await gather_keyed(measure_ids, fetch, max_concurrency)
 
     async def get_reading_by_id(self, reading_id: str) -> Reading:
         """
@@ -0,0 +1,310 @@
+"""
+Adaptive rate limiting for bulk jobs against environment.data.gov.uk.
+
+A `RateLimiter` combines a token bucket (requests per second) with an AIMD
+concurrency window (additive increase, multiplicative decrease). Each successful
+response nudges both limits up; each `429 Too Many Requests` or
+`503 Service Unavailable` cuts them down and, if the response carries `Retry-After`,
+pauses every request sharing the limiter until that time has passed. Bulk jobs
+therefore settle at the highest rate the service tolerates without hand-tuned
+sleeps.
+
+`RateLimitTransport` applies a limiter under any client and retries throttled
+idempotent requests:
+
+    limiter = RateLimiter(rate=10, max_rate=50)
+    transport = RateLimitTransport(httpx.AsyncHTTPTransport(), limiter)
+    async with FloodClient(transport=transport) as client:
+        ...
+    print(limiter.metrics())
+
+or for every client on a session with `EnvironmentSession(limiter=limiter)`. One
+limiter can be shared by any number of transports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import email.utils
+import time
+from typing import Any, AsyncIterator, NamedTuple
+
+import httpx
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """
+    Parses a `Retry-After` header into a delay in seconds.
+
+    Args:
+        value (str, optional): Either a number of seconds or an HTTP date.
+        now (float, optional): Current wall-clock time, for HTTP dates. Defaults to `time.time()`.
+
+    Returns:
+        float | None: The non-negative delay, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class LimiterMetrics(NamedTuple):
+    """A snapshot of a `RateLimiter`'s state and counters."""
+
+    rate: float
+    concurrency: int
+    in_flight: int
+    requests: int
+    successes: int
+    throttled: int
+    retries: int
+    throughput: float
+    paused_for: float
+
+
+class RateLimiter:
+    """
+    A token bucket plus an AIMD concurrency window that adapts to throttling responses.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int | None = None,
+        concurrency: int = 4,
+        max_concurrency: int = 32,
+        max_rate: float = 50.0,
+        min_rate: float = 0.5,
+        rate_step: float = 0.1,
+        decrease: float = 0.5,
+        window: float = 10.0,
+    ):
+        """
+        Initializes the limiter.
+
+        Args:
+            rate (float, optional): Starting request rate per second. Defaults to 10.
+            burst (int, optional): Token bucket capacity. Defaults to the concurrency window.
+            concurrency (int, optional): Starting number of requests allowed in flight. Defaults to 4.
+            max_concurrency (int, optional): Upper bound of the concurrency window. Defaults to 32.
+            max_rate (float, optional): Upper bound of the request rate. Defaults to 50.
+            min_rate (float, optional): Lower bound of the request rate. Defaults to 0.5.
+            rate_step (float, optional): Requests per second added to the rate after each
+                success. Defaults to 0.1.
+            decrease (float, optional): Factor applied to rate and concurrency on throttling.
+                Defaults to 0.5.
+            window (float, optional): Seconds over which throughput is measured. Defaults to 10.
+        """
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = float(concurrency)
+        self.max_concurrency = max_concurrency
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate_step = rate_step
+        self.decrease = decrease
+        self.window = window
+        self.requests = 0
+        self.successes = 0
+        self.throttled = 0
+        self.retries = 0
+        self._tokens = float(burst if burst is not None else concurrency)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._completed: collections.deque[float] = collections.deque()
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def _capacity(self) -> float:
+        return float(self.burst) if self.burst is not None else max(1.0, self.concurrency)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(self._capacity(), self._tokens + elapsed * self.rate)
+
+    def _wait_time(self, now: float) -> float | None:
+        """Seconds until a slot may be available: 0 if one is free now, None to wait for a release."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= max(1, int(self.concurrency)):
+            return None
+        self._refill(now)
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        return 0.0
+
+    async def acquire(self) -> None:
+        """Waits for a token and a concurrency slot. Pair every call with `release()`."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            while True:
+                delay = self._wait_time(time.monotonic())
+                if delay == 0:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    self.requests += 1
+                    return
+                try:
+                    await asyncio.wait_for(self._condition.wait(), delay)
+                except TimeoutError:
+                    pass
+
+    async def release(self) -> None:
+        """Returns a concurrency slot taken by `acquire()`."""
+        self._in_flight -= 1
+        if self._condition is not None:
+            async with self._condition:
+                self._condition.notify_all()
+
+    async def __aenter__(self) -> RateLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+    def on_success(self) -> None:
+        """Additively widens the concurrency window (about +1 per window of successes) and rate."""
+        now = time.monotonic()
+        self.successes += 1
+        self._completed.append(now)
+        while self._completed[0] < now - self.window:
+            self._completed.popleft()
+        self.concurrency = min(float(self.max_concurrency), self.concurrency + 1 / self.concurrency)
+        self.rate = min(self.max_rate, self.rate + self.rate_step)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """
+        Multiplicatively shrinks rate and concurrency, and pauses for `retry_after` seconds if given.
+
+        Args:
+            retry_after (float, optional): Delay requested by the server's `Retry-After` header.
+        """
+        self.throttled += 1
+        self.concurrency = max(1.0, self.concurrency * self.decrease)
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        # Drop any saved-up burst so the lower rate applies straight away.
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def metrics(self) -> LimiterMetrics:
+        """
+        Returns the current limits, counters and observed throughput.
+
+        Returns:
+            LimiterMetrics: A snapshot; `throughput` is successes per second over the last `window`.
+        """
+        now = time.monotonic()
+        while self._completed and self._completed[0] < now - self.window:
+            self._completed.popleft()
+        return LimiterMetrics(
+            rate=self.rate,
+            concurrency=max(1, int(self.concurrency)),
+            in_flight=self._in_flight,
+            requests=self.requests,
+            successes=self.successes,
+            throttled=self.throttled,
+            retries=self.retries,
+            throughput=len(self._completed) / self.window,
+            paused_for=max(0.0, self._paused_until - now),
+        )
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Holds a limiter slot until the response body is closed, then releases it once."""
+
+    def __init__(self, stream: Any, limiter: RateLimiter):
+        self._stream = stream
+        self._limiter = limiter
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                await self._limiter.release()
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """
+    A transport that sends requests through a `RateLimiter` and retries throttled idempotent requests.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: RateLimiter | None = None,
+        max_retries: int = 3,
+    ):
+        """
+        Initializes the transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): The transport that performs network requests.
+            limiter (RateLimiter, optional): The limiter to apply. Defaults to a new `RateLimiter`.
+            max_retries (int, optional): Times a throttled `GET`/`HEAD`/`OPTIONS` request is retried
+                before the 429/503 response is returned to the caller. Defaults to 3.
+        """
+        self.transport = transport
+        self.limiter = limiter if limiter is not None else RateLimiter()
+        self.max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempts = 0
+        while True:
+            await self.limiter.acquire()
+            try:
+                response = await self.transport.handle_async_request(request)
+            except BaseException:
+                await self.limiter.release()
+                raise
+            if response.is_closed:
+                # The body arrived with the headers (e.g. a mocked or cached response).
+                await self.limiter.release()
+            else:
+                # The slot is held until the body has been read or the stream closed, so the
+                # concurrency window also bounds streamed downloads.
+                response.stream = _ReleasingStream(response.stream, self.limiter)
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                if response.status_code < 500:
+                    self.limiter.on_success()
+                return response
+            self.limiter.on_throttle(parse_retry_after(response.headers.get("retry-after")))
+            if request.method not in IDEMPOTENT_METHODS or attempts >= self.max_retries:
+                return response
+            attempts += 1
+            self.limiter.retries += 1
+            await response.aclose()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
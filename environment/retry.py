@@ -0,0 +1,319 @@
+"""
+Retries with jittered exponential backoff, and hedged requests for tail latency.
+
+`RetryTransport` wraps another transport. Idempotent requests that fail with a
+transport error or a retryable status (429, 500, 502, 503, 504) are retried after
+"full jitter" exponential backoff, or after the server's `Retry-After` if that is
+longer. A `RetryBudget` caps retries to a fraction of overall traffic, so an outage
+does not multiply the load on the service.
+
+With a `HedgePolicy`, a `GET` that has not answered within the recent p95 latency
+is sent a second time and whichever response arrives first is used; the other is
+cancelled. This trims the long tail when a dashboard issues many parallel calls.
+
+Every retry and hedge is reported to the transport's hooks as a `RetryEvent`:
+
+    def log_event(event):
+        logger.info("%s %s attempt=%d delay=%.2f", event.kind, event.request.url, event.attempt, event.delay)
+
+    transport = RetryTransport(
+        httpx.AsyncHTTPTransport(), RetryPolicy(max_attempts=4), HedgePolicy(), hooks=[log_event]
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import inspect
+import random
+import time
+from typing import Any, Callable, Iterable, NamedTuple
+
+import httpx
+
+from .ratelimit import IDEMPOTENT_METHODS, parse_retry_after
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of requests, plus a small reserve.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws one, so
+    in steady state at most `ratio` of requests are retried.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0):
+        """
+        Initializes the budget.
+
+        Args:
+            ratio (float, optional): Retries allowed per request. Defaults to 0.2.
+            reserve (float, optional): Retries available before any traffic, and the most that can
+                be saved up. Defaults to 10.
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+
+    @property
+    def available(self) -> float:
+        """Retries currently allowed."""
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Records a first attempt."""
+        self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes a retry token, returning False if the budget is exhausted."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Which requests to retry, how often, and how long to back off between attempts.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        status_codes: Iterable[int] = RETRY_STATUS_CODES,
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        budget: RetryBudget | None = None,
+    ):
+        """
+        Initializes the policy.
+
+        Args:
+            max_attempts (int, optional): Total attempts per request, including the first. Defaults to 3.
+            backoff (float, optional): Base delay in seconds; attempt `n` waits up to
+                `backoff * 2 ** (n - 1)`. Defaults to 0.5.
+            max_backoff (float, optional): Upper bound of a single delay. Defaults to 10.
+            status_codes (Iterable[int], optional): Response statuses that are retried.
+                Defaults to 429, 500, 502, 503 and 504.
+            methods (Iterable[str], optional): Methods that may be retried. Defaults to GET, HEAD
+                and OPTIONS.
+            budget (RetryBudget, optional): Shared retry budget. Defaults to a new `RetryBudget`.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Returns the "full jitter" delay before retrying after failed attempt number `attempt`.
+
+        Args:
+            attempt (int): The attempt that just failed, starting at 1.
+            retry_after (float, optional): A server-requested delay, used as a lower bound.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate `GET`: after the recent p95 (or other quantile) latency.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 5.0,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        """
+        Initializes the policy.
+
+        Args:
+            quantile (float, optional): Latency quantile after which a hedge is sent. Defaults to 0.95.
+            initial_delay (float, optional): Delay used until `min_samples` latencies have been seen.
+                Defaults to 1.0.
+            min_delay (float, optional): Lower bound of the hedge delay. Defaults to 0.05.
+            max_delay (float, optional): Upper bound of the hedge delay. Defaults to 5.0.
+            window (int, optional): Number of recent latencies considered. Defaults to 200.
+            min_samples (int, optional): Latencies required before the quantile is used. Defaults to 20.
+        """
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+
+    def observe(self, latency: float) -> None:
+        """Records the time to response headers of a successful request."""
+        self._latencies.append(latency)
+
+    def delay(self) -> float:
+        """Returns the current hedge delay in seconds."""
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(self._latencies)
+        value = ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+        return min(self.max_delay, max(self.min_delay, value))
+
+
+class RetryEvent(NamedTuple):
+    """
+    A retry or hedge reported to `RetryTransport` hooks.
+
+    `kind` is "retry" (about to wait `delay` seconds and resend), "hedge" (a duplicate
+    request was sent after `delay` seconds) or "hedge_won" (the duplicate answered first).
+    `reason` is the status code or exception that caused a retry.
+    """
+
+    kind: str
+    request: httpx.Request
+    attempt: int
+    delay: float
+    reason: int | BaseException | None = None
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    A transport that retries failed idempotent requests and optionally hedges slow `GET`s.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        hooks: Iterable[Callable[[RetryEvent], Any]] = (),
+    ):
+        """
+        Initializes the transport.
+
+        Args:
+            transport (httpx.AsyncBaseTransport): The transport that performs network requests.
+            policy (RetryPolicy, optional): Retry behaviour. Defaults to None (no retries, so
+                the transport only hedges).
+            hedge (HedgePolicy, optional): Hedge slow `GET` requests. Defaults to None (no hedging).
+            hooks (Iterable[Callable], optional): Functions or coroutine functions called with a
+                `RetryEvent` for every retry and hedge.
+        """
+        self.transport = transport
+        self.policy = policy
+        self.hedge = hedge
+        self.hooks = list(hooks)
+
+    async def _emit(self, event: RetryEvent) -> None:
+        for hook in self.hooks:
+            result = hook(event)
+            if inspect.isawaitable(result):
+                await result
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.policy
+        if policy is None:
+            return await self._send(request, 1)
+        retryable = request.method in policy.methods
+        if retryable:
+            policy.budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            may_retry = retryable and attempt < policy.max_attempts
+            try:
+                response = await self._send(request, attempt)
+            except httpx.TransportError as exc:
+                if not may_retry or not policy.budget.withdraw():
+                    raise
+                reason: int | BaseException = exc
+                retry_after = None
+            else:
+                if response.status_code not in policy.status_codes:
+                    return response
+                if not may_retry or not policy.budget.withdraw():
+                    return response
+                reason = response.status_code
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                await response.aclose()
+            delay = policy.delay(attempt, retry_after)
+            await self._emit(RetryEvent("retry", request, attempt, delay, reason))
+            await asyncio.sleep(delay)
+
+    async def _send(self, request: httpx.Request, attempt: int) -> httpx.Response:
+        if self.hedge is None or request.method != "GET":
+            return await self.transport.handle_async_request(request)
+
+        delay = self.hedge.delay()
+        primary = asyncio.ensure_future(self._timed(request))
+        pending = {primary}
+        hedged: asyncio.Future | None = None
+        winner: asyncio.Future | None = None
+        error: BaseException | None = None
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                pending = set()
+                winner = primary
+                return primary.result()
+
+            await self._emit(RetryEvent("hedge", request, attempt, delay))
+            hedged = asyncio.ensure_future(self._timed(request))
+            pending = {primary, hedged}
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                    elif winner is None:
+                        winner = task
+                    else:
+                        _close_unused(task)
+        except BaseException:
+            # The caller was cancelled (or a hook failed): nothing will be returned, so
+            # every attempt, finished or not, must give back its connection.
+            for task in (primary, hedged):
+                if task is not None and task not in pending:
+                    _close_unused(task)
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_close_unused)
+        if winner is None:
+            raise error
+        if winner is hedged:
+            await self._emit(RetryEvent("hedge_won", request, attempt, delay))
+        return winner.result()
+
+    async def _timed(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        if response.status_code < 500:
+            self.hedge.observe(time.monotonic() - started)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _close_unused(task: asyncio.Future) -> None:
+    # A losing or abandoned attempt that still produced a response must release its connection.
+    if task.done() and not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(task.result().aclose())
@@ -0,0 +1,126 @@
+"""
+A shared connection pool for the environment.data.gov.uk clients.
+
+Every client subclasses `httpx.AsyncClient` and would otherwise open its own
+connection pool and TLS sessions, even though they all talk to the same host.
+An `EnvironmentSession` owns a single transport that any number of clients can
+share by passing `session=` to their constructor:
+
+    async with EnvironmentSession(http2=True) as session:
+        flood = FloodClient(session=session)
+        hydrology = HydrologyClient(session=session)
+        ...
+
+Closing a client does not close the shared pool; close the session instead.
+
+Passing `cache=` (a `MemoryCache` or `SQLiteCache`) puts a `CacheTransport` with the
+default per-endpoint TTLs in front of the pool. Passing `limiter=` (a `RateLimiter`)
+throttles every client's requests through it, adapting to 429/503 responses, and
+`retry=`/`hedge=` add a `RetryTransport` with jittered backoff and hedged `GET`s.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+from .cache import CacheBackend, CacheTransport
+from .ratelimit import RateLimiter, RateLimitTransport
+from .retry import HedgePolicy, RetryPolicy, RetryTransport
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Forwards requests to the session's transport and leaves closing to the session."""
+
+    def __init__(self, session: EnvironmentSession):
+        self._session = session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._session.pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # The pool outlives any one client; EnvironmentSession.aclose() closes it.
+        pass
+
+
+class EnvironmentSession:
+    """
+    A keep-alive connection pool shared by several clients.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: CacheBackend | None = None,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        **transport_kwargs,
+    ):
+        """
+        Initializes the session.
+
+        Args:
+            limits (httpx.Limits, optional): Pool limits. Defaults to 100 connections, 20 kept alive.
+            http2 (bool, optional): If True, multiplexes requests over HTTP/2 connections.
+                Requires the `h2` package (`pip install environment-client[http2]`). Defaults to False.
+            transport (httpx.AsyncBaseTransport, optional): Use this transport as the pool instead of
+                creating an `httpx.AsyncHTTPTransport`. `limits`, `http2` and `transport_kwargs` are
+                ignored when it is given.
+            cache (CacheBackend, optional): Serve cacheable `GET` responses from this backend,
+                using `cache.DEFAULT_TTLS`. For other TTLs, pass a `CacheTransport` as `transport`.
+                Defaults to None (no caching).
+            limiter (RateLimiter, optional): Send every request through this adaptive limiter,
+                retrying throttled requests. Cache hits are not rate limited. Defaults to None.
+            retry (RetryPolicy, optional): Retry failed idempotent requests with jittered backoff.
+                Each attempt passes through `limiter`, which then stops retrying 429/503 responses
+                itself. Defaults to None (no retries).
+            hedge (HedgePolicy, optional): Send a duplicate `GET` once a request has taken longer
+                than the recent p95 latency. Without `retry`, nothing is retried, not even by
+                `limiter`. Defaults to None (no hedging).
+            **transport_kwargs: Additional keyword arguments for `httpx.AsyncHTTPTransport`
+                (e.g. `retries`, `verify`).
+        """
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=limits or DEFAULT_LIMITS, http2=http2, **transport_kwargs
+            )
+        stacked = retry is not None or hedge is not None
+        if limiter is not None:
+            # Under a RetryTransport only `retry` decides on retries (and charges its budget);
+            # the limiter still throttles every attempt and honours Retry-After.
+            transport = RateLimitTransport(transport, limiter, max_retries=0 if stacked else 3)
+        if stacked:
+            transport = RetryTransport(transport, retry, hedge)
+        if cache is not None:
+            transport = CacheTransport(transport, cache)
+        self.pool = transport
+        self._shared = _SharedTransport(self)
+        self._closed = False
+
+    @property
+    def transport(self) -> httpx.AsyncBaseTransport:
+        """The transport handed to clients; closing a client leaves the pool open."""
+        return self._shared
+
+    @property
+    def is_closed(self) -> bool:
+        """True once `aclose()` has been called."""
+        return self._closed
+
+    async def aclose(self) -> None:
+        """Closes the pool and every connection in it."""
+        if not self._closed:
+            self._closed = True
+            await self.pool.aclose()
+
+    async def __aenter__(self) -> EnvironmentSession:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,353 @@
+"""
+In-memory spatial index over monitoring stations.
+
+`StationIndex` is built once from the output of any client's `get_stations()` (flood
+monitoring, rainfall, tide gauge or hydrology `Station` models, or the raw dicts returned
+with `validate=False`) and answers
+k-nearest and within-radius queries locally, by lat/long or by easting/northing.
+
+Stations are bucketed into a uniform grid per coordinate system. Queries visit rings
+of cells around the query point and stop as soon as no unvisited cell can hold a
+closer station, so only a handful of cells are inspected per query. The easting/northing
+grid, `PlanarGrid`, is also usable on its own for any points keyed by string.
+"""
+
+from __future__ import annotations
+
+import abc
+import heapq
+import math
+from typing import Any, Iterable, Mapping
+
+EARTH_RADIUS_KM = 6371.0088
+
+Point = tuple[float, float]
+Cell = tuple[int, int]
+
+
+def _first(value: Any) -> Any:
+    # Some flood-monitoring stations report a list of coordinates; use the first.
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _station_id(station: Any) -> str:
+    if isinstance(station, Mapping):
+        return station["@id"] if "@id" in station else station["id"]
+    return station.id
+
+
+def _station_field(station: Any, name: str) -> Any:
+    if isinstance(station, Mapping):
+        return _first(station.get(name))
+    return _first(getattr(station, name, None))
+
+
+def haversine_km(lat1: float, long1: float, lat2: float, long2: float) -> float:
+    """Returns the great-circle distance in kilometres between two WGS84 points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(long2 - long1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class _GridIndex(abc.ABC):
+    """Uniform grid bucketing of points keyed by string ID (e.g. a station ID)."""
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: dict[Cell, dict[str, Point]] = {}
+        self.points: dict[str, Point] = {}
+        self._bounds: tuple[int, int, int, int] | None = None
+
+    def cell(self, point: Point) -> Cell:
+        return (
+            math.floor(point[0] / self.cell_size),
+            math.floor(point[1] / self.cell_size),
+        )
+
+    def set(self, key: str, point: Point | None) -> bool:
+        current = self.points.get(key)
+        if current == point:
+            return False
+        if current is not None:
+            self._discard(key, current)
+        if point is not None:
+            self.points[key] = point
+            self.cells.setdefault(self.cell(point), {})[key] = point
+        self._bounds = None
+        return True
+
+    def remove(self, key: str) -> None:
+        current = self.points.get(key)
+        if current is not None:
+            self._discard(key, current)
+            self._bounds = None
+
+    def _discard(self, key: str, point: Point) -> None:
+        del self.points[key]
+        cell = self.cell(point)
+        bucket = self.cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self.cells[cell]
+
+    @abc.abstractmethod
+    def distance_km(self, a: Point, b: Point) -> float:
+        """Returns the distance in kilometres between two points."""
+
+    @abc.abstractmethod
+    def ring_bound_km(self, query: Point, cell: Cell, ring: int) -> float:
+        """Returns a lower bound on the distance from `query` to any point outside `ring` rings of `cell`."""
+
+    def _ring(self, centre: Cell, ring: int) -> Iterable[Cell]:
+        cx, cy = centre
+        if ring == 0:
+            yield centre
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
+
+    def search(
+        self, query: Point, k: int | None = None, radius_km: float | None = None
+    ) -> list[tuple[float, str]]:
+        """Returns `(distance_km, key)` pairs sorted by distance, limited by `k` and/or `radius_km`."""
+        if not self.cells:
+            return []
+        if self._bounds is None:
+            xs = [cell[0] for cell in self.cells]
+            ys = [cell[1] for cell in self.cells]
+            self._bounds = (min(xs), max(xs), min(ys), max(ys))
+        min_x, max_x, min_y, max_y = self._bounds
+        centre = self.cell(query)
+        # Beyond this ring every occupied cell has been visited.
+        max_ring = max(
+            abs(centre[0] - min_x),
+            abs(centre[0] - max_x),
+            abs(centre[1] - min_y),
+            abs(centre[1] - max_y),
+        )
+        # Max-heap (negated distances) of the best candidates found so far.
+        best: list[tuple[float, str]] = []
+        ring = 0
+        while ring <= max_ring:
+            for cell in self._ring(centre, ring):
+                for key, point in self.cells.get(cell, {}).items():
+                    distance = self.distance_km(query, point)
+                    if radius_km is not None and distance > radius_km:
+                        continue
+                    if k is None or len(best) < k:
+                        heapq.heappush(best, (-distance, key))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, key))
+            bound = self.ring_bound_km(query, centre, ring)
+            if radius_km is not None and bound > radius_km:
+                break
+            if k is not None and len(best) >= k and -best[0][0] <= bound:
+                break
+            ring += 1
+        return sorted((-negated, key) for negated, key in best)
+
+
+class _LatLongGrid(_GridIndex):
+    """Grid over (lat, long) in degrees with great-circle distances."""
+
+    def distance_km(self, a: Point, b: Point) -> float:
+        return haversine_km(a[0], a[1], b[0], b[1])
+
+    def ring_bound_km(self, query: Point, cell: Cell, ring: int) -> float:
+        # Minimum distance from the query to any point outside the visited rings.
+        size = self.cell_size
+        lat, long = query
+        dlat = min(lat - (cell[0] - ring) * size, (cell[0] + ring + 1) * size - lat)
+        dlong = min(long - (cell[1] - ring) * size, (cell[1] + ring + 1) * size - long)
+        by_lat = math.radians(dlat)
+        # Distance to the meridian `dlong` degrees away (cross-track distance).
+        by_long = math.asin(
+            min(1.0, math.cos(math.radians(lat)) * math.sin(math.radians(min(dlong, 90.0))))
+        )
+        return EARTH_RADIUS_KM * min(by_lat, by_long)
+
+
+class PlanarGrid(_GridIndex):
+    """
+    Grid over British National Grid (easting, northing) in metres.
+
+    Points are added with `set(key, point)`, dropped with `remove(key)` and queried with
+    `search(query, k=..., radius_km=...)`, which returns `(distance_km, key)` pairs.
+    """
+
+    def distance_km(self, a: Point, b: Point) -> float:
+        return math.hypot(a[0] - b[0], a[1] - b[1]) / 1000.0
+
+    def ring_bound_km(self, query: Point, cell: Cell, ring: int) -> float:
+        size = self.cell_size
+        x, y = query
+        dx = min(x - (cell[0] - ring) * size, (cell[0] + ring + 1) * size - x)
+        dy = min(y - (cell[1] - ring) * size, (cell[1] + ring + 1) * size - y)
+        return min(dx, dy) / 1000.0
+
+
+class StationIndex:
+    """
+    A grid index over station coordinates answering nearest-station and radius queries in memory.
+    """
+
+    def __init__(
+        self,
+        stations: Iterable[Any] = (),
+        cell_degrees: float = 0.1,
+        cell_metres: float = 10_000.0,
+    ):
+        """
+        Initializes the index.
+
+        Args:
+            stations (Iterable, optional): Station models with an `id` and `lat`/`long` and/or
+                `easting`/`northing` attributes, or raw station dicts keyed by `@id`.
+            cell_degrees (float, optional): Grid cell size for lat/long queries. Defaults to 0.1.
+            cell_metres (float, optional): Grid cell size for easting/northing queries. Defaults to 10,000.
+        """
+        self._stations: dict[str, Any] = {}
+        self._latlong = _LatLongGrid(cell_degrees)
+        self._planar = PlanarGrid(cell_metres)
+        self.update(stations)
+
+    def __len__(self) -> int:
+        return len(self._stations)
+
+    def __contains__(self, station_id: str) -> bool:
+        return station_id in self._stations
+
+    def get(self, station_id: str) -> Any | None:
+        """Returns the indexed station with the given ID, if any."""
+        return self._stations.get(station_id)
+
+    def update(self, stations: Iterable[Any]) -> set[str]:
+        """
+        Adds or replaces stations, re-bucketing only those whose coordinates moved.
+
+        Args:
+            stations (Iterable): Station models or raw dicts to upsert, keyed by their `id` (`@id`).
+
+        Returns:
+            set[str]: IDs of stations that were added or whose coordinates changed.
+        """
+        changed = set()
+        for station in stations:
+            station_id = _station_id(station)
+            self._stations[station_id] = station
+            lat, long = _station_field(station, "lat"), _station_field(station, "long")
+            easting = _station_field(station, "easting")
+            northing = _station_field(station, "northing")
+            latlong = (float(lat), float(long)) if lat is not None and long is not None else None
+            planar = (
+                (float(easting), float(northing))
+                if easting is not None and northing is not None
+                else None
+            )
+            moved = self._latlong.set(station_id, latlong)
+            moved = self._planar.set(station_id, planar) or moved
+            if moved:
+                changed.add(station_id)
+        return changed
+
+    def remove(self, station_ids: Iterable[str]) -> None:
+        """
+        Removes stations from the index. Unknown IDs are ignored.
+
+        Args:
+            station_ids (Iterable[str]): IDs of the stations to remove.
+        """
+        for station_id in station_ids:
+            if self._stations.pop(station_id, None) is not None:
+                self._latlong.remove(station_id)
+                self._planar.remove(station_id)
+
+    def refresh(self, stations: Iterable[Any]) -> tuple[set[str], set[str]]:
+        """
+        Synchronises the index with a fresh `get_stations()` result.
+
+        Stations missing from `stations` are removed; the rest are upserted.
+
+        Args:
+            stations (Iterable): The complete, current list of stations.
+
+        Returns:
+            tuple[set[str], set[str]]: IDs of added-or-moved stations, and IDs of removed stations.
+        """
+        stations = list(stations)
+        current = {_station_id(station) for station in stations}
+        removed = set(self._stations) - current
+        self.remove(removed)
+        return self.update(stations), removed
+
+    def _grid_query(
+        self,
+        lat: float | None,
+        long: float | None,
+        easting: float | None,
+        northing: float | None,
+    ) -> tuple[_GridIndex, Point]:
+        if lat is not None and long is not None:
+            return self._latlong, (lat, long)
+        if easting is not None and northing is not None:
+            return self._planar, (easting, northing)
+        raise ValueError("Provide either lat and long, or easting and northing")
+
+    def nearest(
+        self,
+        lat: float | None = None,
+        long: float | None = None,
+        k: int = 1,
+        easting: float | None = None,
+        northing: float | None = None,
+    ) -> list[tuple[Any, float]]:
+        """
+        Returns the `k` stations closest to a point.
+
+        Args:
+            lat (float, optional): Latitude of the query point (with `long`).
+            long (float, optional): Longitude of the query point (with `lat`).
+            k (int, optional): Number of stations to return. Defaults to 1.
+            easting (float, optional): Easting of the query point (with `northing`).
+            northing (float, optional): Northing of the query point (with `easting`).
+
+        Returns:
+            list[tuple[Station, float]]: Stations and their distances in kilometres, closest first.
+        """
+        grid, query = self._grid_query(lat, long, easting, northing)
+        return [(self._stations[key], distance) for distance, key in grid.search(query, k=k)]
+
+    def within(
+        self,
+        radius_km: float,
+        lat: float | None = None,
+        long: float | None = None,
+        easting: float | None = None,
+        northing: float | None = None,
+    ) -> list[tuple[Any, float]]:
+        """
+        Returns all stations within `radius_km` of a point.
+
+        Args:
+            radius_km (float): Search radius in kilometres.
+            lat (float, optional): Latitude of the query point (with `long`).
+            long (float, optional): Longitude of the query point (with `lat`).
+            easting (float, optional): Easting of the query point (with `northing`).
+            northing (float, optional): Northing of the query point (with `easting`).
+
+        Returns:
+            list[tuple[Station, float]]: Stations and their distances in kilometres, closest first.
+        """
+        grid, query = self._grid_query(lat, long, easting, northing)
+        return [
+            (self._stations[key], distance)
+            for distance, key in grid.search(query, radius_km=radius_km)
+        ]
@@ -0,0 +1,28 @@
+"""
+A local stand-in for environment.data.gov.uk, for load-testing the clients.
+
+`StandInApp` is a dependency-free ASGI application serving deterministic synthetic
+data for the paths the clients use, with configurable latency, throttling and error
+injection. Point any client at it with `base_url`, either in process:
+
+    app = StandInApp(latency=0.05, rate_limit=200, error_rate=0.01)
+    async with FloodClient(
+        transport=app.transport(), base_url="http://standin/flood-monitoring"
+    ) as client:
+        stations = await client.get_stations()
+
+or over HTTP with `python -m environment.standin --port 8000` (requires `uvicorn`,
+`pip install environment-client[standin]`) and
+`FloodClient(base_url="http://127.0.0.1:8000/flood-monitoring")`.
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .app import StandInApp
+
+__all__ = ["StandInApp"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {"StandInApp": ".app"})
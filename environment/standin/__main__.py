@@ -0,0 +1,52 @@
+"""
+Serves the stand-in over HTTP: `python -m environment.standin --help`.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from .app import StandInApp
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m environment.standin",
+        description="Local stand-in for environment.data.gov.uk.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--size", type=int, default=1_000, help="items per collection")
+    parser.add_argument("--default-limit", type=int, help="page size when no _limit is given")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency, in seconds")
+    parser.add_argument("--rate-limit", type=float, help="requests per second before answering 429")
+    parser.add_argument("--retry-after", type=float, help="Retry-After sent with 429 responses")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of injected 500/503s")
+    parser.add_argument("--download-rows", type=int, default=10_000, help="rows per CSV download")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise SystemExit(
+            "Serving the stand-in over HTTP requires uvicorn: pip install environment-client[standin]"
+        ) from exc
+
+    app = StandInApp(
+        size=args.size,
+        default_limit=args.default_limit,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        download_rows=args.download_rows,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+The stand-in ASGI application.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import csv
+import hashlib
+import io
+import json
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+from urllib.parse import parse_qsl
+
+import httpx
+
+from . import data
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class _Reply:
+    """A response to send: a status, headers and one or more body chunks."""
+
+    def __init__(
+        self,
+        status: int,
+        body: bytes | Iterable[bytes] = b"",
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ):
+        self.status = status
+        self.chunks = [body] if isinstance(body, bytes) else body
+        self.headers = {"content-type": content_type, **(headers or {})}
+
+
+def _json(document: Any, status: int = 200) -> _Reply:
+    return _Reply(status, json.dumps(document).encode())
+
+
+class StandInApp:
+    """
+    A lightweight ASGI stand-in for environment.data.gov.uk.
+
+    It serves deterministic synthetic data for the paths the clients use, with
+    optional latency, throttling and error injection:
+
+    - `/flood-monitoring/id/stations` and `/flood-monitoring/data/readings`
+      (also used by the rainfall and tide gauge clients);
+    - `/flood-monitoring/id/measures/{id}/readings` and `/hydrology/id/measures/{id}/readings`;
+    - `/public-register/api/search.json` and `/public-register/{register}/registration.json`;
+    - `/public-register/downloads/{register}`, streamed as CSV.
+
+    Collections honour `_limit` and `_offset`, every JSON response carries an `ETag`
+    and answers a matching `If-None-Match` with `304 Not Modified`, and
+    `name-search` terms appear in the generated holder names.
+    """
+
+    def __init__(
+        self,
+        size: int = 1_000,
+        default_limit: int | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: float | None = None,
+        retry_after: float | None = None,
+        error_rate: float = 0.0,
+        error_statuses: Iterable[int] = (500, 503),
+        download_rows: int = 10_000,
+        seed: int = 0,
+    ):
+        """
+        Initializes the application.
+
+        Args:
+            size (int, optional): Number of items in each collection. Defaults to 1000.
+            default_limit (int, optional): Page size when a request has no `_limit`.
+                Defaults to None (the whole collection).
+            latency (float, optional): Seconds added before every response. Defaults to 0.
+            jitter (float, optional): Up to this many random extra seconds of latency. Defaults to 0.
+            rate_limit (float, optional): Requests per second accepted before answering
+                `429 Too Many Requests`. Defaults to None (no throttling).
+            retry_after (float, optional): `Retry-After` sent with 429 responses. Defaults to the
+                time until the next request would be accepted, rounded up to whole seconds.
+            error_rate (float, optional): Fraction of requests answered with an injected error.
+                Defaults to 0.
+            error_statuses (Iterable[int], optional): Statuses of injected errors, chosen at random.
+                Defaults to 500 and 503.
+            download_rows (int, optional): Rows in each register CSV download. Defaults to 10000.
+            seed (int, optional): Seed for the generated data and the injected faults. Defaults to 0.
+        """
+        self.size = size
+        self.default_limit = default_limit
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.download_rows = download_rows
+        self.seed = seed
+        self.counts: collections.Counter[str] = collections.Counter()
+        self._faults = random.Random(seed)
+        self._tokens = rate_limit or 0.0
+        self._refilled_at = time.monotonic()
+
+    def transport(self) -> httpx.ASGITransport:
+        """Returns an in-process transport, e.g. `FloodClient(transport=app.transport(), base_url=...)`."""
+        return httpx.ASGITransport(app=self)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        reply = await self.handle(
+            scope["method"],
+            scope["path"],
+            dict(parse_qsl(scope.get("query_string", b"").decode())),
+            {key.decode().lower(): value.decode() for key, value in scope.get("headers", [])},
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": reply.status,
+                "headers": [(key.encode(), value.encode()) for key, value in reply.headers.items()],
+            }
+        )
+        chunks = iter(reply.chunks)
+        chunk = next(chunks, b"")
+        for following in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            chunk = following
+        await send({"type": "http.response.body", "body": chunk})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def handle(
+        self, method: str, path: str, params: dict[str, str], headers: dict[str, str]
+    ) -> _Reply:
+        """
+        Produces the reply for one request, after applying latency and fault injection.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The URL path.
+            params (dict[str, str]): Query parameters.
+            headers (dict[str, str]): Request headers, with lower-case names.
+
+        Returns:
+            The reply to send.
+        """
+        self.counts["requests"] += 1
+        delay = self.latency + (self._faults.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        wait = self._take_token()
+        if wait:
+            self.counts["throttled"] += 1
+            retry_after = self.retry_after if self.retry_after is not None else math.ceil(wait)
+            return _Reply(
+                429,
+                json.dumps({"error": "Too Many Requests"}).encode(),
+                headers={"retry-after": f"{retry_after:g}"},
+            )
+        if self.error_rate and self._faults.random() < self.error_rate:
+            self.counts["errors"] += 1
+            status = self._faults.choice(self.error_statuses)
+            return _json({"error": "Injected failure"}, status)
+
+        if method not in ("GET", "HEAD"):
+            return _json({"error": "Method Not Allowed"}, 405)
+        reply = self._route(path, params)
+        if reply.status != 200 or reply.headers["content-type"] != "application/json":
+            return reply
+
+        body = b"".join(reply.chunks)
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        reply.chunks = [body]
+        reply.headers.update({"etag": etag, "last-modified": LAST_MODIFIED})
+        if headers.get("if-none-match") == etag:
+            self.counts["not_modified"] += 1
+            return _Reply(304, headers={"etag": etag, "last-modified": LAST_MODIFIED})
+        return reply
+
+    def _take_token(self) -> float:
+        """Takes a rate limit token, returning 0 or the seconds until one is available."""
+        if not self.rate_limit:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled_at) * self.rate_limit)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate_limit
+        self._tokens -= 1
+        return 0.0
+
+    def _route(self, path: str, params: dict[str, str]) -> _Reply:
+        parts = [part for part in path.split("/") if part]
+        match parts:
+            case ["flood-monitoring", "id", "stations"]:
+                return self._collection(params, lambda index: data.station(index, self.seed))
+            case ["flood-monitoring", "data", "readings"]:
+                return self._collection(params, lambda index: data.reading(index, self.seed))
+            case ["flood-monitoring", "id", "measures", measure, "readings"]:
+                measure_uri = f"{data.ROOT}/flood-monitoring/id/measures/{measure}"
+                return self._collection(
+                    params, lambda index: data.reading(index, self.seed, measure_uri)
+                )
+            case ["hydrology", "id", "measures", measure, "readings"]:
+                return self._collection(
+                    params, lambda index: data.hydrology_reading(index, measure, self.seed)
+                )
+            case ["public-register", "api", "search.json"]:
+                return self._registrations(params)
+            case ["public-register", register, "registration.json"] if register in data.REGISTERS:
+                return self._registrations(params, register)
+            case ["public-register", "downloads", register] if register in data.REGISTERS:
+                return _Reply(
+                    200,
+                    self._csv_chunks(register),
+                    content_type="text/csv; charset=utf-8",
+                    headers={"content-disposition": f'attachment; filename="{register}.csv"'},
+                )
+        return _json({"error": f"No stand-in route for {path}"}, 404)
+
+    def _page(self, params: dict[str, str]) -> range:
+        offset = int(params.get("_offset", 0))
+        limit = params.get("_limit")
+        limit = int(limit) if limit is not None else self.default_limit
+        stop = self.size if limit is None else min(self.size, offset + limit)
+        return range(offset, max(offset, stop))
+
+    def _collection(self, params: dict[str, str], item: Callable[[int], dict[str, Any]]) -> _Reply:
+        page = self._page(params)
+        return _json(
+            {
+                "@context": f"{data.ROOT}/flood-monitoring/meta/context.jsonld",
+                "meta": {
+                    "publisher": "Environment Agency",
+                    "licence": "http://www.nationalarchives.gov.uk/doc/open-government-licence/version/3/",
+                    "documentation": f"{data.ROOT}/flood-monitoring/doc/reference",
+                    "version": "0.9",
+                    "limit": len(page),
+                    "hasFormat": [],
+                },
+                "items": [item(index) for index in page],
+            }
+        )
+
+    def _registrations(self, params: dict[str, str], register: str | None = None) -> _Reply:
+        page = self._page(params)
+        name = params.get("name-search") or params.get("name-number-search")
+        return _json(
+            {
+                "meta": data.metadata(len(page), page.start),
+                "items": [data.registration(index, self.seed, register, name) for index in page],
+            }
+        )
+
+    def _csv_chunks(self, register: str, rows_per_chunk: int = 1_000) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(data.DOWNLOAD_COLUMNS)
+        for index in range(self.download_rows):
+            writer.writerow(data.download_row(index, register, self.seed))
+            if (index + 1) % rows_per_chunk == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode()
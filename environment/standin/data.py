@@ -0,0 +1,275 @@
+"""
+Deterministic synthetic data for the stand-in server.
+
+Every item is generated from its index alone (and the server seed), so any page of
+any collection can be produced on demand without holding the collection in memory,
+and the same request always gets the same body. Item shapes follow the real APIs:
+flood-monitoring and hydrology items mirror the fields the clients' models read, and
+Public Register items are built from the schemas in `public_register/openapi.yaml`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+from functools import lru_cache
+from importlib import resources
+from typing import Any
+
+import yaml
+
+ROOT = "http://environment.data.gov.uk"
+
+REGISTERS = (
+    "waste-operations",
+    "end-of-life-vehicles",
+    "industrial-installations",
+    "water-discharges",
+    "radioactive-substance",
+    "waste-carriers-brokers",
+    "waste-exemptions",
+    "water-discharge-exemptions",
+    "scrap-metal-dealers",
+    "enforcement-action",
+    "flood-risk-exemptions",
+)
+
+DOWNLOAD_COLUMNS = (
+    "Registration Number",
+    "Register",
+    "Holder Name",
+    "Site Address",
+    "Postcode",
+    "Local Authority",
+    "Registration Date",
+    "Expiry Date",
+    "Easting",
+    "Northing",
+)
+
+_TOWNS = ("Norwich", "Leeds", "Bristol", "Exeter", "Carlisle", "Reading", "York", "Lincoln")
+_RIVERS = ("River Wensum", "River Aire", "River Avon", "River Exe", "River Eden", "River Thames")
+_NAMES = ("Acme", "Riverside", "Greenfield", "Northern", "Coastal", "Valley", "Meadow", "Harbour")
+_KINDS = ("Recycling Ltd", "Waste Services", "Metals Ltd", "Water plc", "Farms", "Holdings")
+_EPOCH = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _rng(seed: int, kind: str, index: int) -> random.Random:
+    return random.Random(f"{seed}:{kind}:{index}")
+
+
+def station(index: int, seed: int = 0) -> dict[str, Any]:
+    """Returns a flood-monitoring station."""
+    rng = _rng(seed, "station", index)
+    reference = f"S{index:06d}"
+    easting = rng.randint(140_000, 650_000)
+    northing = rng.randint(10_000, 650_000)
+    return {
+        "@id": f"{ROOT}/flood-monitoring/id/stations/{reference}",
+        "RLOIid": str(1000 + index),
+        "catchmentName": rng.choice(_RIVERS).replace("River ", "") + " catchment",
+        "dateOpened": "1994-01-01",
+        "easting": easting,
+        "northing": northing,
+        "label": f"{rng.choice(_TOWNS)} gauge {index}",
+        "lat": round(49.9 + northing / 650_000 * 5.8, 6),
+        "long": round(-5.7 + easting / 650_000 * 7.5, 6),
+        "measures": [
+            {
+                "@id": f"{ROOT}/flood-monitoring/id/measures/{reference}-level-stage-i-15_min-m",
+                "parameter": "level",
+                "parameterName": "Water Level",
+                "period": 900,
+                "qualifier": "Stage",
+                "unitName": "m",
+            }
+        ],
+        "notation": reference,
+        "riverName": rng.choice(_RIVERS),
+        "stageScale": f"{ROOT}/flood-monitoring/id/stations/{reference}/stageScale",
+        "stationReference": reference,
+        "status": f"{ROOT}/flood-monitoring/def/core/statusActive",
+        "town": rng.choice(_TOWNS),
+        "wiskiID": f"W{index:06d}",
+    }
+
+
+def reading(index: int, seed: int = 0, measure: str | None = None) -> dict[str, Any]:
+    """Returns a flood-monitoring reading, 15 minutes after the previous index."""
+    rng = _rng(seed, "reading", index)
+    when = _EPOCH + datetime.timedelta(minutes=15 * index)
+    stamp = when.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if measure is None:
+        measure = f"{ROOT}/flood-monitoring/id/measures/S{index % 1000:06d}-level-stage-i-15_min-m"
+    return {
+        "@id": f"{ROOT}/flood-monitoring/data/readings/{measure.rsplit('/', 1)[-1]}/{stamp}",
+        "dateTime": stamp,
+        "measure": measure,
+        "value": round(rng.uniform(0.1, 4.0), 3),
+    }
+
+
+def hydrology_reading(index: int, measure_id: str, seed: int = 0) -> dict[str, Any]:
+    """Returns a hydrology reading for `measure_id`, one day after the previous index."""
+    rng = _rng(seed, f"hydrology:{measure_id}", index)
+    day = _EPOCH.date() + datetime.timedelta(days=index)
+    return {
+        "measure": {"@id": f"{ROOT}/hydrology/id/measures/{measure_id}"},
+        "date": day.isoformat(),
+        "dateTime": f"{day.isoformat()}T00:00:00",
+        "value": round(rng.uniform(0.5, 120.0), 3),
+        "completeness": "Complete",
+        "quality": "Good",
+    }
+
+
+class _SpecLoader(yaml.SafeLoader):
+    """Leaves dates as strings, as they appear in JSON responses."""
+
+
+_SpecLoader.yaml_implicit_resolvers = {
+    first: [resolver for resolver in resolvers if resolver[0] != "tag:yaml.org,2002:timestamp"]
+    for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+@lru_cache(maxsize=1)
+def openapi_schemas() -> dict[str, Any]:
+    """Returns the component schemas of the bundled Public Register OpenAPI document."""
+    text = resources.files("environment.public_register").joinpath("openapi.yaml").read_text()
+    return yaml.load(text, Loader=_SpecLoader)["components"]["schemas"]
+
+
+def schema_example(schema: dict[str, Any], schemas: dict[str, Any] | None = None) -> Any:
+    """
+    Builds an example value for an OpenAPI schema.
+
+    Documented examples are used where present; otherwise objects are filled in
+    property by property, `allOf` parts are merged, and the first `oneOf`/`anyOf`
+    alternative is taken.
+
+    Args:
+        schema (dict): The schema, which may be a `$ref`.
+        schemas (dict, optional): Component schemas used to resolve references.
+            Defaults to the bundled Public Register schemas.
+
+    Returns:
+        The example value.
+    """
+    if schemas is None:
+        schemas = openapi_schemas()
+    if "$ref" in schema:
+        return schema_example(schemas[schema["$ref"].rsplit("/", 1)[-1]], schemas)
+    if "example" in schema:
+        return schema["example"]
+    if "allOf" in schema:
+        merged: Any = None
+        for part in schema["allOf"]:
+            value = schema_example(part, schemas)
+            if isinstance(merged, dict) and isinstance(value, dict):
+                merged = {**merged, **value}
+            elif value is not None:
+                merged = value
+        return merged
+    for key in ("oneOf", "anyOf"):
+        if key in schema:
+            return schema_example(schema[key][0], schemas)
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type", "object" if "properties" in schema else None)
+    if kind == "object":
+        return {
+            name: schema_example(prop, schemas)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [schema_example(schema.get("items", {}), schemas)]
+    if kind in ("number", "integer"):
+        return 0
+    if kind == "boolean":
+        return False
+    if kind == "string":
+        return {"date": "2020-01-01", "uri": f"{ROOT}/public-register/id"}.get(
+            schema.get("format"), "text"
+        )
+    return None
+
+
+def registration(
+    index: int, seed: int = 0, register: str | None = None, name: str | None = None
+) -> dict[str, Any]:
+    """
+    Returns a Public Register search result item (`RegistrationSummary` in the OpenAPI document).
+
+    Args:
+        index (int): The item's position in the collection.
+        seed (int, optional): The data seed. Defaults to 0.
+        register (str, optional): The register slug. Defaults to one chosen by `index`.
+        name (str, optional): Text included in the holder name, e.g. the `name-search` term.
+    """
+    rng = _rng(seed, "registration", index)
+    register = register or REGISTERS[index % len(REGISTERS)]
+    number = f"EPR/{chr(65 + index % 26)}{chr(65 + index // 26 % 26)}{index:07d}"
+    holder = f"{rng.choice(_NAMES)} {rng.choice(_KINDS)}"
+    if name:
+        holder = f"{name.title()} {holder}"
+    town = rng.choice(_TOWNS)
+    item = dict(_registration_template())
+    item.update(
+        {
+            "@id": f"{ROOT}/public-register/{register}/registration/{number.replace('/', '-')}",
+            "register": {
+                "@id": f"{ROOT}/public-register/{register}/register",
+                "label": register.replace("-", " ").capitalize(),
+            },
+            "registrationNumber": number,
+            "holder": {
+                "@id": f"{ROOT}/public-register/{register}/holder/{index}",
+                "name": holder,
+            },
+            "registrationDate": (_EPOCH.date() - datetime.timedelta(days=rng.randint(0, 7000))).isoformat(),
+            "site": {
+                "@id": f"{ROOT}/public-register/{register}/site/{index}",
+                "siteAddress": {
+                    "address": f"{rng.randint(1, 200)} High Street, {town}",
+                    "postcode": f"{town[:2].upper()}{rng.randint(1, 20)} {rng.randint(1, 9)}AB",
+                },
+            },
+        }
+    )
+    return item
+
+
+@lru_cache(maxsize=1)
+def _registration_template() -> dict[str, Any]:
+    return schema_example({"$ref": "#/components/schemas/RegistrationSummary"})
+
+
+def metadata(limit: int | None = None, offset: int | None = None) -> dict[str, Any]:
+    """Returns a Public Register `meta` block."""
+    meta = dict(schema_example({"$ref": "#/components/schemas/Metadata"}))
+    # The documented example is the number 0.1, but the API sends a string.
+    meta["version"] = str(meta["version"])
+    meta.pop("comment", None)
+    meta["limit"] = limit
+    meta["offset"] = offset
+    return meta
+
+
+def download_row(index: int, register: str, seed: int = 0) -> list[str]:
+    """Returns one row of a register CSV export, matching `DOWNLOAD_COLUMNS`."""
+    item = registration(index, seed, register)
+    address = item["site"]["siteAddress"]
+    rng = _rng(seed, "download", index)
+    return [
+        item["registrationNumber"],
+        register,
+        item["holder"]["name"],
+        address["address"],
+        address["postcode"],
+        rng.choice(_TOWNS),
+        item["registrationDate"],
+        "",
+        str(rng.randint(140_000, 650_000)),
+        str(rng.randint(10_000, 650_000)),
+    ]
@@ -0,0 +1,22 @@
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import TideGaugeClient
+    from .models import TideGaugeStation, TideGaugeReading
+
+__all__ = [
+    "TideGaugeClient",
+    "TideGaugeStation",
+    "TideGaugeReading",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "TideGaugeClient": ".client",
+        "TideGaugeStation": ".models",
+        "TideGaugeReading": ".models",
+    },
+)
@@ -3,52 +3,74 @@ An async client for the UK Environment Agency's Tide Gauge API.
 """
 
 import httpx
+from .._parsing import decode_items, parse_items, validate_items
+from ..instrumentation import install
 from .models import TideGaugeStation, TideGaugeReading
 
 
-async def log_request(request):
-    print(f">>> Request: {request.method} {request.url}")
-
-
-async def log_response(response):
-    # Avoid pre-reading body so VCR can capture content
-    print(f"<<< Response: {response.status_code}")
-
-
 class TideGaugeClient(httpx.AsyncClient):
     """
     An async client for the UK Environment Agency's Tide Gauge API.
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        validate=True,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            validate (bool, optional): If False, list methods return plain dicts keyed by field
+                name instead of pydantic models. Can be overridden per call. Defaults to True.
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
         """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk/flood-monitoring")
         super().__init__(
-            base_url="https://environment.data.gov.uk/flood-monitoring",
             timeout=timeout,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(log_request)
-            self.event_hooks["response"].append(log_response)
+        self.validate = validate
+        install(self, instrument, verbose)
 
-    async def get_tide_gauge_stations(self, **params) -> list[TideGaugeStation]:
+    async def get_tide_gauge_stations(
+        self, validate: bool | None = None, **params
+    ) -> list[TideGaugeStation] | list[dict]:
         """
         Returns a list of tide gauge stations.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[TideGaugeStation]: A list of tide gauge stations.
         """
         params = {"type": "TideGauge", **params}
         response = await self.get("/id/stations", params=params)
         response.raise_for_status()
-        return [TideGaugeStation(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            TideGaugeStation,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_tide_gauge_station_by_id(self, station_id: str) -> TideGaugeStation:
         """
@@ -69,24 +91,36 @@ class TideGaugeClient(httpx.AsyncClient):
             data["measures"] = [data["measures"]]
         return TideGaugeStation(**data)
 
-    async def get_tide_gauge_readings(self, **params) -> list[TideGaugeReading]:
+    async def get_tide_gauge_readings(
+        self, validate: bool | None = None, **params
+    ) -> list[TideGaugeReading] | list[dict]:
         """
         Returns a list of tide gauge readings.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[TideGaugeReading]: A list of tide gauge readings.
         """
         params = {"stationType": "TideGauge", **params}
         response = await self.get("/data/readings", params=params)
         response.raise_for_status()
-        items = response.json()["items"]
+        items = decode_items(response)
         normalised = []
         for item in items:
             data = dict(item)
             if isinstance(data.get("measure"), dict):
                 data["measure"] = data["measure"].get("@id")
             normalised.append(data)
-        return [TideGaugeReading(**data) for data in normalised]
+        return validate_items(
+            normalised,
+            TideGaugeReading,
+            validate=self.validate if validate is None else validate,
+            response=response,
+        )
 
     async def get_tide_gauge_reading_by_id(self, reading_id: str) -> TideGaugeReading:
         """
@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List
 
+from .._models import EnvironmentModel
 
-class TideGaugeStation(BaseModel):
+
+class TideGaugeStation(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     notation: Optional[str] = None
@@ -17,7 +19,7 @@ class TideGaugeStation(BaseModel):
     measures: Optional[List[dict]] = None  # Assuming measures might be a list of dicts
 
 
-class TideGaugeReading(BaseModel):
+class TideGaugeReading(EnvironmentModel):
     id: str = Field(..., alias="@id")
     dateTime: Optional[str] = None
     measure: Optional[str] = None
@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import WaterQualityDataArchiveClient
+    from .models import (
+        SamplingPoint,
+        Sample,
+        Measurement,
+        Determinand,
+        Unit,
+        DeterminandGroup,
+        Purpose,
+        EAArea,
+        EASubArea,
+        SampledMaterialType,
+        SamplingPointType,
+        SamplingPointTypeGroup,
+    )
+
+__all__ = [
+    "WaterQualityDataArchiveClient",
+    "SamplingPoint",
+    "Sample",
+    "Measurement",
+    "Determinand",
+    "Unit",
+    "DeterminandGroup",
+    "Purpose",
+    "EAArea",
+    "EASubArea",
+    "SampledMaterialType",
+    "SamplingPointType",
+    "SamplingPointTypeGroup",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "WaterQualityDataArchiveClient": ".client",
+        "SamplingPoint": ".models",
+        "Sample": ".models",
+        "Measurement": ".models",
+        "Determinand": ".models",
+        "Unit": ".models",
+        "DeterminandGroup": ".models",
+        "Purpose": ".models",
+        "EAArea": ".models",
+        "EASubArea": ".models",
+        "SampledMaterialType": ".models",
+        "SamplingPointType": ".models",
+        "SamplingPointTypeGroup": ".models",
+    },
+)
@@ -5,6 +5,8 @@ NOTE: This API will be replaced later this year (Spring/Summer 2025).
 """
 
 import httpx
+from .._parsing import parse_items
+from ..instrumentation import install
 from .models import (
     SamplingPoint,
     Sample,
@@ -21,15 +23,6 @@ from .models import (
 )
 
 
-async def log_request(request):
-    print(f">>> Request: {request.method} {request.url}")
-
-
-async def log_response(response):
-    # Avoid pre-reading body so VCR can capture content
-    print(f"<<< Response: {response.status_code}")
-
-
 class WaterQualityDataArchiveClient(httpx.AsyncClient):
     """
     An async client for the UK Environment Agency's Water Quality Data Archive API.
@@ -39,23 +32,41 @@ class WaterQualityDataArchiveClient(httpx.AsyncClient):
     working entirely. See: https://environment.data.gov.uk/apiportal/support
     """
 
-    def __init__(self, timeout=30.0, verbose=False, **kwargs):
+    def __init__(
+        self,
+        timeout=30.0,
+        verbose=False,
+        session=None,
+        validate=True,
+        instrument=None,
+        **kwargs,
+    ):
         """
         Initializes the client.
 
         Args:
             timeout (float, optional): The timeout for requests in seconds. Defaults to 30.0.
-            verbose (bool, optional): If True, logs requests and responses. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor.
-        """
+            verbose (bool, optional): If True, logs each request and its timings to the
+                `environment` logger at INFO. Nothing is shown unless the application configures
+                logging, e.g. `logging.basicConfig(level=logging.INFO)`. Defaults to False.
+            session (EnvironmentSession, optional): A session whose connection pool this client
+                shares with other clients. Defaults to None (the client opens its own pool).
+            validate (bool, optional): If False, list methods return plain dicts keyed by field
+                name instead of pydantic models. Can be overridden per call. Defaults to True.
+            instrument (Instrument | Sequence[Instrument], optional): Receives per-request timings,
+                byte and item counts (see `environment.instrumentation`). Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the httpx.AsyncClient constructor,
+                e.g. `base_url` to point the client at a stand-in server.
+        """
+        if session is not None:
+            kwargs.setdefault("transport", session.transport)
+        kwargs.setdefault("base_url", "https://environment.data.gov.uk/water-quality/view")
         super().__init__(
-            base_url="https://environment.data.gov.uk/water-quality/view",
             timeout=timeout,
             **kwargs,
         )
-        if verbose:
-            self.event_hooks["request"].append(log_request)
-            self.event_hooks["response"].append(log_response)
+        self.validate = validate
+        install(self, instrument, verbose)
 
         # Warn users that this API is being replaced and may be unavailable.
         try:
@@ -74,16 +85,27 @@ class WaterQualityDataArchiveClient(httpx.AsyncClient):
             # Best-effort warning only
             pass
 
-    async def get_sampling_points(self, **params) -> list[SamplingPoint]:
+    async def get_sampling_points(
+        self, validate: bool | None = None, **params
+    ) -> list[SamplingPoint] | list[dict]:
         """
         Returns a list of sampling points.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[SamplingPoint]: A list of sampling points.
         """
         response = await self.get("/id/sampling-point", params=params)
         response.raise_for_status()
-        return [SamplingPoint(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            SamplingPoint,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_sampling_point_by_id(self, sampling_point_id: str) -> SamplingPoint:
         """
@@ -99,16 +121,27 @@ class WaterQualityDataArchiveClient(httpx.AsyncClient):
         response.raise_for_status()
         return SamplingPoint(**response.json()["items"][0])
 
-    async def get_samples(self, **params) -> list[Sample]:
+    async def get_samples(
+        self, validate: bool | None = None, **params
+    ) -> list[Sample] | list[dict]:
         """
         Returns a list of samples.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Sample]: A list of samples.
         """
         response = await self.get("/data/sample", params=params)
         response.raise_for_status()
-        return [Sample(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Sample,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_sample_by_id(self, sample_id: str) -> Sample:
         """
@@ -124,16 +157,27 @@ class WaterQualityDataArchiveClient(httpx.AsyncClient):
         response.raise_for_status()
         return Sample(**response.json()["items"][0])
 
-    async def get_measurements(self, **params) -> list[Measurement]:
+    async def get_measurements(
+        self, validate: bool | None = None, **params
+    ) -> list[Measurement] | list[dict]:
         """
         Returns a list of measurements.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Measurement]: A list of measurements.
         """
         response = await self.get("/data/measurement", params=params)
         response.raise_for_status()
-        return [Measurement(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Measurement,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_measurement_by_id(self, measurement_id: str) -> Measurement:
         """
@@ -149,114 +193,222 @@ class WaterQualityDataArchiveClient(httpx.AsyncClient):
         response.raise_for_status()
         return Measurement(**response.json()["items"][0])
 
-    async def get_determinands(self, **params) -> list[Determinand]:
+    async def get_determinands(
+        self, validate: bool | None = None, **params
+    ) -> list[Determinand] | list[dict]:
         """
         Returns a list of determinands.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Determinand]: A list of determinands.
         """
         response = await self.get("/def/determinands", params=params)
         response.raise_for_status()
-        return [Determinand(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Determinand,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_units(self, **params) -> list[Unit]:
+    async def get_units(
+        self, validate: bool | None = None, **params
+    ) -> list[Unit] | list[dict]:
         """
         Returns a list of units.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Unit]: A list of units.
         """
         response = await self.get("/def/units", params=params)
         response.raise_for_status()
-        return [Unit(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Unit,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_determinand_groups(self, **params) -> list[DeterminandGroup]:
+    async def get_determinand_groups(
+        self, validate: bool | None = None, **params
+    ) -> list[DeterminandGroup] | list[dict]:
         """
         Returns a list of determinand groups.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[DeterminandGroup]: A list of determinand groups.
         """
         response = await self.get("/def/determinand-groups", params=params)
         response.raise_for_status()
-        return [DeterminandGroup(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            DeterminandGroup,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_purposes(self, **params) -> list[Purpose]:
+    async def get_purposes(
+        self, validate: bool | None = None, **params
+    ) -> list[Purpose] | list[dict]:
         """
         Returns a list of purposes.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Purpose]: A list of purposes.
         """
         response = await self.get("/def/purposes", params=params)
         response.raise_for_status()
-        return [Purpose(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Purpose,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_ea_areas(self, **params) -> list[EAArea]:
+    async def get_ea_areas(
+        self, validate: bool | None = None, **params
+    ) -> list[EAArea] | list[dict]:
         """
         Returns a list of EA areas.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[EAArea]: A list of EA areas.
         """
         response = await self.get("/id/ea-area", params=params)
         response.raise_for_status()
-        return [EAArea(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            EAArea,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_ea_subareas(self, **params) -> list[EASubArea]:
+    async def get_ea_subareas(
+        self, validate: bool | None = None, **params
+    ) -> list[EASubArea] | list[dict]:
         """
         Returns a list of EA subareas.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[EASubArea]: A list of EA subareas.
         """
         response = await self.get("/id/ea-subarea", params=params)
         response.raise_for_status()
-        return [EASubArea(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            EASubArea,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_sampled_material_types(self, **params) -> list[SampledMaterialType]:
+    async def get_sampled_material_types(
+        self, validate: bool | None = None, **params
+    ) -> list[SampledMaterialType] | list[dict]:
         """
         Returns a list of sampled material types.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[SampledMaterialType]: A list of sampled material types.
         """
         response = await self.get("/def/sampled-material-types", params=params)
         response.raise_for_status()
-        return [SampledMaterialType(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            SampledMaterialType,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_sampling_point_types(self, **params) -> list[SamplingPointType]:
+    async def get_sampling_point_types(
+        self, validate: bool | None = None, **params
+    ) -> list[SamplingPointType] | list[dict]:
         """
         Returns a list of sampling point types.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[SamplingPointType]: A list of sampling point types.
         """
         response = await self.get("/def/sampling-point-types", params=params)
         response.raise_for_status()
-        return [SamplingPointType(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            SamplingPointType,
+            validate=self.validate if validate is None else validate,
+        )
 
     async def get_sampling_point_type_groups(
-        self, **params
-    ) -> list[SamplingPointTypeGroup]:
+        self, validate: bool | None = None, **params
+    ) -> list[SamplingPointTypeGroup] | list[dict]:
         """
         Returns a list of sampling point type groups.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[SamplingPointTypeGroup]: A list of sampling point type groups.
         """
         response = await self.get("/def/sampling-point-type-groups", params=params)
         response.raise_for_status()
-        return [SamplingPointTypeGroup(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            SamplingPointTypeGroup,
+            validate=self.validate if validate is None else validate,
+        )
 
-    async def get_batch_measurements(self, **params) -> list[Measurement]:
+    async def get_batch_measurements(
+        self, validate: bool | None = None, **params
+    ) -> list[Measurement] | list[dict]:
         """
         Returns a list of measurements from a batch query.
 
+        Args:
+            validate (bool, optional): If False, returns plain dicts keyed by field name
+                instead of validated models. Defaults to the client's `validate` setting.
+            **params: Query parameters to filter the results.
+
         Returns:
             list[Measurement]: A list of measurements.
         """
         response = await self.get("/batch/measurement", params=params)
         response.raise_for_status()
-        return [Measurement(**item) for item in response.json()["items"]]
+        return parse_items(
+            response,
+            Measurement,
+            validate=self.validate if validate is None else validate,
+        )
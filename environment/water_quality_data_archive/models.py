@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional
 
+from .._models import EnvironmentModel
 
-class SamplingPoint(BaseModel):
+
+class SamplingPoint(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     easting: Optional[float] = None
@@ -19,7 +21,7 @@ class SamplingPoint(BaseModel):
     eaSubArea: Optional[str] = None
 
 
-class Sample(BaseModel):
+class Sample(EnvironmentModel):
     id: str = Field(..., alias="@id")
     sampleDateTime: Optional[str] = None
     samplingPoint: Optional[str] = None
@@ -31,7 +33,7 @@ class Sample(BaseModel):
     unit: Optional[str] = None
 
 
-class Measurement(BaseModel):
+class Measurement(EnvironmentModel):
     id: str = Field(..., alias="@id")
     measurementDateTime: Optional[str] = None
     sample: Optional[str] = None
@@ -43,7 +45,7 @@ class Measurement(BaseModel):
     status: Optional[str] = None
 
 
-class Determinand(BaseModel):
+class Determinand(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
@@ -51,56 +53,56 @@ class Determinand(BaseModel):
     unit: Optional[str] = None
 
 
-class Unit(BaseModel):
+class Unit(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
     description: Optional[str] = None
 
 
-class DeterminandGroup(BaseModel):
+class DeterminandGroup(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
     description: Optional[str] = None
 
 
-class Purpose(BaseModel):
+class Purpose(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
     description: Optional[str] = None
 
 
-class EAArea(BaseModel):
+class EAArea(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
     description: Optional[str] = None
 
 
-class EASubArea(BaseModel):
+class EASubArea(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
     description: Optional[str] = None
 
 
-class SampledMaterialType(BaseModel):
+class SampledMaterialType(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
     description: Optional[str] = None
 
 
-class SamplingPointType(BaseModel):
+class SamplingPointType(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
     description: Optional[str] = None
 
 
-class SamplingPointTypeGroup(BaseModel):
+class SamplingPointTypeGroup(EnvironmentModel):
     id: str = Field(..., alias="@id")
     label: Optional[str] = None
     # Additional fields based on documentation
@@ -1,10 +1,14 @@
 import asyncio
+import logging
 
 from environment.flood_monitoring import FloodClient
 
 
 async def main() -> None:
     # Minimal smoke: hit a couple of endpoints and print counts.
+    # verbose=True logs to the `environment` logger, which is silent until configured.
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("environment").setLevel(logging.INFO)
     async with FloodClient(verbose=True) as client:
         flood_warnings = await client.get_flood_warnings()
         print(f"Flood warnings: {len(flood_warnings)}")
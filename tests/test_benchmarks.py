@@ -0,0 +1,51 @@
+import json
+import time
+
+import pytest
+from benchmarks.replay import load_cassette, scale_payload
+from benchmarks.suite import CASES, Result, compare, load, measure, save
+
+
+def test_scale_payload_repeats_recorded_items():
+    recorded = load_cassette("test_get_bathing_waters.yaml")[0]
+    scaled = scale_payload(recorded, 25)
+    items = json.loads(scaled.body)["result"]["items"]
+    assert len(items) == 25
+    assert len({item["_about"] for item in items}) == 25
+    assert all(key.lower() != "content-encoding" for key, _ in scaled.headers)
+
+
+@pytest.mark.asyncio
+async def test_measure_reports_throughput_parse_time_and_memory():
+    case = next(case for case in CASES if case.name == "rainfall.get_readings")
+    interactions = [scale_payload(load_cassette(case.cassette)[0], 50)]
+    result = await measure(case, interactions, "50", validate=True, min_time=0, min_rounds=2)
+    assert result.items == 50
+    assert result.requests_per_sec > 0
+    assert result.parse_us_per_item > 0
+    assert result.peak_memory_bytes > 0
+
+
+def test_results_round_trip_and_compare(tmp_path):
+    before = Result("rainfall.get_readings", "recorded", True, 500, 1000, 100.0, 2.0, 1024)
+    after = before._replace(requests_per_sec=110.0, parse_us_per_item=1.0)
+    path = save([before], tmp_path / "old.json")
+    [(_, _, throughput, parse)] = compare(load(path), [after])
+    assert throughput == pytest.approx(0.1)
+    assert parse == pytest.approx(-0.5)
+
+
+def test_checkout_runs_do_not_overwrite_each_other(tmp_path, monkeypatch):
+    clock = iter([0, 0, 60, 60])
+    gmtime = time.gmtime
+    monkeypatch.setattr("benchmarks.suite.RESULTS_DIR", tmp_path)
+    monkeypatch.setattr("benchmarks.suite.package_version", lambda: "dev")
+    monkeypatch.setattr("benchmarks.suite.time.gmtime", lambda: gmtime(next(clock)))
+    result = Result("rainfall.get_readings", "recorded", True, 500, 1000, 100.0, 2.0, 1024)
+
+    first = save([result])
+    second = save([result._replace(requests_per_sec=110.0)])
+
+    assert first.name == "dev-19700101T000000Z.json"
+    assert second.name == "dev-19700101T000100Z.json"
+    assert load(first)[0].requests_per_sec == 100.0
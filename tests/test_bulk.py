@@ -0,0 +1,62 @@
+import httpx
+import pytest
+from environment.hydrology.client import HydrologyClient
+from environment.rainfall.client import RainfallClient
+
+
+@pytest.mark.asyncio
+async def test_rainfall_get_readings_for_measures():
+    def handler(request):
+        notation = request.url.path.split("/")[-2]
+        item = {
+            "@id": f"http://example/data/readings/{notation}/1",
+            "measure": {"@id": f"http://example/id/measures/{notation}"},
+            "value": 0.2,
+        }
+        return httpx.Response(200, json={"items": [item]})
+
+    async with RainfallClient(transport=httpx.MockTransport(handler)) as client:
+        results = await client.get_readings_for_measures(["R1", "R2"])
+
+    assert set(results) == {"R1", "R2"}
+    assert results["R2"][0].measure == "http://example/id/measures/R2"
+
+
+@pytest.mark.asyncio
+async def test_hydrology_get_readings_for_measures():
+    def handler(request):
+        notation = request.url.path.split("/")[-2]
+        if notation == "bad":
+            return httpx.Response(500)
+        assert request.url.params["min-date"] == "2024-01-01"
+        item = {"measure": {"@id": f"http://example/id/measures/{notation}"}, "value": 1.5}
+        return httpx.Response(200, json={"items": [item]})
+
+    async with HydrologyClient(transport=httpx.MockTransport(handler)) as client:
+        results = await client.get_readings_for_measures(
+            ["H1", "bad"], since="2024-01-01"
+        )
+
+    assert results["H1"][0].value == 1.5
+    assert isinstance(results["bad"], httpx.HTTPStatusError)
+
+
+@pytest.mark.asyncio
+async def test_hydrology_unvalidated_measures_are_normalised():
+    def handler(request):
+        item = {
+            "@id": "http://example/id/measures/H1",
+            "station": {"@id": "http://example/id/stations/S1"},
+            "unit": {"@id": "http://example/unit/m"},
+        }
+        return httpx.Response(200, json={"items": [item]})
+
+    async with HydrologyClient(
+        validate=False, transport=httpx.MockTransport(handler)
+    ) as client:
+        (record,) = await client.get_measures()
+        (model,) = await client.get_measures(validate=True)
+
+    assert record["station"] == "http://example/id/stations/S1"
+    assert record["unit"] == "http://example/unit/m"
+    assert record["id"] == model.id
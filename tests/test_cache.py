@@ -0,0 +1,124 @@
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+from environment import EnvironmentSession
+from environment.cache import CacheEntry, CacheTransport, MemoryCache, SQLiteCache
+from environment.flood_monitoring import FloodClient
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.paths = []
+
+    async def handle_async_request(self, request):
+        self.paths.append(request.url.path)
+        body = gzip.compress(json.dumps({"items": [{"@id": str(len(self.paths))}]}).encode())
+        return httpx.Response(200, headers={"content-encoding": "gzip"}, content=body)
+
+
+def _entry(content=b"x", stored_at=0.0):
+    return CacheEntry(200, [("content-type", "application/json")], content, stored_at)
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_fresh_responses(tmp_path):
+    inner = CountingTransport()
+    backend = SQLiteCache(tmp_path / "cache.db")
+    async with httpx.AsyncClient(transport=CacheTransport(inner, backend)) as client:
+        first = await client.get("https://example/id/stations", params={"b": 1, "a": 2})
+        second = await client.get("https://example/id/stations", params={"a": 2, "b": 1})
+        await client.get("https://example/downloads/waste-operations")
+        await client.get("https://example/downloads/waste-operations")
+
+    assert first.json() == second.json() == {"items": [{"@id": "1"}]}
+    assert (first.extensions["cache"], second.extensions["cache"]) == ("miss", "hit")
+    assert inner.paths == ["/id/stations", "/downloads/waste-operations", "/downloads/waste-operations"]
+
+    # A new process reading the same file starts warm.
+    restarted = CacheTransport(CountingTransport(), SQLiteCache(tmp_path / "cache.db"))
+    async with httpx.AsyncClient(transport=restarted) as client:
+        response = await client.get("https://example/id/stations?a=2&b=1")
+    assert response.extensions["cache"] == "hit"
+    assert restarted.transport.paths == []
+
+
+@pytest.mark.asyncio
+async def test_cache_expiry_and_stale_while_revalidate(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("environment.cache.time.time", lambda: clock[0])
+    inner = CountingTransport()
+    transport = CacheTransport(inner, ttls=[("/readings", 60.0)], stale_while_revalidate=30.0)
+    async with FloodClient(transport=transport) as client:
+        await client.get("/data/readings")
+        clock[0] += 75
+        stale = await client.get("/data/readings")
+        await asyncio.sleep(0)
+        assert stale.extensions["cache"] == "stale"
+        assert stale.json()["items"][0]["@id"] == "1"
+        assert len(inner.paths) == 2
+        fresh = await client.get("/data/readings")
+        assert fresh.json()["items"][0]["@id"] == "2"
+        clock[0] += 200
+        expired = await client.get("/data/readings")
+        assert expired.extensions["cache"] == "miss"
+    assert len(inner.paths) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_revalidation_is_logged_and_close_cancels_pending(monkeypatch, caplog):
+    clock = [1000.0]
+    monkeypatch.setattr("environment.cache.time.time", lambda: clock[0])
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 2:
+            raise httpx.ConnectError("down")
+        if len(calls) == 3:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"items": []})
+
+    transport = CacheTransport(
+        httpx.MockTransport(handler), ttls=[("/readings", 60.0)], stale_while_revalidate=30.0
+    )
+    async with httpx.AsyncClient(transport=transport, base_url="https://example") as client:
+        await client.get("/data/readings")
+        clock[0] += 75
+        with caplog.at_level("WARNING", logger="environment.cache"):
+            assert (await client.get("/data/readings")).extensions["cache"] == "stale"
+            await asyncio.sleep(0.01)
+        assert "Revalidating" in caplog.text
+        assert transport._revalidating == {}
+
+        assert (await client.get("/data/readings")).extensions["cache"] == "stale"
+        await asyncio.sleep(0)
+        (pending,) = transport._revalidating.values()
+
+    assert pending.cancelled()
+    assert transport._revalidating == {}
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_backends_evict_least_recently_used(backend, tmp_path):
+    cache = MemoryCache(max_bytes=10) if backend == "memory" else SQLiteCache(tmp_path / "c.db", 10)
+    cache.set("a", _entry(b"aaaa"))
+    cache.set("b", _entry(b"bbbb"))
+    assert cache.get("a") is not None
+    cache.set("c", _entry(b"cccc"))
+    assert cache.get("b") is None
+    assert cache.get("a").content == b"aaaa"
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_session_cache():
+    inner = CountingTransport()
+    async with EnvironmentSession(transport=inner, cache=MemoryCache()) as session:
+        async with FloodClient(session=session) as client:
+            await client.get_stations(validate=False)
+            stations = await client.get_stations(validate=False)
+    assert stations[0]["id"] == "1"
+    assert len(inner.paths) == 1
@@ -1,5 +1,11 @@
+import math
+
+import httpx
 import pytest
 from environment.flood_monitoring.client import FloodClient
+from environment.flood_monitoring.frame import ReadingsFrame
+from environment.flood_monitoring.polygons import FloodAreaPolygons
+from environment.flood_monitoring.watcher import FloodWarningWatcher
 from environment.flood_monitoring.models import (
     FloodWarning,
     FloodArea,
@@ -52,3 +58,392 @@ async def test_get_readings():
     readings = await client.get_readings()
     assert isinstance(readings, list)
     assert isinstance(readings[0], Reading)
+
+
+def _reading_item(index):
+    return {
+        "@id": f"http://environment.data.gov.uk/flood-monitoring/data/readings/M1/{index}",
+        "dateTime": "2024-01-01T00:00:00Z",
+        "measure": "http://environment.data.gov.uk/flood-monitoring/id/measures/M1",
+        "value": float(index),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_iter_readings_walks_pages(prefetch):
+    total = 7
+    offsets = []
+
+    def handler(request):
+        limit = int(request.url.params["_limit"])
+        offset = int(request.url.params["_offset"])
+        offsets.append(offset)
+        assert request.url.params["since"] == "2024-01-01T00:00:00Z"
+        items = [_reading_item(i) for i in range(offset, min(offset + limit, total))]
+        return httpx.Response(200, json={"items": items})
+
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        readings = [
+            reading
+            async for reading in client.iter_readings(
+                page_size=3, prefetch=prefetch, since="2024-01-01T00:00:00Z"
+            )
+        ]
+
+    assert [reading.value for reading in readings] == [float(i) for i in range(total)]
+    assert all(isinstance(reading, Reading) for reading in readings)
+    assert sorted(offsets) == [0, 3, 6]
+
+
+@pytest.mark.asyncio
+async def test_get_readings_for_measures_isolates_errors():
+    def handler(request):
+        notation = request.url.path.split("/")[-2]
+        if notation == "missing":
+            return httpx.Response(404)
+        assert request.url.params["since"] == "2024-01-01T00:00:00Z"
+        item = _reading_item(0) | {"measure": f"http://example/id/measures/{notation}"}
+        return httpx.Response(200, json={"items": [item]})
+
+    measure_ids = [
+        "http://environment.data.gov.uk/flood-monitoring/id/measures/M1",
+        "M2",
+        "missing",
+        "M2",
+    ]
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        results = await client.get_readings_for_measures(
+            measure_ids, since="2024-01-01T00:00:00Z", max_concurrency=2
+        )
+
+    assert list(results) == measure_ids[:3]
+    assert results[measure_ids[0]][0].measure.endswith("/M1")
+    assert results["M2"][0].measure.endswith("/M2")
+    assert isinstance(results["missing"], httpx.HTTPStatusError)
+
+
+@pytest.mark.asyncio
+async def test_get_readings_as_frame():
+    measure_a = "http://environment.data.gov.uk/flood-monitoring/id/measures/A"
+    measure_b = "http://environment.data.gov.uk/flood-monitoring/id/measures/B"
+    items = [
+        {"@id": "r1", "dateTime": "2024-01-01T00:00:00Z", "measure": measure_a, "value": 1.0},
+        {"@id": "r2", "dateTime": "2024-01-01T00:00:00Z", "measure": measure_b, "value": 2.0},
+        {"@id": "r3", "dateTime": "2024-01-01T00:15:00Z", "measure": measure_a, "value": [3.0, 3.1]},
+    ]
+
+    def handler(request):
+        return httpx.Response(200, json={"items": items})
+
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        frame = await client.get_readings(as_frame=True)
+
+    assert isinstance(frame, ReadingsFrame)
+    assert len(frame) == 3
+    assert frame.measures == [measure_a, measure_b]
+    assert list(frame.measure_codes) == [0, 1, 0]
+    assert list(frame.values) == [1.0, 2.0, 3.0]
+    assert frame.timestamps[2] - frame.timestamps[0] == 900
+    assert frame[0] == (measure_a, frame.timestamps[0], 1.0)
+
+    head = frame[:2]
+    assert isinstance(head, ReadingsFrame)
+    assert head.measure_ids == [measure_a, measure_b]
+    head.append("http://environment.data.gov.uk/flood-monitoring/id/measures/C", "2024-01-01T00:30:00Z", 4.0)
+    assert head.measures[-1].endswith("/C")
+    assert frame.measures == [measure_a, measure_b]
+    assert len(frame) == 3
+
+    groups = frame.group_by_measure()
+    assert list(groups[measure_a].values) == [1.0, 3.0]
+    assert len(groups[measure_b]) == 1
+
+    view = frame.columns()["values"]
+    assert view.obj is frame.values
+
+    readings = frame.to_readings()
+    assert readings[1].measure == measure_b
+    assert readings[1].date_time == "2024-01-01T00:00:00Z"
+    assert readings[1].id.endswith("/data/readings/B/2024-01-01T00:00:00Z")
+
+
+def _warning_item(area_id, severity_level=3, changed="2024-01-01T10:00:00"):
+    return {
+        "@id": f"http://environment.data.gov.uk/flood-monitoring/id/floods/{area_id}",
+        "description": f"Area {area_id}",
+        "eaAreaName": "Thames",
+        "eaRegionName": "South East",
+        "floodArea": {
+            "@id": f"http://environment.data.gov.uk/flood-monitoring/id/floodAreas/{area_id}",
+            "county": "Oxfordshire",
+            "notation": area_id,
+            "polygon": f"http://environment.data.gov.uk/flood-monitoring/id/floodAreas/{area_id}/polygon",
+        },
+        "floodAreaID": area_id,
+        "isTidal": False,
+        "message": "",
+        "severity": "Flood alert",
+        "severityLevel": severity_level,
+        "timeMessageChanged": changed,
+        "timeRaised": "2024-01-01T09:00:00",
+        "timeSeverityChanged": "2024-01-01T09:00:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_flood_warning_watcher_emits_only_changes():
+    polls = [
+        [_warning_item("A"), _warning_item("B")],
+        [_warning_item("A"), _warning_item("B", severity_level=2)],
+        [_warning_item("B", severity_level=2), _warning_item("C")],
+        [_warning_item("B", severity_level=2), _warning_item("C")],
+    ]
+
+    def handler(request):
+        return httpx.Response(200, json={"items": polls.pop(0)})
+
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        watcher = FloodWarningWatcher(client)
+        first = await watcher.poll()
+        second = await watcher.poll()
+        third = await watcher.poll()
+        fourth = await watcher.poll()
+
+    assert [(e.kind, e.flood_area_id) for e in first] == [("added", "A"), ("added", "B")]
+    assert [(e.kind, e.flood_area_id) for e in second] == [("changed", "B")]
+    assert second[0].previous.severity_level == 3
+    assert second[0].warning.severity_level == 2
+    assert [(e.kind, e.flood_area_id) for e in third] == [("added", "C"), ("removed", "A")]
+    assert fourth == []
+    assert set(watcher.warnings) == {"B", "C"}
+
+
+def _conditional_handler(requests, items):
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, headers={"etag": '"v1"'}, json={"items": items})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_reuse_parsed_results():
+    requests = []
+    handler = _conditional_handler(requests, [_warning_item("A")])
+    async with FloodClient(conditional=True, transport=httpx.MockTransport(handler)) as client:
+        first = await client.get_flood_warnings()
+        second = await client.get_flood_warnings()
+        raw = await client.get_flood_warnings(validate=False)
+
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    assert second[0] is first[0]
+    # Results parsed differently are stored separately.
+    assert "if-none-match" not in requests[2].headers
+    assert raw[0]["flood_area_id"] == "A"
+
+
+@pytest.mark.asyncio
+async def test_watcher_skips_unmodified_polls():
+    requests = []
+    handler = _conditional_handler(requests, [_warning_item("A")])
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        watcher = FloodWarningWatcher(client)
+        assert len(await watcher.poll()) == 1
+        assert await watcher.poll() == []
+
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    assert set(watcher.warnings) == {"A"}
+
+
+@pytest.mark.asyncio
+async def test_watcher_failed_poll_keeps_previous_state():
+    broken = _warning_item("B")
+    del broken["@id"]
+    polls = [
+        [_warning_item("A")],
+        [_warning_item("A", severity_level=2), broken],
+        [_warning_item("A", severity_level=2), _warning_item("B")],
+    ]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        version = f'"v{len(requests)}"'
+        if request.headers.get("if-none-match") == version:
+            return httpx.Response(304, headers={"etag": version})
+        return httpx.Response(200, headers={"etag": version}, json={"items": polls.pop(0)})
+
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        watcher = FloodWarningWatcher(client)
+        assert len(await watcher.poll()) == 1
+        with pytest.raises(ValueError):
+            await watcher.poll()
+        events = await watcher.poll()
+
+    # The failed poll did not advance the validators or the known warnings.
+    assert requests[2].headers["if-none-match"] == '"v1"'
+    assert [(e.kind, e.flood_area_id) for e in events] == [("changed", "A"), ("added", "B")]
+    assert events[0].previous.severity_level == 3
+
+
+ARCHIVE_MEASURE = "http://environment.data.gov.uk/flood-monitoring/id/measures/{}"
+
+
+def _archive_handler(requested):
+    def handler(request):
+        requested.append(request.url.path)
+        day = request.url.path.rsplit("readings-", 1)[1].removesuffix(".csv")
+        body = "dateTime,measure,value\n" + "".join(
+            f"{day}T00:{minute:02d}:00Z,{ARCHIVE_MEASURE.format(notation)},{minute}.5\n"
+            for minute in (0, 15)
+            for notation in ("A", "B")
+        )
+        return httpx.Response(200, content=body.encode())
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_iter_archive_readings_filters_measures():
+    requested = []
+    async with FloodClient(transport=httpx.MockTransport(_archive_handler(requested))) as client:
+        readings = [
+            reading
+            async for reading in client.iter_archive_readings("2024-01-02", measures=["B"])
+        ]
+
+    assert requested == ["/flood-monitoring/archive/readings-2024-01-02.csv"]
+    assert [reading.value for reading in readings] == [0.5, 15.5]
+    assert readings[0].measure == ARCHIVE_MEASURE.format("B")
+    assert readings[0].id.endswith("/data/readings/B/2024-01-02T00:00:00Z")
+
+
+@pytest.mark.asyncio
+async def test_iter_archive_readings_coerces_bad_values():
+    body = (
+        "dateTime,measure,value\n"
+        f"2024-01-02T00:00:00Z,{ARCHIVE_MEASURE.format('A')},\n"
+        f"2024-01-02T00:00:00Z,{ARCHIVE_MEASURE.format('B')},1.25|1.5\n"
+        f"2024-01-02T00:15:00Z,{ARCHIVE_MEASURE.format('A')},0.75\n"
+    )
+
+    def handler(request):
+        return httpx.Response(200, content=body.encode())
+
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        readings = [reading async for reading in client.iter_archive_readings("2024-01-02")]
+
+    assert len(readings) == 3
+    assert math.isnan(readings[0].value)
+    assert [reading.value for reading in readings[1:]] == [1.25, 0.75]
+
+
+@pytest.mark.asyncio
+async def test_archive_range_and_frame():
+    requested = []
+    async with FloodClient(transport=httpx.MockTransport(_archive_handler(requested))) as client:
+        readings = [
+            reading
+            async for reading in client.iter_archive_readings_range("2024-01-30", "2024-02-01")
+        ]
+        frame = await client.get_archive_frame(
+            "2024-01-01", "2024-01-02", measures=[ARCHIVE_MEASURE.format("A")]
+        )
+
+    assert len(readings) == 12
+    assert requested[:3] == [
+        "/flood-monitoring/archive/readings-2024-01-30.csv",
+        "/flood-monitoring/archive/readings-2024-01-31.csv",
+        "/flood-monitoring/archive/readings-2024-02-01.csv",
+    ]
+    assert isinstance(frame, ReadingsFrame)
+    assert len(frame) == 4
+    assert frame.measures == [ARCHIVE_MEASURE.format("A")]
+    assert frame.timestamps[2] - frame.timestamps[0] == 86400
+
+
+def _square(x0, y0, size):
+    return [[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size], [x0, y0]]
+
+
+POLYGON_DOCUMENTS = {
+    # A 1x1 degree square with a hole in the middle
+    "AREA1": {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [_square(-1.0, 51.0, 1.0), _square(-0.6, 51.4, 0.2)],
+                },
+            }
+        ],
+    },
+    # Two small squares, one overlapping AREA1
+    "AREA2": {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "MultiPolygon",
+                    "coordinates": [[_square(-0.2, 51.8, 0.5)], [_square(2.0, 53.0, 0.1)]],
+                },
+            }
+        ],
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_flood_area_polygons_lookup_and_disk_cache(tmp_path):
+    requested = []
+
+    def handler(request):
+        notation = request.url.path.split("/")[-2]
+        requested.append(notation)
+        return httpx.Response(200, json=POLYGON_DOCUMENTS[notation])
+
+    warnings = [FloodWarning(**_warning_item(notation)) for notation in POLYGON_DOCUMENTS]
+    points = [(51.1, -0.9), (51.5, -0.5), (51.9, -0.1), (53.05, 2.05), (40.0, 0.0)]
+
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        polygons = FloodAreaPolygons(client, cache_dir=tmp_path)
+        errors = await polygons.load(warnings)
+        assert errors == {}
+        assert sorted(requested) == ["AREA1", "AREA2"]
+        found = polygons.areas_containing(points)
+        assert found[0] == ["AREA1"]
+        assert found[1] == []
+        assert sorted(found[2]) == ["AREA1", "AREA2"]
+        assert found[3] == ["AREA2"]
+        assert found[4] == []
+
+        cached = FloodAreaPolygons(client, cache_dir=tmp_path)
+        await cached.load(warnings)
+        assert len(requested) == 2
+        assert cached.contains("AREA2", 53.05, 2.05)
+
+
+@pytest.mark.asyncio
+async def test_flood_area_polygons_cache_write_failure_is_not_fatal(tmp_path, caplog):
+    def handler(request):
+        return httpx.Response(200, json=POLYGON_DOCUMENTS[request.url.path.split("/")[-2]])
+
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    warnings = [FloodWarning(**_warning_item("AREA1"))]
+
+    async with FloodClient(transport=httpx.MockTransport(handler)) as client:
+        polygons = FloodAreaPolygons(client, cache_dir=blocker)
+        with caplog.at_level("WARNING", logger="environment.flood_monitoring.polygons"):
+            errors = await polygons.load(warnings)
+
+    assert errors == {}
+    assert "AREA1" in polygons
+    assert "Could not cache polygon for AREA1" in caplog.text
@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+import pytest
+from environment.coalesce import SingleFlight
+from environment.public_register import PublicRegisterClient
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_result():
+    flight = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    results = await asyncio.gather(*(flight.do("key", call) for _ in range(5)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight == 0
+
+    # Without a memo, a later call goes upstream again.
+    await flight.do("key", call)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_but_not_memoised():
+    flight = SingleFlight(ttl=60)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ValueError("boom")
+        return "ok"
+
+    results = await asyncio.gather(
+        flight.do("key", call), flight.do("key", call), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert await flight.do("key", call) == "ok"
+    assert await flight.do("key", call) == "ok"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", call))
+    second = asyncio.ensure_future(flight.do("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+async def test_public_register_coalesces_by_id_calls():
+    requests = []
+
+    async def handler(request):
+        requests.append(request.url.path)
+        await asyncio.sleep(0.01)
+        item = {"@id": "x", "register": {"@id": "r"}, "registrationNumber": "CB/1"}
+        return httpx.Response(200, json={"items": [item]})
+
+    async with PublicRegisterClient(
+        coalesce=SingleFlight(ttl=30), transport=httpx.MockTransport(handler)
+    ) as client:
+        details = await asyncio.gather(
+            *(client.get_waste_operation_by_id("CB/1") for _ in range(10)),
+            client.get_waste_exemption_by_id("CB/1"),
+        )
+        again = await client.get_waste_operation_by_id("CB/1")
+
+    assert len(requests) == 2
+    assert again is details[0]
@@ -0,0 +1,116 @@
+import httpx
+import pytest
+from environment.public_register import CompletionCache, PublicRegisterClient
+from environment.public_register import completion
+
+NAMES = ["Thames Water Utilities", "Thames Valley Recycling", "North Thames Waste", "Thameside Skips"]
+
+
+def test_longer_prefix_is_filtered_locally_when_complete():
+    cache = CompletionCache()
+    cache.put("Thames", 10, NAMES[:3])
+
+    assert cache.get("thames wa", 10) == ["Thames Water Utilities", "North Thames Waste"]
+    assert cache.get("Thames Wa", 1) == ["Thames Water Utilities"]
+    assert cache.get("Thames", 10) == NAMES[:3]
+    assert cache.get("Tham", 10) is None
+    assert cache.get("Thames", 10, params={"register": "waste-operations"}) is None
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+def test_truncated_results_are_only_reused_for_the_same_query():
+    cache = CompletionCache()
+    cache.put("Tha", 3, NAMES[:3])
+
+    assert cache.get("Thames", 3) is None
+    assert cache.get("Tha", 2) == NAMES[:2]
+    assert cache.get("Tha", 5) is None
+
+    cache.put("Thames", None, NAMES[:2])
+    assert cache.get("Thames") == NAMES[:2]
+    assert cache.get("Thames W") is None
+
+
+def test_entries_expire_and_lru_is_bounded(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(completion.time, "monotonic", lambda: now[0])
+    cache = CompletionCache(ttl=60, max_entries=2)
+
+    cache.put("a", 10, ["Alpha"])
+    cache.put("b", 10, ["Beta"])
+    assert cache.get("a", 10) == ["Alpha"]
+    cache.put("c", 10, ["Gamma"])
+    assert len(cache) == 2
+    assert cache.get("b", 10) is None
+    assert cache.get("a", 10) == ["Alpha"]
+
+    now[0] += 61
+    assert cache.get("ab", 10) is None
+    assert cache.get("c", 10) is None
+    assert len(cache) == 0
+    assert cache._roots == {}
+
+
+def test_infix_requests_narrow_by_substring():
+    cache = CompletionCache()
+    infix = {"infix": ""}
+    cache.put("hn", 10, ["John Smith", "Hnatiuk Farms"], params=infix)
+
+    assert cache.get("hn S", 10, params=infix) == ["John Smith"]
+    assert cache.get("hn S", 10) is None
+
+
+def test_numbers_ending_in_a_numeral_are_not_narrowed():
+    cache = CompletionCache()
+    cache.put("BC1", 10, ["BC1"])
+    cache.put("CBDL", 10, ["CBDL1", "CBDL100", "CBDLX2"])
+
+    assert cache.get("BC12", 10) is None
+    assert cache.get("BC1", 10) == ["BC1"]
+    assert cache.get("CBDL1", 10) is None
+    assert cache.get("CBDLX", 10) == ["CBDLX2"]
+
+
+def test_word_prefix_match():
+    assert completion.word_prefix_match("wat", "Thames Water")
+    assert completion.word_prefix_match("thames w", "North Thames Waste")
+    assert not completion.word_prefix_match("ames", "Thames Water")
+
+
+@pytest.mark.asyncio
+async def test_client_answers_keystrokes_from_the_cache():
+    queries = []
+
+    def handler(request):
+        query = request.url.params["q"]
+        queries.append(query)
+        return httpx.Response(
+            200, json=[name for name in NAMES if completion.word_prefix_match(query, name)]
+        )
+
+    async with PublicRegisterClient(
+        completion_cache=True, transport=httpx.MockTransport(handler)
+    ) as client:
+        results = [
+            await client.get_completion(query, limit=10)
+            for query in ["Th", "Tha", "Thames", "Thames W", "Thames Wa"]
+        ]
+
+    assert queries == ["Th"]
+    assert results[-1] == ["Thames Water Utilities", "North Thames Waste"]
+
+
+@pytest.mark.asyncio
+async def test_client_without_cache_always_requests():
+    queries = []
+
+    def handler(request):
+        queries.append(request.url.params["q"])
+        return httpx.Response(200, json=[])
+
+    async with PublicRegisterClient(transport=httpx.MockTransport(handler)) as client:
+        assert client.completion_cache is None
+        await client.get_completion("Th", limit=10)
+        await client.get_completion("Tha", limit=10)
+
+    assert queries == ["Th", "Tha"]
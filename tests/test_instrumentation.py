@@ -0,0 +1,123 @@
+import logging
+
+import httpx
+import pytest
+from environment.flood_monitoring import FloodClient
+from environment.hydrology import HydrologyClient
+from environment.instrumentation import Instrument, endpoint_template
+
+
+class Recorder(Instrument):
+    def __init__(self):
+        self.events = []
+
+    def on_request(self, metrics):
+        self.events.append(("request", metrics))
+
+    def on_response(self, metrics):
+        self.events.append(("response", metrics))
+
+    def on_parsed(self, metrics):
+        self.events.append(("parsed", metrics))
+
+
+def _stations_handler(request):
+    return httpx.Response(
+        200, json={"items": [{"@id": "s1", "label": "One"}, {"@id": "s2", "label": "Two"}]}
+    )
+
+
+def test_endpoint_template():
+    assert endpoint_template("/id/stations/1491TH/readings") == "/id/stations/{id}/readings"
+    assert endpoint_template("/id/stations/E72639.json") == "/id/stations/{id}.json"
+    assert endpoint_template("/id/floods") == "/id/floods"
+
+
+@pytest.mark.asyncio
+async def test_records_phases_bytes_and_items():
+    recorder = Recorder()
+    async with FloodClient(
+        transport=httpx.MockTransport(_stations_handler), instrument=recorder
+    ) as client:
+        stations = await client.get_stations(validate=False)
+
+    assert len(stations) == 2
+    assert [kind for kind, _ in recorder.events] == ["request", "response", "parsed"]
+    metrics = recorder.events[-1][1]
+    assert metrics.method == "GET"
+    assert metrics.endpoint == "/flood-monitoring/id/stations"
+    assert metrics.status_code == 200
+    assert metrics.bytes_received > 0
+    assert metrics.items == 2
+    assert metrics.decode > 0
+    assert metrics.total >= metrics.ttfb
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_is_metered_when_read():
+    recorder = Recorder()
+    body = b'{"items": []}'
+
+    def handler(request):
+        return httpx.Response(200, stream=httpx.ByteStream(body))
+
+    async with FloodClient(transport=httpx.MockTransport(handler), instrument=recorder) as client:
+        assert await client.get_stations() == []
+
+    responses = [metrics for kind, metrics in recorder.events if kind == "response"]
+    assert len(responses) == 1
+    assert responses[0].bytes_received == len(body)
+    assert recorder.events[-1][1].validate > 0
+
+
+@pytest.mark.asyncio
+async def test_normalised_list_records_decode_and_validate():
+    recorder = Recorder()
+    async with HydrologyClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"items": []})),
+        instrument=[recorder],
+    ) as client:
+        assert await client.get_measures() == []
+
+    kind, metrics = recorder.events[-1]
+    assert kind == "parsed"
+    assert metrics.items == 0
+    assert metrics.decode > 0
+
+
+@pytest.mark.asyncio
+async def test_verbose_logs_to_environment_logger(caplog):
+    with caplog.at_level(logging.INFO, logger="environment"):
+        async with FloodClient(
+            transport=httpx.MockTransport(_stations_handler), verbose=True
+        ) as client:
+            await client.get_stations(validate=False)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith(">>> Request: GET") for message in messages)
+    assert any(message.startswith("<<< Response: 200") for message in messages)
+    assert any("items=2" in message for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_plain_callable_receives_completed_responses():
+    seen = []
+    async with FloodClient(
+        transport=httpx.MockTransport(_stations_handler), instrument=seen.append
+    ) as client:
+        await client.get_stations(validate=False)
+
+    assert [metrics.status_code for metrics in seen] == [200]
+    assert seen[0].bytes_received > 0
+
+
+@pytest.mark.asyncio
+async def test_verbose_leaves_logging_configuration_alone():
+    logger = logging.getLogger("environment")
+    handlers, level = list(logger.handlers), logger.level
+    for _ in range(3):
+        async with FloodClient(verbose=True):
+            pass
+
+    assert logger.handlers == handlers
+    assert logger.level == level
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import environment
+
+
+def test_import_does_not_load_clients():
+    code = (
+        "import sys, environment; "
+        "print(any(name.startswith('environment.') and name != 'environment._lazy' "
+        "for name in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "False"
+
+
+def test_lazy_exports_resolve_and_cache():
+    from environment.flood_monitoring.client import FloodClient
+
+    assert environment.FloodClient is FloodClient
+    assert "FloodClient" in vars(environment)
+    assert set(environment.__all__) <= set(dir(environment))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        environment.NotAClient
+
+
+def test_models_defer_schema_build():
+    from environment.hydrology.models import Reading
+
+    assert Reading.model_config["defer_build"] is True
+    assert Reading.model_validate({"value": 1.0}).value == 1.0
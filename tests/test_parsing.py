@@ -0,0 +1,40 @@
+import httpx
+from environment._parsing import parse_items, to_records, validate_items
+from environment.flood_monitoring.models import Reading
+
+
+READING = {
+    "@id": "http://environment.data.gov.uk/flood-monitoring/data/readings/M1/2024-01-01T00-00-00Z",
+    "dateTime": "2024-01-01T00:00:00Z",
+    "measure": "http://environment.data.gov.uk/flood-monitoring/id/measures/M1",
+    "value": 0.25,
+}
+
+
+def test_parse_items_matches_per_item_validation():
+    response = httpx.Response(200, json={"meta": {"limit": 1}, "items": [READING, READING]})
+    readings = parse_items(response, Reading)
+    assert readings == [Reading(**READING), Reading(**READING)]
+
+
+def test_parse_items_follows_nested_path():
+    response = httpx.Response(200, json={"format": "linked-data-api", "result": {"items": [READING]}})
+    assert parse_items(response, Reading, path=("result", "items")) == [Reading(**READING)]
+
+
+def test_validate_items():
+    assert validate_items([READING], Reading) == [Reading(**READING)]
+
+
+def test_unvalidated_records_use_field_names_and_defaults():
+    response = httpx.Response(200, json={"items": [{"dateTime": "2024-01-01T00:00:00Z"}]})
+    (record,) = parse_items(response, Reading, validate=False)
+    assert record == {
+        "id": None,
+        "date": None,
+        "date_time": "2024-01-01T00:00:00Z",
+        "measure": None,
+        "value": None,
+        "unit": None,
+    }
+    assert to_records([READING], Reading)[0] == Reading(**READING).model_dump()
@@ -706,6 +706,239 @@ class TestPublicRegisterClient:
                 params={},
             )
 
+    @staticmethod
+    def _csv_transport(rows):
+        body = "Registration Number,Holder Name,Address\n" + "".join(
+            f'CB/{index:06d},Company {index},"{index} Test Street\nTestville"\n'
+            for index in range(rows)
+        )
+        encoded = body.encode()
+
+        async def chunks():
+            for start in range(0, len(encoded), 1000):
+                yield encoded[start : start + 1000]
+
+        class ChunkedStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                async for chunk in chunks():
+                    yield chunk
+
+        def handler(request):
+            assert request.url.path == "/public-register/downloads/waste-carriers-brokers"
+            return httpx.Response(200, stream=ChunkedStream())
+
+        return httpx.MockTransport(handler), encoded
+
+    @pytest.mark.asyncio
+    async def test_stream_download_to_path_and_file_object(self, tmp_path):
+        """Test streaming a register export to a path and to a file object."""
+        import io
+
+        transport, body = self._csv_transport(500)
+        async with PublicRegisterClient(transport=transport) as client:
+            written = await client.stream_download(
+                "waste-carriers-brokers", tmp_path / "export.csv", chunk_size=4096
+            )
+            buffer = io.BytesIO()
+            assert await client.stream_download("waste-carriers-brokers", buffer) == len(body)
+
+        assert written == len(body)
+        assert (tmp_path / "export.csv").read_bytes() == body
+        assert buffer.getvalue() == body
+
+    @pytest.mark.asyncio
+    async def test_iter_download_rows(self):
+        """Test parsing a register export row by row."""
+        transport, _ = self._csv_transport(250)
+        async with PublicRegisterClient(transport=transport) as client:
+            rows = [row async for row in client.iter_download_rows("waste-carriers-brokers")]
+
+        assert len(rows) == 250
+        assert rows[3] == {
+            "Registration Number": "CB/000003",
+            "Holder Name": "Company 3",
+            "Address": "3 Test Street\nTestville",
+        }
+
+    @pytest.mark.asyncio
+    async def test_stream_download_rejects_unknown_register(self, client):
+        """Test that an unknown register slug is rejected before any request."""
+        with pytest.raises(ValueError, match="Unknown register"):
+            await client.stream_download("not-a-register", "/dev/null")
+
+    @staticmethod
+    def _register_transport(sizes, requests):
+        """Serves `sizes[register]` registrations per register, with increasing distances."""
+        import asyncio
+
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            register = request.url.path.split("/")[2]
+            limit = int(request.url.params["_limit"])
+            offset = int(request.url.params["_offset"])
+            requests.append((register, limit, offset))
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            step = list(sizes).index(register) + 1
+            items = [
+                {
+                    "@id": f"http://environment.data.gov.uk/public-register/{register}/registration/{index}",
+                    "register": {"@id": f"http://environment.data.gov.uk/public-register/{register}/register"},
+                    "registrationNumber": f"{register}/{index}",
+                    "holder": {"@id": f"http://example.com/holder/{index}", "name": f"{register} {index:03d}"},
+                    "distance": index * step,
+                }
+                for index in range(offset, min(offset + limit, sizes[register]))
+            ]
+            meta = {
+                "publisher": "Environment Agency",
+                "licence": "http://www.nationalarchives.gov.uk/doc/open-government-licence/version/3/",
+                "documentation": "http://environment.data.gov.uk/public-register/api-docs",
+                "limit": limit,
+                "offset": offset,
+            }
+            return httpx.Response(200, json={"meta": meta, "items": items})
+
+        return httpx.MockTransport(handler), in_flight
+
+    @pytest.mark.asyncio
+    async def test_search_registers_merges_by_distance(self):
+        """Test that per-register searches run concurrently and merge by distance."""
+        requests = []
+        sizes = {"waste-operations": 25, "waste-exemptions": 7, "scrap-metal-dealers": 0}
+        transport, in_flight = self._register_transport(sizes, requests)
+        async with PublicRegisterClient(transport=transport) as client:
+            results = await client.search_registers(
+                list(sizes), easting=430000, northing=433000, order_by="distance", page_size=10
+            )
+
+        assert in_flight["max"] >= 3
+        assert len(results) == 32
+        distances = [item.distance for item in results]
+        assert distances == sorted(distances)
+        assert results[:3] == sorted(results[:3], key=lambda item: item.distance)
+        assert {register for register, _, _ in requests} == set(sizes)
+        assert all(("waste-operations", 10, offset) in requests for offset in (0, 10, 20))
+
+    @pytest.mark.asyncio
+    async def test_iter_search_registers_pages_lazily_with_global_limit(self):
+        """Test that a global limit and offset only fetch the pages they need."""
+        requests = []
+        sizes = {"waste-operations": 500, "waste-exemptions": 500}
+        transport, _ = self._register_transport(sizes, requests)
+        async with PublicRegisterClient(transport=transport) as client:
+            results = [
+                item.registration_number
+                async for item in client.iter_search_registers(
+                    list(sizes), name_search="x", order_by="name", limit=5, offset=2
+                )
+            ]
+
+        assert results == [
+            "waste-exemptions/2",
+            "waste-exemptions/3",
+            "waste-exemptions/4",
+            "waste-exemptions/5",
+            "waste-exemptions/6",
+        ]
+        # Pages are capped at offset + limit and later pages are not prefetched, so each
+        # register answers exactly one small page.
+        assert sorted(requests) == [("waste-exemptions", 7, 0), ("waste-operations", 7, 0)]
+
+    @pytest.mark.asyncio
+    async def test_search_registers_keeps_register_order_and_rejects_unknown(self, client):
+        """Test the default ordering and validation of register slugs and ordering."""
+        requests = []
+        sizes = {"waste-operations": 3, "waste-exemptions": 2}
+        transport, _ = self._register_transport(sizes, requests)
+        async with PublicRegisterClient(transport=transport) as local:
+            results = await local.search_registers(list(sizes))
+        assert [item.registration_number for item in results] == [
+            "waste-operations/0",
+            "waste-operations/1",
+            "waste-operations/2",
+            "waste-exemptions/0",
+            "waste-exemptions/1",
+        ]
+
+        with pytest.raises(ValueError, match="Unknown register"):
+            await client.search_registers(["not-a-register"])
+        with pytest.raises(ValueError, match="order_by"):
+            await client.search_registers(order_by="date")
+
+    @pytest.mark.asyncio
+    async def test_iter_search_pages_until_short_page(self):
+        """Test auto-pagination over one register's search endpoint."""
+        requests = []
+        transport, _ = self._register_transport({"waste-exemptions": 250}, requests)
+        async with PublicRegisterClient(transport=transport) as client:
+            numbers = [
+                item.registration_number
+                async for item in client.iter_search(
+                    "waste-exemptions", local_authority="Leeds", page_size=100, _limit=5
+                )
+            ]
+
+        assert numbers == [f"waste-exemptions/{index}" for index in range(250)]
+        assert [(limit, offset) for _, limit, offset in requests] == [(100, 0), (100, 100), (100, 200)]
+
+    @pytest.mark.asyncio
+    async def test_iter_search_all_registers_from_offset(self):
+        """Test auto-pagination over search_all_registers, starting at an offset."""
+        requests = []
+        transport, _ = self._register_transport({"api": 30}, requests)
+        async with PublicRegisterClient(transport=transport) as client:
+            numbers = [
+                item.registration_number
+                async for item in client.iter_search(name_search="x", offset=10, page_size=10, prefetch=False)
+            ]
+
+        assert numbers == [f"api/{index}" for index in range(10, 30)]
+        assert [offset for _, _, offset in requests] == [10, 20, 30]
+
+    @pytest.mark.asyncio
+    async def test_get_registrations_by_ids(self):
+        """Test concurrent, deduplicated detail lookups with per-id errors and a cache."""
+        requested = []
+
+        def handler(request):
+            registration_id = request.url.path.rsplit("/", 1)[-1].removesuffix(".json")
+            requested.append(registration_id)
+            if registration_id == "missing":
+                return httpx.Response(404)
+            return httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {
+                            "@id": f"http://environment.data.gov.uk/public-register/water-discharges/registration/{registration_id}",
+                            "register": {"@id": "http://environment.data.gov.uk/public-register/water-discharges/register"},
+                            "registrationNumber": registration_id,
+                        }
+                    ]
+                },
+            )
+
+        cache = {}
+        async with PublicRegisterClient(transport=httpx.MockTransport(handler)) as client:
+            results = await client.get_registrations_by_ids(
+                "water-discharges", ["B2", "A1", "missing", "B2"], max_concurrency=2, cache=cache
+            )
+            again = await client.get_registrations_by_ids("water-discharges", ["A1", "C3"], cache=cache)
+
+            with pytest.raises(ValueError, match="Unknown register"):
+                await client.get_registrations_by_ids("not-a-register", ["A1"])
+
+        assert list(results) == ["B2", "A1", "missing"]
+        assert results["A1"].registration_number == "A1"
+        assert isinstance(results["missing"], httpx.HTTPStatusError)
+        assert sorted(requested) == ["A1", "B2", "C3", "missing"]
+        assert again["A1"] is results["A1"]
+        assert set(cache) == {("water-discharges", "A1"), ("water-discharges", "B2"), ("water-discharges", "C3")}
+
     @pytest.mark.asyncio
     async def test_search_with_location_parameters(self, client):
         """Test searching with location-based parameters."""
@@ -0,0 +1,106 @@
+import asyncio
+
+import httpx
+import pytest
+from environment import EnvironmentSession
+from environment.flood_monitoring import FloodClient
+from environment.ratelimit import RateLimiter, RateLimitTransport, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470.0) == 10.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_aimd_adjusts_limits():
+    limiter = RateLimiter(rate=10, concurrency=4, max_concurrency=8, max_rate=11)
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.rate == 11
+    assert 6 < limiter.concurrency <= 8
+    limiter.on_throttle(retry_after=5)
+    metrics = limiter.metrics()
+    assert metrics.rate == 5.5
+    assert metrics.throttled == 1
+    assert metrics.successes == 20
+    assert 4.0 < metrics.paused_for <= 5.0
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrency():
+    limiter = RateLimiter(rate=1000, concurrency=2, max_concurrency=2)
+    peak = 0
+
+    async def task():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(task() for _ in range(6)))
+    assert peak == 2
+    assert limiter.in_flight == 0
+    assert limiter.metrics().requests == 6
+
+
+@pytest.mark.asyncio
+async def test_transport_retries_throttled_requests():
+    responses = [
+        httpx.Response(429, headers={"retry-after": "0.01"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"items": []}),
+    ]
+    seen = []
+
+    def handler(request):
+        seen.append(request.method)
+        return responses.pop(0)
+
+    limiter = RateLimiter(rate=1000)
+    async with EnvironmentSession(
+        transport=httpx.MockTransport(handler), limiter=limiter
+    ) as session:
+        async with FloodClient(session=session) as client:
+            assert await client.get_stations() == []
+
+    metrics = limiter.metrics()
+    assert len(seen) == 3
+    assert (metrics.throttled, metrics.retries, metrics.successes) == (2, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_transport_gives_up_after_max_retries():
+    transport = RateLimitTransport(
+        httpx.MockTransport(lambda request: httpx.Response(429)),
+        RateLimiter(rate=1000),
+        max_retries=1,
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://example/id/stations")
+        posted = await client.post("https://example/id/stations")
+    assert response.status_code == posted.status_code == 429
+    assert transport.limiter.metrics().retries == 1
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_holds_slot_until_closed():
+    class Body(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            for _ in range(100):
+                yield b"a,b\n"
+
+    limiter = RateLimiter(rate=1000, concurrency=1, max_concurrency=1)
+    transport = RateLimitTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200, stream=Body())), limiter
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "https://example/downloads/x") as response:
+            assert limiter.in_flight == 1
+            second = asyncio.ensure_future(client.get("https://example/other"))
+            await asyncio.sleep(0.01)
+            assert not second.done()
+            assert len(await response.aread()) == 400
+        assert (await second).status_code == 200
+    assert limiter.in_flight == 0
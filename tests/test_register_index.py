@@ -0,0 +1,149 @@
+import csv
+import random
+
+import pytest
+from environment.public_register import LocalRegisterIndex, PublicRegisterClient
+from environment.public_register.models import RegistrationSummary
+from environment.standin import StandInApp
+
+
+def _row(number, name, address="1 High Street, Leeds", postcode="LS1 1AA", authority="Leeds", easting="430000", northing="433000"):
+    return {
+        "Registration Number": number,
+        "Holder Name": name,
+        "Site Address": address,
+        "Postcode": postcode,
+        "Local Authority": authority,
+        "Registration Date": "2020-01-01",
+        "Expiry Date": "",
+        "Easting": easting,
+        "Northing": northing,
+    }
+
+
+@pytest.fixture
+def rows():
+    return [
+        _row("EPR/AB1234CD", "Greenway Recycling Ltd"),
+        _row("EPR/EF5678GH", "Northern Metals plc", "Unit 4, Dock Road, Hull", "HU1 2BB", "Hull", "510000", "428000"),
+        _row("CBDU1001", "A. Smith Skip Hire", "9 Mill Lane, York", "YO1 3CC", "York", "460000", "451000"),
+        _row("CBDU1002", "Recycle Right", "2 Station Road, Leeds", "LS2 4DD", "Leeds", "", ""),
+    ]
+
+
+def test_text_filters_match_substrings(rows):
+    index = LocalRegisterIndex()
+    index.update("waste-operations", rows)
+
+    def numbers(**filters):
+        return [item.registration_number for item in index.search(**filters)]
+
+    assert numbers(name_search="RECYCL") == ["EPR/AB1234CD", "CBDU1002"]
+    assert numbers(name_search="way recyc") == ["EPR/AB1234CD"]
+    assert numbers(name_search="ab") == []
+    assert numbers(number_search="cbdu") == ["CBDU1001", "CBDU1002"]
+    assert numbers(name_number_search="metals") == ["EPR/EF5678GH"]
+    assert numbers(name_number_search="1234") == ["EPR/AB1234CD"]
+    assert numbers(address_search="dock road") == ["EPR/EF5678GH"]
+    assert numbers(address_search="ls2") == ["CBDU1002"]
+    assert numbers(local_authority="leeds", name_search="recycl") == ["EPR/AB1234CD", "CBDU1002"]
+    assert numbers(exact_name="recycle right") == ["CBDU1002"]
+    assert numbers(registration_number="CBDU1001") == ["CBDU1001"]
+    assert numbers(register="waste-carriers-brokers") == []
+    assert numbers(limit=2, offset=1) == ["EPR/EF5678GH", "CBDU1001"]
+
+
+def test_results_are_registration_summaries(rows):
+    index = LocalRegisterIndex()
+    index.update("waste-operations", rows)
+
+    [item] = index.search(registration_number="EPR/AB1234CD")
+    assert isinstance(item, RegistrationSummary)
+    assert item.holder.name == "Greenway Recycling Ltd"
+    assert item.site.site_address.postcode == "LS1 1AA"
+    assert item.local_authority.label == "Leeds"
+    assert item.registration_date == "2020-01-01"
+    assert item.id.endswith("/waste-operations/registration/EPR-AB1234CD")
+
+
+def test_location_search_orders_by_distance(rows):
+    index = LocalRegisterIndex()
+    index.update("waste-operations", rows)
+
+    results = index.search(easting=430000, northing=433000, dist=50)
+    assert [item.registration_number for item in results] == ["EPR/AB1234CD", "CBDU1001"]
+    assert results[0].distance == 0
+    assert results[1].distance == pytest.approx(((30_000**2 + 18_000**2) ** 0.5) / 1000)
+
+    filtered = index.search(easting=430000, northing=433000, name_search="metals")
+    assert [item.registration_number for item in filtered] == ["EPR/EF5678GH"]
+
+
+def test_matches_brute_force_on_random_rows():
+    rng = random.Random(3)
+    words = ["green", "waste", "metal", "recycling", "skip", "hire", "north", "park", "ltd", "plc"]
+    rows = [
+        _row(f"REG{i:05d}", " ".join(rng.sample(words, 3)), f"{i} {rng.choice(words)} road")
+        for i in range(500)
+    ]
+    index = LocalRegisterIndex()
+    index.update("waste-exemptions", rows)
+
+    for query in ["re", "cycl", "skip hire", "al w", "n ltd", "zzz"]:
+        expected = [row["Registration Number"] for row in rows if query in row["Holder Name"].lower()]
+        assert [item.registration_number for item in index.search(name_search=query)] == expected
+
+
+def test_refresh_is_incremental(rows):
+    index = LocalRegisterIndex()
+    changed, removed = index.refresh("waste-operations", rows)
+    assert len(changed) == 4 and not removed
+
+    renamed = dict(rows[0], **{"Holder Name": "Greenway Waste Ltd"})
+    changed, removed = index.refresh("waste-operations", [renamed, rows[1], rows[2]])
+    assert changed == {("waste-operations", "EPR/AB1234CD")}
+    assert removed == {("waste-operations", "CBDU1002")}
+    assert len(index) == 3
+    assert index.search(name_search="recycl") == []
+    assert index.get("waste-operations", "EPR/AB1234CD").holder.name == "Greenway Waste Ltd"
+
+
+def test_register_column_is_only_a_label(rows):
+    labelled = [dict(row, Register="Waste Operations") for row in rows]
+    index = LocalRegisterIndex()
+    index.refresh("waste-operations", labelled)
+
+    assert index.registers == {"waste-operations"}
+    assert len(index.search(register="waste-operations")) == 4
+    assert index.get("waste-operations", "CBDU1001").register.label == "Waste Operations"
+
+    changed, removed = index.refresh("waste-operations", labelled[:3])
+    assert not changed
+    assert removed == {("waste-operations", "CBDU1002")}
+
+
+def test_load_csv(tmp_path, rows):
+    path = tmp_path / "waste-operations.csv"
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    index = LocalRegisterIndex()
+    changed, _ = index.load_csv("waste-operations", path)
+    assert len(changed) == len(index) == 4
+
+
+@pytest.mark.asyncio
+async def test_refresh_from_client_streams_downloads():
+    app = StandInApp(download_rows=300)
+    async with PublicRegisterClient(
+        transport=app.transport(), base_url="http://standin/public-register"
+    ) as client:
+        index = LocalRegisterIndex()
+        changed, removed = await index.refresh_from_client(client, ["waste-operations", "scrap-metal-dealers"])
+        assert len(changed) == len(index) == 600 and not removed
+        assert index.registers == {"waste-operations", "scrap-metal-dealers"}
+
+        changed, removed = await index.refresh_from_client(client, ["waste-operations"])
+        assert not changed and not removed
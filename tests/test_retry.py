@@ -0,0 +1,159 @@
+import asyncio
+
+import httpx
+import pytest
+from environment import EnvironmentSession, RateLimiter
+from environment.flood_monitoring import FloodClient
+from environment.retry import HedgePolicy, RetryBudget, RetryPolicy, RetryTransport
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(backoff=1.0, max_backoff=3.0)
+    delays = [policy.delay(5) for _ in range(50)]
+    assert all(0 <= delay <= 3.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert policy.delay(1, retry_after=7.0) == 7.0
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_hedge_delay_tracks_quantile():
+    hedge = HedgePolicy(quantile=0.9, initial_delay=2.0, min_samples=10, min_delay=0.0)
+    assert hedge.delay() == 2.0
+    for latency in range(1, 11):
+        hedge.observe(latency / 10)
+    assert hedge.delay() == 1.0
+
+
+@pytest.mark.asyncio
+async def test_retries_idempotent_requests_and_reports_events():
+    responses = [httpx.ConnectError("reset"), httpx.Response(502), httpx.Response(200, json={"items": []})]
+    events = []
+
+    def handler(request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async with EnvironmentSession(
+        transport=httpx.MockTransport(handler), retry=RetryPolicy(backoff=0.001)
+    ) as session:
+        session.pool.hooks.append(events.append)
+        async with FloodClient(session=session) as client:
+            assert await client.get_stations() == []
+
+    assert [(event.kind, event.attempt) for event in events] == [("retry", 1), ("retry", 2)]
+    assert isinstance(events[0].reason, httpx.ConnectError)
+    assert events[1].reason == 502
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_owns_retries_over_limiter():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    budget = RetryBudget(ratio=1.0)
+    async with EnvironmentSession(
+        transport=httpx.MockTransport(handler),
+        limiter=RateLimiter(rate=1000, max_rate=1000),
+        retry=RetryPolicy(max_attempts=3, backoff=0.001, budget=budget),
+    ) as session:
+        async with httpx.AsyncClient(transport=session.transport) as client:
+            assert (await client.get("https://example/")).status_code == 503
+
+    # One layer of retries: three attempts in total, not three per limiter retry.
+    assert calls == ["GET", "GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_posts():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    transport = RetryTransport(httpx.MockTransport(handler), RetryPolicy(backoff=0.001))
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert (await client.post("https://example/")).status_code == 503
+        assert (await client.get("https://example/")).status_code == 503
+    assert calls == ["POST", "GET", "GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_primary():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"slow": True})
+        return httpx.Response(200, json={"slow": False})
+
+    events = []
+    transport = RetryTransport(
+        httpx.MockTransport(handler),
+        hedge=HedgePolicy(initial_delay=0.01),
+        hooks=[events.append],
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://example/id/measures/M1")
+
+    assert response.json() == {"slow": False}
+    assert len(calls) == 2
+    assert [event.kind for event in events] == ["hedge", "hedge_won"]
+
+
+@pytest.mark.asyncio
+async def test_hedge_only_session_does_not_retry():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    async with EnvironmentSession(
+        transport=httpx.MockTransport(handler),
+        limiter=RateLimiter(rate=1000, max_rate=1000),
+        hedge=HedgePolicy(initial_delay=1.0),
+    ) as session:
+        async with httpx.AsyncClient(transport=session.transport) as client:
+            assert (await client.get("https://example/")).status_code == 503
+
+    assert calls == ["GET"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_cancels_hedge_attempts():
+    cancelled = []
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(request.url.path)
+            raise
+        return httpx.Response(200)
+
+    transport = RetryTransport(httpx.MockTransport(handler), hedge=HedgePolicy(initial_delay=0.5))
+    async with httpx.AsyncClient(transport=transport) as client:
+        task = asyncio.ensure_future(client.get("https://example/slow"))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    assert cancelled == ["/slow"]
@@ -0,0 +1,44 @@
+import httpx
+import pytest
+from environment import EnvironmentSession
+from environment.flood_monitoring import FloodClient
+from environment.hydrology.client import HydrologyClient
+from environment.public_register import PublicRegisterClient
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.hosts = []
+        self.closed = False
+
+    async def handle_async_request(self, request):
+        self.hosts.append(request.url.path)
+        return httpx.Response(200, json={"items": []})
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_clients_share_session_pool():
+    pool = RecordingTransport()
+    async with EnvironmentSession(transport=pool) as session:
+        async with FloodClient(session=session) as flood:
+            await flood.get_stations()
+        # Closing one client leaves the shared pool open for the others
+        assert not pool.closed
+        async with HydrologyClient(session=session) as hydrology:
+            await hydrology.get_measures()
+        assert pool.hosts == ["/flood-monitoring/id/stations", "/hydrology/id/measures"]
+    assert pool.closed
+    assert session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_session_builds_pool_with_limits():
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+    async with EnvironmentSession(limits=limits) as session:
+        client = PublicRegisterClient(session=session)
+        assert client._transport is session.transport
+        assert isinstance(session.pool, httpx.AsyncHTTPTransport)
+        await client.aclose()
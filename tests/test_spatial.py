@@ -0,0 +1,103 @@
+import math
+import random
+
+import pytest
+from environment.flood_monitoring.models import Station as FloodStation
+from environment.hydrology.models import Station as HydrologyStation
+from environment.spatial import StationIndex, haversine_km
+
+
+def _flood_station(notation, lat, long, easting=None, northing=None):
+    return FloodStation(
+        **{
+            "@id": f"http://environment.data.gov.uk/flood-monitoring/id/stations/{notation}",
+            "notation": notation,
+            "stationReference": notation,
+            "lat": lat,
+            "long": long,
+            "easting": easting,
+            "northing": northing,
+        }
+    )
+
+
+@pytest.fixture
+def random_stations():
+    rng = random.Random(7)
+    return [
+        _flood_station(
+            f"S{i}",
+            rng.uniform(50.0, 55.5),
+            rng.uniform(-5.5, 1.5),
+            rng.uniform(100_000, 650_000),
+            rng.uniform(50_000, 650_000),
+        )
+        for i in range(1500)
+    ]
+
+
+def test_nearest_and_within_match_brute_force(random_stations):
+    index = StationIndex(random_stations)
+    rng = random.Random(11)
+    for _ in range(50):
+        lat, long = rng.uniform(49.5, 56.0), rng.uniform(-6.0, 2.0)
+        by_distance = sorted(
+            random_stations, key=lambda s: haversine_km(lat, long, s.lat, s.long)
+        )
+        nearest = index.nearest(lat=lat, long=long, k=5)
+        assert [station.id for station, _ in nearest] == [s.id for s in by_distance[:5]]
+
+        radius = rng.uniform(5, 40)
+        within = {station.id for station, _ in index.within(radius, lat=lat, long=long)}
+        assert within == {
+            s.id for s in random_stations if haversine_km(lat, long, s.lat, s.long) <= radius
+        }
+
+        easting, northing = rng.uniform(100_000, 650_000), rng.uniform(50_000, 650_000)
+        nearest = index.nearest(easting=easting, northing=northing, k=3)
+        expected = sorted(
+            random_stations,
+            key=lambda s: math.hypot(s.easting - easting, s.northing - northing),
+        )[:3]
+        assert [station.id for station, _ in nearest] == [s.id for s in expected]
+
+
+def test_refresh_is_incremental():
+    a = _flood_station("A", 51.5, -0.1)
+    b = _flood_station("B", 52.0, -1.0)
+    index = StationIndex([a, b])
+
+    moved_b = _flood_station("B", 51.51, -0.11)
+    c = HydrologyStation(**{"@id": "http://example/hydrology/id/stations/C", "lat": 53.0, "long": -2.0})
+    changed, removed = index.refresh([a, moved_b, c])
+
+    assert changed == {moved_b.id, c.id}
+    assert removed == set()
+    nearest = index.nearest(lat=51.5, long=-0.1, k=2)
+    assert [station.id for station, _ in nearest] == [a.id, moved_b.id]
+
+    changed, removed = index.refresh([c])
+    assert changed == set()
+    assert removed == {a.id, moved_b.id}
+    assert len(index) == 1
+    assert index.nearest(lat=51.5, long=-0.1)[0][0] is c
+
+
+def test_query_requires_coordinates():
+    with pytest.raises(ValueError):
+        StationIndex().nearest(k=1)
+
+
+def test_indexes_raw_station_dicts():
+    stations = [
+        {"@id": "http://example/id/stations/A", "lat": 51.5, "long": -0.1, "easting": 530000, "northing": 180000},
+        {"@id": "http://example/id/stations/B", "lat": [52.0, 52.1], "long": [-1.0, -1.1]},
+    ]
+    index = StationIndex(stations)
+
+    assert [station["@id"] for station, _ in index.nearest(lat=51.9, long=-0.9, k=2)] == [
+        "http://example/id/stations/B",
+        "http://example/id/stations/A",
+    ]
+    assert index.nearest(easting=530100, northing=180000)[0][0] is stations[0]
+    assert index.refresh(stations[:1]) == (set(), {"http://example/id/stations/B"})
@@ -0,0 +1,95 @@
+import csv
+import io
+
+import httpx
+import pytest
+from environment import EnvironmentSession
+from environment.flood_monitoring import FloodClient
+from environment.hydrology import HydrologyClient
+from environment.public_register import PublicRegisterClient, RegistrationSearchResponse
+from environment.ratelimit import RateLimiter
+from environment.retry import RetryPolicy
+from environment.standin import StandInApp
+from environment.standin.data import DOWNLOAD_COLUMNS
+
+
+@pytest.mark.asyncio
+async def test_flood_client_reads_stations_and_pages_readings():
+    app = StandInApp(size=25)
+    async with FloodClient(
+        transport=app.transport(), base_url="http://standin/flood-monitoring"
+    ) as client:
+        stations = await client.get_stations()
+        readings = await client.get_readings(_limit=10, _offset=20)
+
+    assert len(stations) == 25
+    assert stations[0].station_reference == "S000000"
+    assert len(readings) == 5
+
+
+@pytest.mark.asyncio
+async def test_hydrology_readings_for_a_measure():
+    app = StandInApp(size=3)
+    async with HydrologyClient(
+        transport=app.transport(), base_url="http://standin/hydrology"
+    ) as client:
+        readings = await client.get_readings("abc-flow")
+
+    assert len(readings) == 3
+    assert readings[0].measure.endswith("/hydrology/id/measures/abc-flow")
+
+
+@pytest.mark.asyncio
+async def test_public_register_search_and_download():
+    app = StandInApp(size=50, download_rows=2_500)
+    async with PublicRegisterClient(
+        transport=app.transport(), base_url="http://standin/public-register"
+    ) as client:
+        results = await client.search_all_registers(name_search="acme", limit=5)
+        body = await client.download_waste_operations()
+
+    assert isinstance(results, RegistrationSearchResponse)
+    assert len(results.items) == 5
+    assert all("Acme" in item.holder.name for item in results.items)
+    rows = list(csv.reader(io.StringIO(body.decode())))
+    assert tuple(rows[0]) == DOWNLOAD_COLUMNS
+    assert len(rows) == 2_501
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_revalidate_with_etag():
+    app = StandInApp(size=5)
+    async with FloodClient(
+        transport=app.transport(), base_url="http://standin/flood-monitoring", conditional=True
+    ) as client:
+        first = await client.get_stations()
+        second = await client.get_stations()
+
+    assert len(first) == len(second) == 5
+    assert app.counts["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_throttling_and_errors_are_absorbed_by_session():
+    app = StandInApp(size=2, rate_limit=5, retry_after=0, error_rate=0.3, seed=1)
+    async with EnvironmentSession(
+        transport=app.transport(),
+        limiter=RateLimiter(rate=50, max_rate=50),
+        retry=RetryPolicy(max_attempts=6, backoff=0.01),
+    ) as session:
+        async with FloodClient(
+            session=session, base_url="http://standin/flood-monitoring"
+        ) as client:
+            for _ in range(10):
+                assert len(await client.get_readings()) == 2
+
+    assert app.counts["throttled"] > 0
+    assert app.counts["errors"] > 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_path_is_404():
+    app = StandInApp()
+    async with httpx.AsyncClient(transport=app.transport(), base_url="http://standin") as client:
+        response = await client.get("/flood-monitoring/id/nothing")
+    assert response.status_code == 404